@@ -0,0 +1,135 @@
+"""
+bench_codec.py
+Замер кодека MeshHeader/MeshPacket: прежняя побайтовая сборка
+(воспроизведена здесь для сравнения) против struct и правки на месте.
+
+    python3 bench_codec.py               # CPython (из каталога Proto mesh)
+    micropython bench_codec.py           # unix-порт MicroPython
+"""
+
+import sys
+import time
+
+sys.path.append('..')  # config_common.py лежит уровнем выше
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ticks_us = lambda: int(time.perf_counter() * 1000000)
+    ticks_diff = lambda a, b: a - b
+
+from lora_mesh import MeshHeader, MeshPacket
+from constants import MSG_TYPE
+
+N = 5000
+PACKET_SIZE = 58  # прежний размер: пакет дополнялся нулями до 58 байт
+
+
+# --- прежний кодек ---
+
+def legacy_header_bytes(h):
+    header = bytearray(MeshHeader.SIZE)
+    flags = h.msg_type & 0x3F
+    if h.is_mesh:
+        flags |= 0x40
+    if h.need_ack:
+        flags |= 0x80
+    header[0] = flags
+    header[1] = (h.msg_id >> 16) & 0xFF
+    header[2] = (h.msg_id >> 8) & 0xFF
+    header[3] = h.msg_id & 0xFF
+    header[4] = h.fragment_num & 0xFF
+    header[5] = h.fragment_total & 0xFF
+    header[6] = (h.origin_node >> 8) & 0xFF
+    header[7] = h.origin_node & 0xFF
+    header[8] = (h.from_node >> 8) & 0xFF
+    header[9] = h.from_node & 0xFF
+    header[10] = (h.to_node >> 8) & 0xFF
+    header[11] = h.to_node & 0xFF
+    header[12] = h.hop_count & 0xFF
+    header[13] = h.max_hops & 0xFF
+    ts = h.timestamp & 0xFFFFFFFF
+    header[14] = (ts >> 24) & 0xFF
+    header[15] = (ts >> 16) & 0xFF
+    header[16] = (ts >> 8) & 0xFF
+    header[17] = ts & 0xFF
+    return bytes(header)
+
+
+def legacy_packet_bytes(h, data):
+    packet = bytearray(PACKET_SIZE)
+    packet[:MeshHeader.SIZE] = legacy_header_bytes(h)
+    packet[MeshHeader.SIZE:MeshHeader.SIZE + len(data)] = data
+    return bytes(packet)
+
+
+def legacy_parse(raw):
+    d = raw
+    header = MeshHeader(
+        msg_type=d[0] & 0x3F, msg_id=(d[1] << 16) | (d[2] << 8) | d[3],
+        fragment_num=d[4], fragment_total=d[5],
+        origin_node=(d[6] << 8) | d[7], from_node=(d[8] << 8) | d[9],
+        to_node=(d[10] << 8) | d[11], hop_count=d[12], max_hops=d[13],
+        need_ack=bool(d[0] & 0x80), is_mesh=bool(d[0] & 0x40),
+        timestamp=(d[14] << 24) | (d[15] << 16) | (d[16] << 8) | d[17])
+    return header, bytes(raw[MeshHeader.SIZE:])
+
+
+def legacy_relay(raw, node_id):
+    h, data = legacy_parse(raw)
+    relayed = MeshHeader(
+        msg_type=h.msg_type, msg_id=h.msg_id,
+        fragment_num=h.fragment_num, fragment_total=h.fragment_total,
+        origin_node=h.origin_node, from_node=node_id, to_node=h.to_node,
+        hop_count=h.hop_count + 1, max_hops=h.max_hops,
+        need_ack=h.need_ack, is_mesh=h.is_mesh, timestamp=h.timestamp)
+    return legacy_packet_bytes(relayed, data)
+
+
+# --- текущий кодек ---
+
+def encode(header, data, buf):
+    # Как MeshNode._fragments: заголовок и данные прямо в буфер отправки
+    header.pack_into(buf)
+    buf[MeshHeader.SIZE:MeshHeader.SIZE + len(data)] = data
+
+
+def relay(raw, node_id):
+    header = MeshHeader.from_bytes(raw)
+    packet = bytearray(raw)
+    MeshHeader.patch_relay(packet, node_id)
+    return header, packet
+
+
+def measure(fn):
+    start = ticks_us()
+    for _ in range(N):
+        fn()
+    return ticks_diff(ticks_us(), start) / N
+
+
+def main():
+    header = MeshHeader(msg_type=MSG_TYPE.SET_PRICE, msg_id=0x123456, fragment_num=1,
+                        fragment_total=3, origin_node=1, from_node=1, to_node=7,
+                        max_hops=5, need_ack=True, timestamp=1700000000)
+    data = bytes(range(MeshHeader.DATA_SIZE))
+    legacy_raw = legacy_packet_bytes(header, data)
+    raw = MeshPacket(header, data).to_bytes()
+    buf = bytearray(MeshHeader.MAX_PACKET_SIZE)
+
+    assert legacy_header_bytes(header) == header.to_bytes()
+    assert relay(raw, 5)[1][:MeshHeader.SIZE] == legacy_relay(legacy_raw, 5)[:MeshHeader.SIZE]
+
+    rows = (
+        ("encode packet", lambda: legacy_packet_bytes(header, data), lambda: encode(header, data, buf)),
+        ("decode header", lambda: legacy_parse(legacy_raw), lambda: MeshHeader.from_bytes(raw)),
+        ("relay", lambda: legacy_relay(legacy_raw, 5), lambda: relay(raw, 5)),
+    )
+    print("{:<14} {:>10} {:>10}".format("us/op", "before", "after"))
+    for name, before, after in rows:
+        print("{:<14} {:>10.2f} {:>10.2f}".format(name, measure(before), measure(after)))
+
+
+if __name__ == "__main__":
+    main()
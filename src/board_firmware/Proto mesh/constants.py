@@ -6,7 +6,9 @@ class MSG_TYPE:
     BYE = 0x05
     PING = 0x06
     PONG = 0x07
-    FRAGMENT = 0x10
+    SET_PRICE_BIN = 0x08   # Цена в бинарном формате (price_codec.py)
+    NACK = 0x09            # Битовая карта недостающих фрагментов
+    FRAGMENT = 0x10        # Устарел: фрагменты несут тип исходного сообщения
 
 class MSG_TARGET:
     ALL = 0xFFFF       # Широковещательный
@@ -0,0 +1,140 @@
+# NODE_ID должен быть = 1
+"""
+hub_bridge.py
+Хаб в режиме моста для шлюза (src/board_gateway/gateway.py).
+
+По USB-serial принимает JSON-строки {"op": "send", "seq", "to", "msg_type", "data"}
+(бинарные цены SET_PRICE_BIN — в "data_b64" вместо "data"),
+отправляет их в mesh с need_ack и отвечает строками:
+    {"op": "sent", "seq", "msg_id"}   — сообщение ушло в эфир целиком
+    {"op": "ack", "seq"}              — ценник подтвердил
+    {"op": "fail", "seq", "reason"}   — очередь передачи полна или нет ACK после всех повторов
+Заодно пересылает heartbeat-ы ценников (SEND_ID) и периодически MeshNode.stats.
+Логи MicroPython идут в тот же порт — шлюз пропускает строки, не являющиеся JSON.
+"""
+
+import json
+import select
+import sys
+import time
+
+try:
+    import ubinascii as binascii
+except ImportError:
+    import binascii
+
+import config_common as config
+from lora_mesh import MeshNode, log, LOG
+from constants import MSG_TYPE
+
+STATS_EVERY_MS = 10000
+
+node = None
+poller = None
+pending = {}  # msg_id -> seq
+last_stats_ms = 0
+
+
+def reply(message):
+    sys.stdout.write(json.dumps(message))
+    sys.stdout.write("\n")
+
+
+def init():
+    global node, poller
+
+    config.NODE_ID = 1
+    node = MeshNode(config)
+
+    poller = select.poll()
+    poller.register(sys.stdin, select.POLLIN)
+    log(f"[BRIDGE] Ready. ID={config.NODE_ID}", LOG.INFO)
+
+
+def handle_command(line):
+    try:
+        command = json.loads(line)
+    except ValueError:
+        return
+    if command.get("op") != "send":
+        return
+
+    seq = command["seq"]
+    if "data_b64" in command:
+        data = binascii.a2b_base64(command["data_b64"])
+    else:
+        data = command["data"]
+    msg_id = node.send(data, to_node=command["to"],
+                       msg_type=command.get("msg_type", MSG_TYPE.SET_PRICE), need_ack=True)
+    if msg_id is None:
+        reply({"op": "fail", "seq": seq, "reason": "queue_full"})
+        return
+    # Запись без итога (вытеснена из pending_acks) шлюз сам снимет по таймауту
+    if len(pending) >= node.MAX_PENDING_ACKS * 2:
+        del pending[next(iter(pending))]
+    pending[msg_id] = seq
+
+
+def read_commands():
+    # Забираем все готовые строки, не блокируя опрос эфира
+    while poller.poll(0):
+        line = sys.stdin.readline()
+        if not line:
+            return
+        line = line.strip()
+        if line:
+            handle_command(line)
+
+
+def report_deliveries():
+    # "sent" — когда ушёл последний фрагмент, а не при постановке в очередь
+    for msg_id in node.pop_sent_events():
+        seq = pending.get(msg_id)
+        if seq is not None:
+            reply({"op": "sent", "seq": seq, "msg_id": msg_id})
+
+    for msg_id, delivered in node.pop_delivery_events():
+        seq = pending.pop(msg_id, None)
+        if seq is None:
+            continue
+        if delivered:
+            reply({"op": "ack", "seq": seq})
+        else:
+            reply({"op": "fail", "seq": seq, "reason": "timeout"})
+
+
+def loop():
+    global last_stats_ms
+
+    read_commands()
+
+    for header, data in node.poll():
+        if header.msg_type == MSG_TYPE.SEND_ID:
+            reply({"op": "heartbeat", "node": header.origin_node, "hops": header.hop_count})
+
+    report_deliveries()
+
+    now = time.ticks_ms()
+    if time.ticks_diff(now, last_stats_ms) >= STATS_EVERY_MS:
+        last_stats_ms = now
+        stats = node.get_stats()
+        reply({
+            "op": "stats", "node": node.node_id,
+            "tx": stats['tx'], "rx": stats['rx'], "relayed": stats['relayed'],
+            "acks": stats['acks_received'], "dropped_duplicate": stats['dropped_duplicate'],
+            "dropped_ttl": stats['dropped_ttl'], "timeouts": stats['timeouts'],
+        })
+
+
+def main():
+    init()
+    while True:
+        try:
+            loop()
+        except Exception as e:
+            log(f"[BRIDGE] Error: {e}", LOG.ERROR)
+        time.sleep_ms(5)
+
+
+if __name__ == "__main__":
+    main()
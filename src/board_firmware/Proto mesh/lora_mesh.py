@@ -3,12 +3,18 @@ lora_mesh.py
 LoRa Mesh протокол с фрагментацией, ACK и ретрансляцией
 """
 
-import machine
 import time
 import random
+import struct
+
+try:
+    import machine
+except ImportError:
+    machine = None  # CPython: только симуляция (sim_uart.py)
 
 from constants import MSG_TYPE, MSG_TARGET, LOG
 from config_common import RANDOM_MIN_INT, RANDOM_MAX_INT
+from uart_framing import FrameReader, encode_into, OVERHEAD as FRAME_OVERHEAD
 
 # =============================================================================
 # ЛОГИРОВАНИЕ
@@ -47,23 +53,44 @@ def log(msg, level=LOG.INFO):
 # 8-9     | from_node (последний ретранслятор)
 # 10-11   | to_node (конечный получатель)
 # 12      | hop_count (сколько прыжков сделано)
-# 13      | max_hops (максимум прыжков, TTL)
+# 13      | биты 0-3: max_hops (TTL), биты 4-7: attempt (номер повтора)
 # 14-17   | timestamp (4 байта, UNIX time)
-# 18-57   | data (40 байт)
+# 18-52   | data (до 35 байт, без дополнения нулями)
+#
+# NACK: данные — битовая карта недостающих фрагментов (бит i — нет фрагмента i).
+# Отправитель досылает только их под тем же msg_id со следующим attempt
+#
+# На UART пакет идёт в кадре uart_framing (+5 байт): 53 + 5 = 58 —
+# ровно один пакет эфира E32
 #
 
 class MeshHeader:
-    """Заголовок mesh-пакета (18 байт)"""
+    """
+    Заголовок mesh-пакета (18 байт).
+    Кодек через struct: pack_into/unpack_from работают с готовым буфером
+    без промежуточных bytearray и повторных проверок полей
+    """
+    
+    __slots__ = ('msg_type', 'msg_id', 'fragment_num', 'fragment_total',
+                 'origin_node', 'from_node', 'to_node', 'hop_count', 'max_hops',
+                 'attempt', 'need_ack', 'is_mesh', 'timestamp')
     
     SIZE = 18
-    DATA_SIZE = 40              # 58 - 18 = 40 байт на данные
-    MAX_PACKET_SIZE = 58
+    DATA_SIZE = 35              # 58 - 5 (кадр) - 18 = 35 байт на данные
+    MAX_PACKET_SIZE = 53
     DEFAULT_MAX_HOPS = 5
     
+    # флаги, msg_id (старший байт + младшие 2), fragment_num, fragment_total,
+    # origin_node, from_node, to_node, hop_count, attempt/max_hops, timestamp
+    FORMAT = '>BBHBBHHHBBI'
+    # Смещения полей, которые меняет ретранслятор
+    FROM_NODE_OFFSET = 8
+    HOP_COUNT_OFFSET = 12
+    
     def __init__(self, msg_type=MSG_TYPE.DATA, msg_id=None,
                  fragment_num=0, fragment_total=1,
                  origin_node=0, from_node=0, to_node=MSG_TARGET.ALL,
-                 hop_count=0, max_hops=None,
+                 hop_count=0, max_hops=None, attempt=0,
                  need_ack=False, is_mesh=True, timestamp=None):
         
         self.msg_type = int(msg_type) & 0x3F
@@ -74,86 +101,59 @@ class MeshHeader:
         self.from_node = int(from_node) & 0xFFFF
         self.to_node = int(to_node) & 0xFFFF
         self.hop_count = int(hop_count) & 0xFF
-        self.max_hops = int(max_hops) if max_hops is not None else self.DEFAULT_MAX_HOPS
+        self.max_hops = (int(max_hops) if max_hops is not None else self.DEFAULT_MAX_HOPS) & 0x0F
+        # Повтор того же msg_id: отличает повторные кадры от дубликатов
+        self.attempt = int(attempt) & 0x0F
         self.need_ack = bool(need_ack)
         self.is_mesh = bool(is_mesh)
         self.timestamp = int(timestamp) if timestamp is not None else int(time.time())
     
-    def to_bytes(self):
-        """Сериализация в 18 байт"""
-        header = bytearray(self.SIZE)
-        
-        # Байт 0: флаги
+    def pack_into(self, buf, offset=0):
+        """Записать заголовок в buf[offset:offset + 18]"""
         flags = self.msg_type & 0x3F
         if self.is_mesh:
             flags |= 0x40
         if self.need_ack:
             flags |= 0x80
-        header[0] = flags
-        
-        # Байты 1-3: msg_id
         msg_id = self.msg_id & 0xFFFFFF
-        header[1] = (msg_id >> 16) & 0xFF
-        header[2] = (msg_id >> 8) & 0xFF
-        header[3] = msg_id & 0xFF
-        
-        # Байт 4-5: fragment
-        header[4] = self.fragment_num & 0xFF
-        header[5] = self.fragment_total & 0xFF
-        
-        # Байты 6-7: origin_node
-        header[6] = (self.origin_node >> 8) & 0xFF
-        header[7] = self.origin_node & 0xFF
-        
-        # Байты 8-9: from_node
-        header[8] = (self.from_node >> 8) & 0xFF
-        header[9] = self.from_node & 0xFF
-        
-        # Байты 10-11: to_node
-        header[10] = (self.to_node >> 8) & 0xFF
-        header[11] = self.to_node & 0xFF
-        
-        # Байт 12-13: hop_count, max_hops
-        header[12] = self.hop_count & 0xFF
-        header[13] = self.max_hops & 0xFF
-        
-        # Байты 14-17: timestamp
-        ts = self.timestamp & 0xFFFFFFFF
-        header[14] = (ts >> 24) & 0xFF
-        header[15] = (ts >> 16) & 0xFF
-        header[16] = (ts >> 8) & 0xFF
-        header[17] = ts & 0xFF
-        
+        struct.pack_into(self.FORMAT, buf, offset,
+                         flags, msg_id >> 16, msg_id & 0xFFFF,
+                         self.fragment_num & 0xFF, self.fragment_total & 0xFF,
+                         self.origin_node & 0xFFFF, self.from_node & 0xFFFF, self.to_node & 0xFFFF,
+                         self.hop_count & 0xFF, ((self.attempt & 0x0F) << 4) | (self.max_hops & 0x0F),
+                         self.timestamp & 0xFFFFFFFF)
+    
+    def to_bytes(self):
+        """Сериализация в 18 байт"""
+        header = bytearray(self.SIZE)
+        self.pack_into(header)
         return bytes(header)
     
+    def load(self, data, offset=0):
+        """Заполнить поля из data[offset:offset + 18]; значения уже в диапазоне — без проверок"""
+        (flags, id_hi, id_lo, self.fragment_num, self.fragment_total,
+         self.origin_node, self.from_node, self.to_node,
+         self.hop_count, hops, self.timestamp) = struct.unpack_from(self.FORMAT, data, offset)
+        self.max_hops = hops & 0x0F
+        self.attempt = hops >> 4
+        self.msg_type = flags & 0x3F
+        self.is_mesh = bool(flags & 0x40)
+        self.need_ack = bool(flags & 0x80)
+        self.msg_id = (id_hi << 16) | id_lo
+        return self
+    
     @classmethod
-    def from_bytes(cls, data):
+    def from_bytes(cls, data, offset=0):
         """Десериализация из байтов"""
-        if len(data) < cls.SIZE:
-            raise ValueError(f"Header too small: {len(data)} < {cls.SIZE}")
-        
-        flags = data[0]
-        msg_type = flags & 0x3F
-        is_mesh = bool(flags & 0x40)
-        need_ack = bool(flags & 0x80)
-        
-        msg_id = (data[1] << 16) | (data[2] << 8) | data[3]
-        fragment_num = data[4]
-        fragment_total = data[5]
-        origin_node = (data[6] << 8) | data[7]
-        from_node = (data[8] << 8) | data[9]
-        to_node = (data[10] << 8) | data[11]
-        hop_count = data[12]
-        max_hops = data[13]
-        timestamp = (data[14] << 24) | (data[15] << 16) | (data[16] << 8) | data[17]
-        
-        return cls(
-            msg_type=msg_type, msg_id=msg_id,
-            fragment_num=fragment_num, fragment_total=fragment_total,
-            origin_node=origin_node, from_node=from_node, to_node=to_node,
-            hop_count=hop_count, max_hops=max_hops,
-            need_ack=need_ack, is_mesh=is_mesh, timestamp=timestamp
-        )
+        if len(data) < offset + cls.SIZE:
+            raise ValueError(f"Header too small: {len(data) - offset} < {cls.SIZE}")
+        return cls.__new__(cls).load(data, offset)
+    
+    @classmethod
+    def patch_relay(cls, packet, from_node):
+        """Ретрансляция на месте: hop_count + 1 и from_node в буфере пакета"""
+        packet[cls.HOP_COUNT_OFFSET] = (packet[cls.HOP_COUNT_OFFSET] + 1) & 0xFF
+        struct.pack_into('>H', packet, cls.FROM_NODE_OFFSET, from_node & 0xFFFF)
     
     def can_relay(self):
         """Можно ли ретранслировать?"""
@@ -161,7 +161,7 @@ class MeshHeader:
     
     def __repr__(self):
         return (f"Hdr(t={self.msg_type},id=0x{self.msg_id:06X},"
-                f"f={self.fragment_num}/{self.fragment_total},"
+                f"f={self.fragment_num}/{self.fragment_total},a={self.attempt},"
                 f"o={self.origin_node},to={self.to_node})")
 
 
@@ -172,22 +172,30 @@ class MeshHeader:
 class MeshPacket:
     """Mesh-пакет: заголовок + данные"""
     
+    __slots__ = ('header', 'data')
+    
     def __init__(self, header, data=b''):
         self.header = header
         self.data = bytes(data[:MeshHeader.DATA_SIZE])
     
+    def pack_into(self, buf):
+        """Записать пакет в начало buf, вернуть длину"""
+        self.header.pack_into(buf)
+        end = MeshHeader.SIZE + len(self.data)
+        buf[MeshHeader.SIZE:end] = self.data
+        return end
+    
     def to_bytes(self):
-        packet = bytearray(MeshHeader.MAX_PACKET_SIZE)
-        header_bytes = self.header.to_bytes()
-        packet[:MeshHeader.SIZE] = header_bytes
-        packet[MeshHeader.SIZE:MeshHeader.SIZE + len(self.data)] = self.data
-        return bytes(packet)
+        # Границы пакета задаёт кадр на UART — дополнять до полного размера не нужно
+        buf = bytearray(MeshHeader.SIZE + len(self.data))
+        self.pack_into(buf)
+        return bytes(buf)
     
     @classmethod
     def from_bytes(cls, raw):
         if len(raw) < MeshHeader.SIZE:
             raise ValueError(f"Packet too small: {len(raw)}")
-        header = MeshHeader.from_bytes(raw[:MeshHeader.SIZE])
+        header = MeshHeader.from_bytes(raw)
         data = bytes(raw[MeshHeader.SIZE:])
         return cls(header, data)
     
@@ -204,7 +212,6 @@ class LoRaTransceiver:
     
     AUX_TIMEOUT_MS = 1000
     READ_TIMEOUT_MS = 500
-    PACKET_GAP_MS = 50  # Пауза между чтениями для определения конца пакета
     
     def __init__(self, config):
         self.node_id = int(config.NODE_ID)
@@ -227,6 +234,11 @@ class LoRaTransceiver:
             rx=machine.Pin(config.LORA_RX)
         )
         
+        # Кадры uart_framing: буферы приёма и передачи выделяются один раз
+        self.rx = FrameReader()
+        self.tx_buf = bytearray(MeshHeader.MAX_PACKET_SIZE + FRAME_OVERHEAD)
+        self.tx_mv = memoryview(self.tx_buf)
+        
         log(f"LoRa init, node={self.node_id}", LOG.INFO)
     
     def wait_aux(self, timeout_ms=None):
@@ -244,43 +256,57 @@ class LoRaTransceiver:
         """Отправка сырых байтов"""
         if not self.wait_aux():
             return False
+        return self.write_frame(data)
+
+    def is_ready(self):
+        """Модуль свободен и примет кадр (AUX=HIGH), без ожидания"""
+        return self.aux.value() == 1
+
+    def write_frame(self, data):
+        """Запись пакета в кадре в UART без ожидания AUX — вызывать после is_ready()"""
         try:
-            written = self.uart.write(data)
-            return written == len(data)
+            n = encode_into(data, self.tx_buf)
+            written = self.uart.write(self.tx_mv[:n])
+            return written == n
         except Exception as e:
             log(f"TX error: {e}", LOG.ERROR)
             return False
     
+    def read_frames(self):
+        """
+        Все целые пакеты, пришедшие к этому моменту, без ожидания.
+        Каждый — memoryview, действительный до следующего пакета
+        """
+        self.rx.feed_from(self.uart)
+        while True:
+            frame = self.rx.next_frame()
+            if frame is None:
+                # Буфер кадров был полон — в UART могло остаться ещё
+                if not self.uart.any() or not self.rx.feed_from(self.uart):
+                    return
+                continue
+            yield frame
+    
     def receive_raw(self, timeout_ms=None):
-        """Прием сырых байтов"""
+        """Прием одного пакета с ожиданием (bytes или None)"""
         timeout_ms = timeout_ms or self.READ_TIMEOUT_MS
         start = time.ticks_ms()
-        last_data = start
-        buffer = b''
         
         while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
-            if self.uart.any():
-                chunk = self.uart.read()
-                if chunk:
-                    buffer += chunk
-                    last_data = time.ticks_ms()
-            
-            # Если данные были и пауза > PACKET_GAP_MS — пакет завершен
-            if buffer and time.ticks_diff(time.ticks_ms(), last_data) > self.PACKET_GAP_MS:
-                break
-            
+            for frame in self.read_frames():
+                return bytes(frame)
             time.sleep_ms(5)
-        
-        return buffer if buffer else None
+        return None
     
     def available(self):
         """Есть ли данные в буфере?"""
-        return self.uart.any() > 0
+        return self.uart.any() > 0 or self.rx.count > 0
     
     def clear_buffer(self):
         """Очистка буфера UART"""
         while self.uart.any():
             self.uart.read()
+        self.rx.head = self.rx.count = 0
 
 
 # =============================================================================
@@ -300,30 +326,54 @@ class MeshNode:
     MAX_ASSEMBLY_BUFFERS = 10
     MAX_PENDING_ACKS = 20
     MAX_COMPLETED_MESSAGES = 10
-    
-    def __init__(self, config):
+    MAX_DELIVERY_EVENTS = 50
+    MAX_TX_QUEUE = 24
+    MAX_DELIVERED_MESSAGES = 30
+    MAX_NACKS = 3
+    # Подключ seen_messages внутри msg_id: номер фрагмента (биты 0-7),
+    # номер повтора (8-11), ACK (12), NACK (13) — small int MicroPython (до 2**30)
+    ATTEMPT_SEEN_SHIFT = 8
+    ACK_SEEN_FLAG = 1 << 12
+    NACK_SEEN_FLAG = 1 << 13
+
+    # Приоритеты очереди передачи (меньше — раньше)
+    TX_PRIO_ACK = 0
+    TX_PRIO_RELAY = 1
+    TX_PRIO_SEND = 2
+
+    def __init__(self, config, transceiver=None):
         """
         Args:
             config: объект с атрибутами NODE_ID, LORA_*, MAX_HOPS, RELAY_ENABLED, etc.
+            transceiver: готовый транспорт (см. lora_mesh_async.py), по умолчанию LoRaTransceiver
         """
         self.node_id = int(config.NODE_ID)
         self.relay_enabled = getattr(config, 'RELAY_ENABLED', True)
         self.max_hops = getattr(config, 'MAX_HOPS', 5)
         
         # Transceiver
-        self.lora = LoRaTransceiver(config)
+        self.lora = transceiver if transceiver is not None else LoRaTransceiver(config)
         
         # Буферы
-        self.seen_messages = {}       # {msg_id: timestamp} — защита от дубликатов
+        self.seen_messages = {}       # {msg_id: [timestamp, {подключ}]} — защита от дубликатов
         self.assembly_buffers = {}    # Сборка фрагментов
         self.completed_messages = []  # Готовые сообщения
+        self.delivered_messages = {}  # {msg_id: ticks} — уже собранные: повтор только переподтверждаем
         self.pending_acks = {}        # Ожидание ACK: {msg_id: (timestamp, retries, data)}
-        
+        self.delivery_events = []     # Итог доставки: [(msg_id первой попытки, доставлено?)]
+        self.sent_events = []         # msg_id первой попытки, ушедшие в эфир целиком
+        self.tx_queue = []            # Очередь передачи, см. _enqueue()
+        self.tx_seq = 0
+
         # Таймауты
         self.seen_ttl_ms = getattr(config, 'SEEN_TTL_MS', 60000)
         self.assembly_ttl_ms = getattr(config, 'ASSEMBLY_TTL_MS', 30000)
         self.ack_timeout_ms = getattr(config, 'ACK_TIMEOUT_MS', 3000)
         self.max_retries = getattr(config, 'MAX_SEND_RETRIES', 3)
+        # Выборочный повтор: получатель просит недостающие фрагменты (NACK),
+        # отправитель досылает только их под тем же msg_id
+        self.selective_repeat = getattr(config, 'SELECTIVE_REPEAT', True)
+        self.nack_gap_ms = getattr(config, 'NACK_GAP_MS', 1500)
         
         # Задержка ретрансляции (случайная, для избежания коллизий)
         self.relay_delay_min_ms = 30
@@ -338,6 +388,10 @@ class MeshNode:
             'acks_received': 0,
             'dropped_duplicate': 0,
             'dropped_ttl': 0,
+            'dropped_tx_full': 0,
+            'nacks_sent': 0,
+            'nacks_received': 0,
+            'frags_resent': 0,
             'timeouts': 0
         }
         
@@ -351,17 +405,18 @@ class MeshNode:
     def send(self, data, to_node=MSG_TARGET.ALL, msg_type=MSG_TYPE.DATA,
              need_ack=False, delay_ms=100):
         """
-        Отправить сообщение (с автоматической фрагментацией).
+        Поставить сообщение в очередь передачи (с автоматической фрагментацией).
+        Кадры уходят в эфир из poll(), по одному за вызов.
         
         Args:
             data: str или bytes
             to_node: ID получателя (int или MSG_TARGET)
             msg_type: тип сообщения
             need_ack: требуется подтверждение
-            delay_ms: задержка между фрагментами
+            delay_ms: пауза между фрагментами (в это время уходят кадры других сообщений)
         
         Returns:
-            msg_id (int) или None при ошибке
+            msg_id (int) или None при ошибке / переполненной очереди
         """
         # Конвертируем данные
         if isinstance(data, str):
@@ -380,64 +435,79 @@ class MeshNode:
             return None
         
         msg_id = random.randint(0, 0xFFFFFF)
-        timestamp = int(time.time())
         
-        log(f"TX: 0x{msg_id:06X}, {total_len}B, {frag_total} frags, to={to_node}", LOG.INFO)
+        frames = self._fragments(data_bytes, frag_total, msg_id, to_node, msg_type, need_ack)
+        if not self._enqueue(self.TX_PRIO_SEND, frames, frag_total, gap_ms=delay_ms, msg_id=msg_id):
+            log(f"TX queue full, 0x{msg_id:06X} not sent", LOG.WARN)
+            return None
         
-        # Отправляем фрагменты
-        ffor frag_num in range(frag_total):
-            start = frag_num * MeshHeader.DATA_SIZE
-            end = min(start + MeshHeader.DATA_SIZE, total_len)
-            chunk = data_bytes[start:end]
-            
-            # Тип: FRAGMENT если много частей, иначе оригинальный тип
-            actual_type = MSG_TYPE.FRAGMENT if frag_total > 1 else msg_type
-            
-            header = MeshHeader(
-                msg_type=actual_type,
-                msg_id=msg_id,
-                fragment_num=frag_num,
-                fragment_total=frag_total,
-                origin_node=self.node_id,
-                from_node=self.node_id,
-                to_node=to_node,
-                hop_count=0,
-                max_hops=self.max_hops,
-                need_ack=need_ack and (frag_num == frag_total - 1),  # ACK только на последний
-                is_mesh=True,
-                timestamp=timestamp
-            )
-            
-            packet = MeshPacket(header, chunk)
-            
-            if self.lora.send_raw(packet.to_bytes()):
-                self.stats['tx'] += 1
-            else:
-                log(f"Frag {frag_num+1} FAIL", LOG.ERROR)
-                return None
-            
-            if frag_num < frag_total - 1:
-                time.sleep_ms(delay_ms)
+        log(f"TX: 0x{msg_id:06X}, {total_len}B, {frag_total} frags, to={to_node}", LOG.INFO)
         
         # Ограничение размера seen_messages
         self._limit_dict(self.seen_messages, self.MAX_SEEN_MESSAGES)
-        self.seen_messages[msg_id] = time.ticks_ms()
+        self.seen_messages[msg_id] = [time.ticks_ms(), set()]
         
-        # Добавляем в ожидание ACK
-        f need_ack:
+        # Добавляем в ожидание ACK; таймер запустится, когда уйдёт последний фрагмент
+        if need_ack:
             self._limit_dict(self.pending_acks, self.MAX_PENDING_ACKS)
             self.pending_acks[msg_id] = {
-                'timestamp': time.ticks_ms(),
+                'timestamp': None,
                 'retries': self.max_retries,
                 'to_node': to_node,
                 'data': data_bytes,
-                'msg_type': msg_type
+                'msg_type': msg_type,
+                'frag_total': frag_total,
+                'gap': delay_ms,
+                'attempt': 0
             }
         
         return msg_id
     
+    def _fragments(self, data_bytes, frag_total, msg_id, to_node, msg_type, need_ack,
+                   frag_nums=None, attempt=0):
+        """
+        Кадры сообщения; собираются по одному в момент отправки.
+        Один заголовок и один буфер на всё сообщение: кадр уходит в UART
+        раньше, чем собирается следующий.
+        frag_nums — только эти фрагменты (выборочный повтор); need_ack ставится
+        на последний кадр серии: после него отправитель ждёт ответа
+        """
+        # Все фрагменты несут тип исходного сообщения: получатель узнаёт
+        # фрагментацию по fragment_total, а собранное сообщение сохраняет тип
+        header = MeshHeader(
+            msg_type=msg_type,
+            msg_id=msg_id,
+            fragment_total=frag_total,
+            origin_node=self.node_id,
+            from_node=self.node_id,
+            to_node=to_node,
+            hop_count=0,
+            max_hops=self.max_hops,
+            attempt=attempt,
+            is_mesh=True
+        )
+        buf = bytearray(MeshHeader.MAX_PACKET_SIZE)
+        view = memoryview(buf)
+        data = memoryview(data_bytes)
+        
+        if frag_nums is None:
+            frag_nums = range(frag_total)
+        last = frag_nums[-1]
+        
+        for frag_num in frag_nums:
+            start = frag_num * MeshHeader.DATA_SIZE
+            chunk = data[start:start + MeshHeader.DATA_SIZE]
+            
+            header.fragment_num = frag_num
+            header.need_ack = need_ack and frag_num == last  # ACK только на последний
+            header.pack_into(buf)
+            end = MeshHeader.SIZE + len(chunk)
+            buf[MeshHeader.SIZE:end] = chunk
+            
+            yield view[:end]
+    
     def send_ack(self, original_header):
-        """Отправить ACK"""
+        """Поставить ACK в очередь (вне очереди остальных кадров)"""
         header = MeshHeader(
             msg_type=MSG_TYPE.ACK,
             msg_id=original_header.msg_id,
@@ -446,52 +516,222 @@ class MeshNode:
             to_node=original_header.origin_node,
             hop_count=0,
             max_hops=original_header.max_hops,
+            attempt=original_header.attempt,  # ACK на повтор — новый кадр, а не дубликат
             is_mesh=True
         )
         
-        packet = MeshPacket(header, b'')
-        if self.lora.send_raw(packet.to_bytes()):
-            self.stats['acks_sent'] += 1
-            log(f"ACK sent for 0x{original_header.msg_id:06X}", LOG.DEBUG)
+        packet = bytearray(MeshHeader.SIZE)
+        header.pack_into(packet)
+        if self._enqueue(self.TX_PRIO_ACK, iter((packet,)), 1, kind='ack'):
+            log(f"ACK queued for 0x{original_header.msg_id:06X}", LOG.DEBUG)
             return True
         return False
     
+    def send_nack(self, buf):
+        """Попросить у отправителя недостающие фрагменты: битовая карта, бит i — нет фрагмента i"""
+        first = buf['header']
+        total = buf['total']
+        bitmap = bytearray((total + 7) // 8)
+        for i in range(total):
+            if i not in buf['fragments']:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        
+        buf['nacks'] += 1
+        buf['last_ms'] = time.ticks_ms()
+        header = MeshHeader(
+            msg_type=MSG_TYPE.NACK,
+            msg_id=first.msg_id,
+            fragment_total=total,
+            origin_node=self.node_id,
+            from_node=self.node_id,
+            to_node=first.origin_node,
+            hop_count=0,
+            max_hops=first.max_hops,
+            attempt=buf['nacks'],
+            is_mesh=True
+        )
+        
+        packet = bytearray(MeshHeader.SIZE + len(bitmap))
+        header.pack_into(packet)
+        packet[MeshHeader.SIZE:] = bitmap
+        if self._enqueue(self.TX_PRIO_ACK, iter((packet,)), 1, kind='nack'):
+            self.stats['nacks_sent'] += 1
+            log(f"NACK for 0x{first.msg_id:06X}: {total - len(buf['fragments'])}/{total} missing", LOG.DEBUG)
+            return True
+        return False
+    
+    def _resend_fragments(self, msg_id, info, frag_nums):
+        """Дослать фрагменты под тем же msg_id, со следующим номером повтора"""
+        attempt = (info['attempt'] + 1) & 0x0F
+        frames = self._fragments(info['data'], info['frag_total'], msg_id, info['to_node'],
+                                 info['msg_type'], True, frag_nums=frag_nums, attempt=attempt)
+        if not self._enqueue(self.TX_PRIO_SEND, frames, len(frag_nums), gap_ms=info['gap'], msg_id=msg_id):
+            return False
+        info['attempt'] = attempt
+        info['retries'] -= 1
+        info['timestamp'] = None  # таймер ACK снова с момента выхода в эфир
+        self.stats['frags_resent'] += len(frag_nums)
+        return True
+    
+    # -------------------------------------------------------------------------
+    # ОЧЕРЕДЬ ПЕРЕДАЧИ
+    # -------------------------------------------------------------------------
+    
+    def _enqueue(self, prio, frames, count, delay_ms=0, gap_ms=0, msg_id=None, kind='send'):
+        """
+        Добавить задание в очередь передачи.
+        Последние места — только под ACK/NACK: ретрансляция соседей не должна
+        мешать подтвердить своё. Свои сообщения оставляют место и ретрансляции.
+        Если ACK/NACK всё же не влез, вытесняем самую старую ретрансляцию.
+        """
+        limit = self.MAX_TX_QUEUE
+        if prio == self.TX_PRIO_SEND:
+            limit -= self.MAX_TX_QUEUE // 4
+        elif prio == self.TX_PRIO_RELAY:
+            limit -= self.MAX_TX_QUEUE // 8
+        if len(self.tx_queue) >= limit and not (prio == self.TX_PRIO_ACK and self._evict_relay()):
+            self.stats['dropped_tx_full'] += 1
+            return False
+        
+        self.tx_seq += 1
+        self.tx_queue.append({
+            'prio': prio,
+            'seq': self.tx_seq,
+            'due': time.ticks_add(time.ticks_ms(), delay_ms),
+            'frames': frames,
+            'left': count,
+            'gap': gap_ms,
+            'msg_id': msg_id,
+            'kind': kind
+        })
+        return True
+    
+    def _evict_relay(self):
+        """Снять самую старую ретрансляцию, ещё не ушедшую в эфир"""
+        oldest = None
+        for job in self.tx_queue:
+            if job['kind'] == 'relay' and job['left'] > 0:
+                if oldest is None or job['seq'] < oldest['seq']:
+                    oldest = job
+        if oldest is None:
+            return False
+        self.tx_queue.remove(oldest)
+        self.stats['dropped_tx_full'] += 1
+        return True
+    
+    def _next_job(self, now):
+        """Задание с наименьшим (приоритет, порядок), время которого пришло"""
+        best = None
+        for job in self.tx_queue:
+            if time.ticks_diff(now, job['due']) < 0:
+                continue
+            if best is None or (job['prio'], job['seq']) < (best['prio'], best['seq']):
+                best = job
+        return best
+    
+    def _next_due_ms(self, now):
+        """Через сколько мс подойдёт срок ближайшего задания (None — очередь пуста)"""
+        wait = None
+        for job in self.tx_queue:
+            left = max(0, time.ticks_diff(job['due'], now))
+            if wait is None or left < wait:
+                wait = left
+        return wait
+    
+    def _take_frame(self, job):
+        job['left'] -= 1
+        return next(job['frames'])
+    
+    def _frame_done(self, job, ok, now):
+        """Учёт отправленного кадра: пауза до следующего фрагмента или снятие задания"""
+        if ok:
+            if job['kind'] == 'ack':
+                self.stats['acks_sent'] += 1
+            elif job['kind'] == 'nack':
+                pass  # учтён в send_nack
+            elif job['kind'] == 'relay':
+                self.stats['relayed'] += 1
+            else:
+                self.stats['tx'] += 1
+        else:
+            log(f"Frame FAIL ({job['kind']})", LOG.ERROR)
+            job['left'] = 0
+        
+        if job['left'] > 0:
+            # Следующий фрагмент — после паузы, кадры других заданий идут в промежутке
+            job['due'] = time.ticks_add(now, job['gap'])
+            return
+        
+        if job not in self.tx_queue:
+            return  # снято, пока кадр уходил (ACK отменил дослать фрагменты)
+        self.tx_queue.remove(job)
+        if job['msg_id'] is not None:
+            self._message_done(job['msg_id'], ok)
+    
+    def _pump_tx(self):
+        """Отправить не больше одного кадра, если модуль свободен"""
+        if not self.tx_queue or not self.lora.is_ready():
+            return False
+        
+        now = time.ticks_ms()
+        job = self._next_job(now)
+        if job is None:
+            return False
+        
+        ok = self.lora.write_frame(self._take_frame(job))
+        self._frame_done(job, ok, now)
+        return ok
+    
+    def _message_done(self, msg_id, ok):
+        """Сообщение целиком ушло в эфир (или не ушло)"""
+        info = self.pending_acks.get(msg_id)
+        first_msg_id = info.get('first_msg_id', msg_id) if info else msg_id
+        
+        if not ok:
+            if info is not None:
+                del self.pending_acks[msg_id]
+                self._delivery_event(first_msg_id, False)
+            return
+        
+        if info is not None:
+            info['timestamp'] = time.ticks_ms()
+            # "Ушло в эфир" — один раз на сообщение: досылки по NACK, пробы
+            # по таймауту и повторы с новым msg_id его не повторяют
+            if info['attempt'] or 'first_msg_id' in info:
+                return
+        if len(self.sent_events) >= self.MAX_DELIVERY_EVENTS:
+            self.sent_events.pop(0)
+        self.sent_events.append(first_msg_id)
+    
+    def tx_pending(self):
+        """Сколько заданий ждёт передачи"""
+        return len(self.tx_queue)
+    
     # -------------------------------------------------------------------------
     # РЕТРАНСЛЯЦИЯ
     # -------------------------------------------------------------------------
     
-    def _relay_packet(self, header, data):
-        """Ретранслировать пакет"""
+    def _relay_packet(self, header, raw):
+        """
+        Поставить пакет в очередь на ретрансляцию.
+        raw — принятый пакет целиком: копируем один раз и правим
+        hop_count/from_node прямо в копии, без сборки заголовка заново
+        """
         if not self.relay_enabled or not header.can_relay():
             if not header.can_relay():
                 self.stats['dropped_ttl'] += 1
             return False
         
-        # Новый заголовок с увеличенным hop_count
-        new_header = MeshHeader(
-            msg_type=header.msg_type,
-            msg_id=header.msg_id,
-            fragment_num=header.fragment_num,
-            fragment_total=header.fragment_total,
-            origin_node=header.origin_node,
-            from_node=self.node_id,  # мы ретранслятор
-            to_node=header.to_node,
-            hop_count=header.hop_count + 1,
-            max_hops=header.max_hops,
-            need_ack=header.need_ack,
-            is_mesh=header.is_mesh,
-            timestamp=header.timestamp
-        )
+        # Копия нужна: пакет уйдёт позже, а буфер приёма к тому времени перезапишется
+        packet = bytearray(raw)
+        MeshHeader.patch_relay(packet, self.node_id)  # мы ретранслятор
         
-        packet = MeshPacket(new_header, data)
-        
-        # Случайная задержка
+        # Случайная задержка против коллизий с соседними ретрансляторами — без сна,
+        # кадр просто не выйдет из очереди раньше срока
         delay = random.randint(self.relay_delay_min_ms, self.relay_delay_max_ms)
-        time.sleep_ms(delay)
         
-        if self.lora.send_raw(packet.to_bytes()):
-            self.stats['relayed'] += 1
-            log(f"RELAY: 0x{header.msg_id:06X}", LOG.DEBUG)
+        if self._enqueue(self.TX_PRIO_RELAY, iter((packet,)), 1, delay_ms=delay, kind='relay'):
+            log(f"RELAY queued: 0x{header.msg_id:06X}", LOG.DEBUG)
             return True
         return False
     
@@ -501,57 +741,57 @@ class MeshNode:
     
     def poll(self):
         """
-        Опросить входящие данные и обработать.
+        Опросить входящие данные, обработать и отправить один кадр из очереди.
         Возвращает список готовых сообщений: [(header, data_bytes), ...]
         """
         self._cleanup()
         self._check_ack_timeouts()
+        self._check_assembly_gaps()
         
-        # Читаем все доступные пакеты
-        while self.lora.available():
-            raw = self.lora.receive_raw(timeout_ms=200)
-            if raw is None or len(raw) < MeshHeader.SIZE:
-                continue
-            
-            try:
-                packet = MeshPacket.from_bytes(raw)
-                header = packet.header
-                data = packet.data
-            except Exception as e:
-                log(f"Parse error: {e}", LOG.ERROR)
-                continue
-            
-            self.stats['rx'] += 1
-            self._process_packet(header, data)
+        # Читаем все целые пакеты, без ожидания тишины на линии
+        for raw in self.lora.read_frames():
+            self._process_raw(raw)
+        
+        # Передача: не больше кадра за вызов, чтобы приём не простаивал
+        self._pump_tx()
         
         # Ограничение completed_messages
         result = self.completed_messages[:self.MAX_COMPLETED_MESSAGES]
         self.completed_messages = []
         return result
     
-    def _process_packet(self, header, data):
-        """Обработка одного пакета"""
+    def _process_raw(self, raw):
+        """Разбор принятого пакета (memoryview из буфера приёма)"""
+        if not MeshHeader.SIZE <= len(raw) <= MeshHeader.MAX_PACKET_SIZE:
+            log(f"Bad packet size: {len(raw)}", LOG.ERROR)
+            return
+        
+        header = MeshHeader.from_bytes(raw)
+        self.stats['rx'] += 1
+        self._process_packet(header, raw)
+    
+    def _process_packet(self, header, raw):
+        """Обработка одного пакета; данные копируются из raw, только если нужны"""
         msg_id = header.msg_id
         
-        # 1. Проверка на дубликат
-        if msg_id in self.seen_messages:
+        # 1. Проверка на дубликат (и запоминаем)
+        if self._seen_before(header):
             self.stats['dropped_duplicate'] += 1
             return
         
-        # Запоминаем
-        self._limit_dict(self.seen_messages, self.MAX_SEEN_MESSAGES)
-        self.seen_messages[msg_id] = time.ticks_ms()
-        
         # 2. Это наше сообщение?
         if header.origin_node == self.node_id:
             return
         
-        # 3. Обработка ACK
-        if header.msg_type == MSG_TYPE.ACK:
-            self._process_ack(header)
+        # 3. Обработка ACK/NACK
+        if header.msg_type == MSG_TYPE.ACK or header.msg_type == MSG_TYPE.NACK:
+            if header.msg_type == MSG_TYPE.ACK:
+                self._process_ack(header)
+            else:
+                self._process_nack(header, raw)
             # ACK тоже ретранслируем если не для нас
             if header.to_node != self.node_id:
-                self._relay_packet(header, data)
+                self._relay_packet(header, raw)
             return
         
         # 4. Для нас ли сообщение?
@@ -560,49 +800,122 @@ class MeshNode:
         
         # 5. Обрабатываем если для нас
         if is_for_me:
-            if header.fragment_total > 1:
-                self._process_fragment(header, data)
+            if msg_id in self.delivered_messages:
+                # Повтор уже собранного сообщения: наш ACK потерялся — подтверждаем снова
+                if header.need_ack:
+                    self.send_ack(header)
+            elif header.fragment_total > 1:
+                self._process_fragment(header, bytes(raw[MeshHeader.SIZE:]))
             else:
-                self._complete_message(header, data)
+                self._complete_message(header, bytes(raw[MeshHeader.SIZE:]))
         
         # 6. Ретрансляция
         # Для unicast — ретранслируем если не для нас
         # Для broadcast с mesh — тоже ретранслируем
         if header.to_node != MSG_TARGET.ALL and not is_for_me:
-            self._relay_packet(header, data)
+            self._relay_packet(header, raw)
         elif header.to_node == MSG_TARGET.ALL and header.is_mesh:
-            self._relay_packet(header, data)
+            self._relay_packet(header, raw)
+    
+    def _seen_subkey(self, header):
+        """
+        Подключ пакета внутри msg_id. У ACK/NACK тот же msg_id, что у сообщения,
+        которое уже есть в seen_messages отправителя, — у них свои флаги. Фрагменты
+        одного сообщения делят msg_id — в подключе номер фрагмента, а повторы
+        под тем же msg_id различаются номером попытки
+        """
+        key = header.attempt << self.ATTEMPT_SEEN_SHIFT
+        if header.msg_type == MSG_TYPE.ACK:
+            return key | self.ACK_SEEN_FLAG
+        if header.msg_type == MSG_TYPE.NACK:
+            return key | self.NACK_SEEN_FLAG
+        return key | header.fragment_num
+    
+    def _seen_before(self, header):
+        """
+        Отметить пакет в seen_messages; True — уже встречался.
+        Ключ верхнего уровня — сам msg_id (24 бита): одно целое с флагами
+        и номерами не влезло бы в small int и выделялось бы в куче на каждый кадр
+        """
+        now = time.ticks_ms()
+        subkey = self._seen_subkey(header)
+        entry = self.seen_messages.get(header.msg_id)
+        if entry is None:
+            self._limit_dict(self.seen_messages, self.MAX_SEEN_MESSAGES)
+            self.seen_messages[header.msg_id] = [now, {subkey}]
+            return False
+        if subkey in entry[1]:
+            return True
+        entry[0] = now
+        entry[1].add(subkey)
+        return False
     
     def _process_ack(self, header):
         """Обработка входящего ACK"""
         msg_id = header.msg_id
         
         if header.to_node == self.node_id and msg_id in self.pending_acks:
-            del self.pending_acks[msg_id]
+            info = self.pending_acks.pop(msg_id)
+            # Досылаемые фрагменты больше не нужны
+            self.tx_queue = [job for job in self.tx_queue
+                             if job['kind'] != 'send' or job['msg_id'] != msg_id]
+            self._delivery_event(info.get('first_msg_id', msg_id), True)
             self.stats['acks_received'] += 1
             log(f"ACK received: 0x{msg_id:06X}", LOG.INFO)
     
+    def _process_nack(self, header, raw):
+        """NACK: дослать только фрагменты, отмеченные в битовой карте"""
+        msg_id = header.msg_id
+        if header.to_node != self.node_id or msg_id not in self.pending_acks:
+            return
+        self.stats['nacks_received'] += 1
+        
+        info = self.pending_acks[msg_id]
+        # Сообщение ещё уходит в эфир: хвост дойдёт сам
+        if not self.selective_repeat or info['timestamp'] is None or info['retries'] <= 0:
+            return
+        
+        bitmap = raw[MeshHeader.SIZE:]
+        frag_nums = [i for i in range(info['frag_total'])
+                     if (i >> 3) < len(bitmap) and bitmap[i >> 3] & (1 << (i & 7))]
+        if not frag_nums:
+            return
+        
+        log(f"NACK for 0x{msg_id:06X}: resending {frag_nums}", LOG.INFO)
+        self._resend_fragments(msg_id, info, frag_nums)
+    
     def _process_fragment(self, header, data):
         """Обработка фрагмента"""
         msg_id = header.msg_id
         
+        now = time.ticks_ms()
         if msg_id not in self.assembly_buffers:
             self._limit_dict(self.assembly_buffers, self.MAX_ASSEMBLY_BUFFERS)
             self.assembly_buffers[msg_id] = {
                 'header': header,
                 'total': header.fragment_total,
                 'fragments': {},
-                'timestamp': time.ticks_ms()
+                'timestamp': now,
+                'last_ms': now,  # последний принятый фрагмент — для NACK по паузе
+                'nacks': 0
             }
         
         buf = self.assembly_buffers[msg_id]
         frag_num = header.fragment_num
+        buf['last_ms'] = now
         
-        if frag_num in buf['fragments']:
-            return  # Дубликат
+        if frag_num not in buf['fragments']:
+            buf['fragments'][frag_num] = data
+            log(f"Frag {frag_num+1}/{buf['total']} for 0x{msg_id:06X}", LOG.DEBUG)
         
-        buf['fragments'][frag_num] = data
-        log(f"Frag {frag_num+1}/{buf['total']} for 0x{msg_id:06X}", LOG.DEBUG)
+        # need_ack стоит только на последнем фрагменте серии, а сборка идёт по заголовку первого
+        if header.need_ack:
+            buf['header'].need_ack = True
+            buf['header'].attempt = header.attempt
+            # Серия закончилась, а дыры остались — сразу просим недостающее
+            if len(buf['fragments']) < buf['total'] and self._nack_allowed(buf):
+                self.send_nack(buf)
+                return
         
         # Все получены?
         if len(buf['fragments']) == buf['total']:
@@ -618,13 +931,26 @@ class MeshNode:
             self._complete_message(buf['header'], full_data)
             del self.assembly_buffers[msg_id]
     
+    def _nack_allowed(self, buf):
+        """NACK только на адресованные нам сообщения: у широковещательных много получателей"""
+        return self.selective_repeat and buf['header'].to_node == self.node_id
+    
+    def _check_assembly_gaps(self):
+        """Фрагменты перестали приходить, а сообщение не собрано — NACK, не дожидаясь таймаута ACK"""
+        now = time.ticks_ms()
+        for buf in self.assembly_buffers.values():
+            if (buf['nacks'] < self.MAX_NACKS and self._nack_allowed(buf)
+                    and time.ticks_diff(now, buf['last_ms']) > self.nack_gap_ms):
+                self.send_nack(buf)
+    
     def _complete_message(self, header, data):
         """Сообщение полностью получено"""
-        # Убираем trailing нули
-        data = data.rstrip(b'\x00')
-        
         log(f"✓ MSG from {header.origin_node}, 0x{header.msg_id:06X}, {len(data)}B", LOG.INFO)
         
+        # Повторы под тем же msg_id больше не выдаём приложению
+        self._limit_dict(self.delivered_messages, self.MAX_DELIVERED_MESSAGES)
+        self.delivered_messages[header.msg_id] = time.ticks_ms()
+        
         # Отправляем ACK
         if header.need_ack:
             self.send_ack(header)
@@ -638,6 +964,8 @@ class MeshNode:
         to_resend = []
         
         for msg_id, info in self.pending_acks.items():
+            if info['timestamp'] is None:
+                continue  # Ещё в очереди передачи
             elapsed = time.ticks_diff(now, info['timestamp'])
             
             if elapsed > self.ack_timeout_ms:
@@ -650,13 +978,21 @@ class MeshNode:
         
         # Удаляем
         for msg_id in to_remove:
-            del self.pending_acks[msg_id]
+            info = self.pending_acks.pop(msg_id)
+            self._delivery_event(info.get('first_msg_id', msg_id), False)
         
         # Переотправляем
         for msg_id in to_resend:
             info = self.pending_acks[msg_id]
             log(f"Resending 0x{msg_id:06X}, retries={info['retries']}", LOG.INFO)
             
+            if self.selective_repeat:
+                # Под тем же msg_id шлём только последний фрагмент: получатель
+                # ответит ACK (всё собрано) или NACK со списком недостающих
+                if not self._resend_fragments(msg_id, info, [info['frag_total'] - 1]):
+                    info['timestamp'] = now  # очередь занята — после следующего таймаута
+                continue
+            
             new_msg_id = self.send(
                 info['data'],
                 to_node=info['to_node'],
@@ -664,12 +1000,18 @@ class MeshNode:
                 need_ack=True
             )
             
+            if new_msg_id is None:
+                # Очередь передачи занята — попробуем после следующего таймаута
+                info['timestamp'] = now
+                continue
+            
             # Удаляем старую запись
             del self.pending_acks[msg_id]
             
             # Новая запись уже создана в send()
-            if new_msg_id and new_msg_id in self.pending_acks:
+            if new_msg_id in self.pending_acks:
                 self.pending_acks[new_msg_id]['retries'] = info['retries'] - 1
+                self.pending_acks[new_msg_id]['first_msg_id'] = info.get('first_msg_id', msg_id)
     
     def _cleanup(self):
         """Очистка устаревших буферов"""
@@ -677,7 +1019,7 @@ class MeshNode:
         
         # seen_messages
         expired = [k for k, v in self.seen_messages.items()
-                   if time.ticks_diff(now, v) > self.seen_ttl_ms]
+                   if time.ticks_diff(now, v[0]) > self.seen_ttl_ms]
         for k in expired:
             del self.seen_messages[k]
         
@@ -686,7 +1028,30 @@ class MeshNode:
                    if time.ticks_diff(now, v['timestamp']) > self.assembly_ttl_ms]
         for k in expired:
             del self.assembly_buffers[k]
+        
+        # delivered_messages
+        expired = [k for k, v in self.delivered_messages.items()
+                   if time.ticks_diff(now, v) > self.seen_ttl_ms]
+        for k in expired:
+            del self.delivered_messages[k]
             
+    def _delivery_event(self, msg_id, delivered):
+        if len(self.delivery_events) >= self.MAX_DELIVERY_EVENTS:
+            self.delivery_events.pop(0)
+        self.delivery_events.append((msg_id, delivered))
+    
+    def pop_delivery_events(self):
+        """Итоги доставки с прошлого вызова: [(msg_id из send(), доставлено?)]"""
+        events = self.delivery_events
+        self.delivery_events = []
+        return events
+    
+    def pop_sent_events(self):
+        """Сообщения, целиком ушедшие в эфир с прошлого вызова: [msg_id из send()]"""
+        events = self.sent_events
+        self.sent_events = []
+        return events
+    
     def _limit_dict(self, d, max_size):
         """Ограничить размер словаря, удаляя старые записи"""
         while len(d) >= max_size:
@@ -720,4 +1085,5 @@ class MeshNode:
         print(f"=== Stats (id={self.node_id}) ===")
         print(f"TX:{s['tx']} RX:{s['rx']} Relay:{s['relayed']}")
         print(f"ACK sent:{s['acks_sent']} rcvd:{s['acks_received']}")
+        print(f"NACK sent:{s['nacks_sent']} rcvd:{s['nacks_received']} resent frags:{s['frags_resent']}")
         print(f"Drop dup:{s['dropped_duplicate']} ttl:{s['dropped_ttl']}")
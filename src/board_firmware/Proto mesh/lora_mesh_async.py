@@ -0,0 +1,255 @@
+"""
+lora_mesh_async.py
+Асинхронный вариант mesh-стека: приём, передача, таймеры ACK и приложение —
+отдельные задачи asyncio вместо цикла poll() со sleep_ms.
+
+- приём: StreamReader на UART, пакеты выделяются кадрами uart_framing
+- передача: ждём AUX по прерыванию (Pin.irq -> ThreadSafeFlag), а не в цикле
+- логика протокола общая с MeshNode (lora_mesh.py)
+
+Под CPython работает с симуляцией эфира из sim_uart.py.
+
+    node = AsyncMeshNode(config, AsyncLoRaTransceiver.from_config(config))
+    node.start()
+    header, data = await node.receive()
+"""
+
+import time
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+from lora_mesh import MeshNode, MeshHeader, log, LOG
+from uart_framing import FrameReader, encode_into, OVERHEAD as FRAME_OVERHEAD
+
+try:
+    ThreadSafeFlag = asyncio.ThreadSafeFlag
+except AttributeError:
+    # CPython: прерываний нет, флаг ставится из того же цикла событий
+    class ThreadSafeFlag:
+        def __init__(self):
+            self._event = asyncio.Event()
+
+        def set(self):
+            self._event.set()
+
+        async def wait(self):
+            await self._event.wait()
+            self._event.clear()
+
+
+# =============================================================================
+# TRANSCEIVER
+# =============================================================================
+
+class AsyncLoRaTransceiver:
+    """Модуль E32 поверх потоков asyncio; uart/aux — настоящие или из sim_uart.py"""
+
+    AUX_TIMEOUT_MS = 1000
+    READ_CHUNK = 128
+
+    def __init__(self, reader, writer, aux):
+        self.reader = reader
+        self.writer = writer
+        self.aux = aux
+        self.rx = FrameReader()
+        self.chunk = b''       # прочитанное, но ещё не поместившееся в rx
+        self.chunk_pos = 0
+        self.tx_buf = bytearray(MeshHeader.MAX_PACKET_SIZE + FRAME_OVERHEAD)
+        self.tx_mv = memoryview(self.tx_buf)
+        self.aux_ready = ThreadSafeFlag()
+        # AUX поднимается, когда модуль отправил кадр и снова готов
+        aux.irq(handler=self._on_aux, trigger=getattr(aux, 'IRQ_RISING', 1))
+
+    @classmethod
+    def from_config(cls, config):
+        """Железо: пины и UART из config_common, как в LoRaTransceiver"""
+        import machine
+
+        m0 = machine.Pin(config.LORA_M0, machine.Pin.OUT)
+        m1 = machine.Pin(config.LORA_M1, machine.Pin.OUT)
+        m0.value(0)
+        m1.value(0)
+        time.sleep_ms(100)
+
+        uart = machine.UART(
+            config.LORA_UART_NUM,
+            baudrate=config.LORA_BAUDRATE,
+            tx=machine.Pin(config.LORA_TX),
+            rx=machine.Pin(config.LORA_RX)
+        )
+        aux = machine.Pin(config.LORA_AUX, machine.Pin.IN)
+        log(f"Async LoRa init, node={config.NODE_ID}", LOG.INFO)
+        return cls(asyncio.StreamReader(uart), asyncio.StreamWriter(uart, {}), aux)
+
+    def _on_aux(self, pin):
+        # Обработчик прерывания: ничего не выделяем, только будим задачу
+        self.aux_ready.set()
+
+    def is_ready(self):
+        return self.aux.value() == 1
+
+    async def wait_ready(self):
+        """Ожидание AUX=HIGH без опроса; False по таймауту"""
+        while not self.is_ready():
+            try:
+                await asyncio.wait_for(self.aux_ready.wait(), self.AUX_TIMEOUT_MS / 1000)
+            except asyncio.TimeoutError:
+                log("AUX timeout", LOG.WARN)
+                return False
+        return True
+
+    async def read_frame(self):
+        """Следующий пакет (memoryview, действителен до следующего вызова)"""
+        while True:
+            # Сначала досыпаем остаток прошлого чтения: буфер кадров мог быть полон
+            if self.chunk_pos < len(self.chunk):
+                self.chunk_pos += self.rx.feed(self.chunk, self.chunk_pos)
+            frame = self.rx.next_frame()
+            if frame is not None:
+                return frame
+            if self.chunk_pos >= len(self.chunk):
+                self.chunk = await self.reader.read(self.READ_CHUNK)
+                self.chunk_pos = 0
+                if not self.chunk:
+                    raise EOFError("LoRa UART closed")
+
+    async def write_frame(self, data):
+        try:
+            n = encode_into(data, self.tx_buf)
+            self.writer.write(self.tx_mv[:n])
+            await self.writer.drain()
+            return True
+        except Exception as e:
+            log(f"TX error: {e}", LOG.ERROR)
+            return False
+
+
+# =============================================================================
+# MESH NODE
+# =============================================================================
+
+class AsyncMeshNode(MeshNode):
+    """
+    MeshNode, работающий задачами asyncio.
+    send() по-прежнему только ставит сообщение в очередь передачи;
+    входящие сообщения — через await receive()
+    """
+
+    TIMER_TICK_MS = 100
+    AUX_RETRY_MS = 200
+
+    def __init__(self, config, transceiver):
+        super().__init__(config, transceiver=transceiver)
+        self.tx_wake = asyncio.Event()
+        self.rx_wake = asyncio.Event()
+        self.delivery_wake = asyncio.Event()
+        self.tasks = []
+
+    def start(self):
+        """Запустить задачи приёма, передачи и таймеров в текущем цикле событий"""
+        self.tasks = [
+            asyncio.create_task(self._rx_task()),
+            asyncio.create_task(self._tx_task()),
+            asyncio.create_task(self._timer_task()),
+        ]
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+    # --- события для задач ---
+
+    def _enqueue(self, *args, **kwargs):
+        ok = super()._enqueue(*args, **kwargs)
+        if ok:
+            self.tx_wake.set()
+        return ok
+
+    def _delivery_event(self, msg_id, delivered):
+        super()._delivery_event(msg_id, delivered)
+        self.delivery_wake.set()
+
+    # --- задачи ---
+
+    async def _rx_task(self):
+        while True:
+            # EOFError (UART закрыт) завершает задачу; ошибка разбора — только этот кадр
+            frame = await self.lora.read_frame()
+            try:
+                self._process_raw(frame)
+            except Exception as e:
+                log(f"RX error: {e}", LOG.ERROR)
+            # Приложение не успевает забирать — старые выбрасываем, как poll()
+            while len(self.completed_messages) > self.MAX_COMPLETED_MESSAGES:
+                self.completed_messages.pop(0)
+            if self.completed_messages:
+                self.rx_wake.set()
+
+    async def _tx_task(self):
+        while True:
+            now = time.ticks_ms()
+            job = self._next_job(now)
+            if job is None:
+                # Спим до срока ближайшего задания или до нового send()
+                wait_ms = self._next_due_ms(now)
+                self.tx_wake.clear()
+                try:
+                    if wait_ms is None:
+                        await self.tx_wake.wait()
+                    else:
+                        await asyncio.wait_for(self.tx_wake.wait(), wait_ms / 1000)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if not await self.lora.wait_ready():
+                # Модуль не поднял AUX: передышка, чтобы не долбить его вплотную
+                await asyncio.sleep(self.AUX_RETRY_MS / 1000)
+                continue
+            # Пока ждали AUX, мог прийти ACK с более высоким приоритетом
+            now = time.ticks_ms()
+            job = self._next_job(now)
+            if job is None:
+                continue
+            try:
+                ok = await self.lora.write_frame(self._take_frame(job))
+                self._frame_done(job, ok, now)
+            except Exception as e:
+                log(f"TX error: {e}", LOG.ERROR)
+                # Снимаем задание как неотправленное, иначе оно будет падать вечно,
+                # а его сообщение так и не получит итога доставки
+                if job in self.tx_queue:
+                    self._frame_done(job, False, now)
+
+    async def _timer_task(self):
+        while True:
+            try:
+                self._cleanup()
+                self._check_ack_timeouts()
+                self._check_assembly_gaps()
+            except Exception as e:
+                log(f"Timer error: {e}", LOG.ERROR)
+            await asyncio.sleep(self.TIMER_TICK_MS / 1000)
+
+    # --- API приложения ---
+
+    async def receive(self):
+        """Дождаться следующего сообщения: (header, data)"""
+        while not self.completed_messages:
+            self.rx_wake.clear()
+            await self.rx_wake.wait()
+        return self.completed_messages.pop(0)
+
+    async def wait_delivery(self):
+        """Дождаться итогов доставки: [(msg_id из send(), доставлено?)]"""
+        while not self.delivery_events:
+            self.delivery_wake.clear()
+            await self.delivery_wake.wait()
+        return self.pop_delivery_events()
+
+    def poll(self):
+        raise RuntimeError("AsyncMeshNode works through start()/receive()")
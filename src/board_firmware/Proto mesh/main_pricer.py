@@ -5,6 +5,7 @@ import time
 import json
 
 import config_common as config
+import price_codec
 from lora_mesh import MeshNode, log, LOG
 from constants import MSG_TYPE, MSG_TARGET
 
@@ -90,6 +91,12 @@ def handle_message(header, data):
         except Exception as e:
             log(f"[PRICER] Parse error: {e}", LOG.ERROR)
     
+    elif msg_type == MSG_TYPE.SET_PRICE_BIN:
+        try:
+            set_price(price_codec.decode_price(data))
+        except Exception as e:
+            log(f"[PRICER] Parse error: {e}", LOG.ERROR)
+    
     elif msg_type == MSG_TYPE.PING:
         node.send("PONG", to_node=from_node, msg_type=MSG_TYPE.PONG)
 
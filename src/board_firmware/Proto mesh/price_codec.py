@@ -0,0 +1,77 @@
+"""
+price_codec.py
+Эталонный декодер бинарного формата цены (MSG_TYPE.SET_PRICE_BIN).
+Кодирует backend (board_site/backend/app/core/price_codec.py) — формат
+в обоих файлах должен совпадать.
+
+Байт    | Назначение
+--------|------------------------------------------
+0       | биты 4-7: версия формата, бит 0: есть скидка
+1-4     | res_price.rubs (uint32)
+5       | res_price.kopecks
+        | если есть скидка:
++0..+3  |   base_price.rubs (uint32)
++4      |   base_price.kopecks
++5..+6  |   discount * 100 (uint16, сотые доли процента)
++0      | длина названия в байтах
++1..    | название (utf-8)
+"""
+
+import struct
+
+FORMAT_VERSION = 1
+FLAG_DISCOUNT = 0x01
+
+
+def decode_price(data):
+    """
+    Разбор цены в тот же dict, что приходит в JSON (SET_PRICE):
+    {"name": ..., "res_price": {...}, "discount": {...} или None}
+    """
+    flags = data[0]
+    if (flags >> 4) != FORMAT_VERSION:
+        raise ValueError("Unknown price format: {}".format(flags >> 4))
+
+    rubs, kopecks = struct.unpack_from(">IB", data, 1)
+    offset = 6
+
+    discount = None
+    if flags & FLAG_DISCOUNT:
+        base_rubs, base_kopecks, discount_x100 = struct.unpack_from(">IBH", data, offset)
+        offset += 7
+        discount = {
+            "base_price": {"rubs": base_rubs, "kopecks": base_kopecks},
+            "discount": discount_x100 / 100
+        }
+
+    name_len = data[offset]
+    offset += 1
+    name = bytes(data[offset:offset + name_len]).decode("utf-8")
+
+    return {
+        "name": name,
+        "res_price": {"rubs": rubs, "kopecks": kopecks},
+        "discount": discount
+    }
+
+
+def iter_mesh_records(body):
+    """
+    Разбор ответа /board_host/unsync_boards/mesh (формат — board_mesh_record
+    в backend); единственная копия, её же импортирует шлюз (board_gateway).
+    Отдаёт (board_id, sync_version, price) — price это memoryview на цену
+    SET_PRICE_BIN, её можно сразу отдавать в MeshNode.send;
+    sync_version — для подтверждения в /board_host/outbox/ack
+    """
+    view = memoryview(body)
+    offset = 0
+    while offset < len(view):
+        id_len = view[offset]
+        offset += 1
+        board_id = bytes(view[offset:offset + id_len]).decode("utf-8")
+        offset += id_len
+
+        sync_version, size = struct.unpack_from(">IH", view, offset)
+        offset += 6
+        yield board_id, sync_version, view[offset:offset + size]
+        offset += size
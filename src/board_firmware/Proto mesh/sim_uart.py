@@ -0,0 +1,197 @@
+"""
+sim_uart.py
+Симуляция эфира для lora_mesh_async.py под CPython (без ESP32 и E32).
+
+Эфир полудуплексный и общий: кадр занимает airtime_ms, пока он в эфире,
+AUX у всех модулей низкий; по окончании кадр получают все, кроме
+отправителя (с вероятностью потери loss), и у всех срабатывает AUX-прерывание
+(в случайном порядке — кто первым займёт эфир).
+
+    python sim_uart.py --tags 4 --messages 20 --loss 0.1
+    python sim_uart.py --tags 4 --messages 20 --loss 0.1 --no-selective
+    python sim_uart.py --tags 4 --messages 20 --loss 0.1 --no-relay
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+
+def install_time_shims():
+    """time.ticks_ms и компания из MicroPython поверх time.monotonic"""
+    if hasattr(time, 'ticks_ms'):
+        return
+    time.ticks_ms = lambda: int(time.monotonic() * 1000)
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+
+
+class SimAir:
+    def __init__(self, airtime_ms=120, loss=0.0, seed=None):
+        self.airtime = airtime_ms / 1000
+        self.loss = loss
+        self.rnd = random.Random(seed)
+        self.radios = []
+        self.busy_until = 0.0
+        self.frames = 0
+
+    def attach(self):
+        radio = SimRadio(self)
+        self.radios.append(radio)
+        return radio
+
+    def transmit(self, sender, data):
+        loop = asyncio.get_running_loop()
+        start = max(loop.time(), self.busy_until)
+        self.busy_until = start + self.airtime
+        self.frames += 1
+        loop.call_at(self.busy_until, self._deliver, sender, bytes(data))
+
+    def _deliver(self, sender, data):
+        for radio in self.radios:
+            if radio is not sender and self.rnd.random() >= self.loss:
+                radio.reader.feed_data(data)
+        # Кто первым займёт освободившийся эфир — случайно: в порядке подключения
+        # последние модули не дожидались бы эфира никогда
+        waiting = list(self.radios)
+        self.rnd.shuffle(waiting)
+        for radio in waiting:
+            radio.aux.fire()
+
+
+class SimPin:
+    """AUX: высокий, когда эфир свободен"""
+
+    IRQ_RISING = 1
+
+    def __init__(self, air):
+        self.air = air
+        self.handler = None
+
+    def value(self):
+        return 1 if asyncio.get_running_loop().time() >= self.air.busy_until else 0
+
+    def irq(self, handler=None, trigger=None):
+        self.handler = handler
+
+    def fire(self):
+        if self.handler is not None and self.value():
+            self.handler(self)
+
+
+class SimRadio:
+    """UART одного модуля: reader — asyncio.StreamReader, writer — сам объект"""
+
+    def __init__(self, air):
+        self.air = air
+        self.reader = asyncio.StreamReader()
+        self.aux = SimPin(air)
+
+    def write(self, data):
+        self.air.transmit(self, data)
+
+    async def drain(self):
+        pass
+
+
+def make_config(node_id, **overrides):
+    import config_common
+
+    config = type('SimConfig', (), {})()
+    for key in dir(config_common):
+        if key.isupper():
+            setattr(config, key, getattr(config_common, key))
+    config.NODE_ID = node_id
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+async def demo(tags=3, messages=12, loss=0.0, airtime_ms=120, relay=True, selective=True):
+    from lora_mesh_async import AsyncLoRaTransceiver, AsyncMeshNode
+    from constants import MSG_TYPE
+
+    air = SimAir(airtime_ms=airtime_ms, loss=loss, seed=1)
+
+    def make_node(node_id):
+        radio = air.attach()
+        transceiver = AsyncLoRaTransceiver(radio.reader, radio, radio.aux)
+        # Ретрансляция включена, как в config_common на устройствах: все узлы слышат
+        # друг друга, и она только нагружает эфир и очереди — это и проверяем
+        config = make_config(node_id, LOG_LEVEL=1, RELAY_ENABLED=relay, SELECTIVE_REPEAT=selective)
+        node = AsyncMeshNode(config, transceiver)
+        node.start()
+        return node
+
+    hub = make_node(1)
+    pricers = [make_node(node_id) for node_id in range(2, tags + 2)]
+
+    received = []
+
+    async def pricer_app(node):
+        while True:
+            header, data = await node.receive()
+            received.append((node.node_id, data))
+
+    apps = [asyncio.create_task(pricer_app(node)) for node in pricers]
+
+    started = time.monotonic()
+    results = {}
+    sent = 0
+    while sent < messages or len(results) < sent:
+        # Держим в полёте не больше сообщений, чем ценников
+        while sent < messages and sent - len(results) < tags:
+            to_node = pricers[sent % tags].node_id
+            payload = '{"name":"Tea %d","res_price":{"rubs":%d,"kopecks":99}}' % (sent, 100 + sent)
+            if hub.send(payload, to_node=to_node, msg_type=MSG_TYPE.SET_PRICE, need_ack=True) is None:
+                break
+            sent += 1
+        for msg_id, delivered in await hub.wait_delivery():
+            results[msg_id] = delivered
+
+    elapsed = time.monotonic() - started
+    for task in apps:
+        task.cancel()
+    for node in [hub] + pricers:
+        node.stop()
+
+    delivered = sum(1 for ok in results.values() if ok)
+    return {
+        "messages": messages,
+        "delivered": delivered,
+        "received": len(received),
+        "frames_on_air": air.frames,
+        "elapsed_s": round(elapsed, 2),
+        "hub": hub.get_stats(),
+        # Очередь передачи переполнялась у ценников, а не у хаба: видно только по всем узлам
+        "dropped_tx_full": {node.node_id: node.get_stats()['dropped_tx_full'] for node in [hub] + pricers},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tags", type=int, default=3)
+    parser.add_argument("--messages", type=int, default=12)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--airtime-ms", type=int, default=120)
+    parser.add_argument("--no-relay", dest="relay", action="store_false",
+                        help="выключить ретрансляцию на всех узлах")
+    parser.add_argument("--no-selective", dest="selective", action="store_false",
+                        help="повтор сообщения целиком с новым msg_id, без NACK")
+    args = parser.parse_args()
+
+    # Рядом с прошивкой на устройстве лежит config_common.py из board_firmware
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:0] = [here, os.path.dirname(here)]
+    install_time_shims()
+
+    print(asyncio.run(demo(args.tags, args.messages, args.loss, args.airtime_ms,
+                                 args.relay, args.selective)))
+
+
+if __name__ == "__main__":
+    main()
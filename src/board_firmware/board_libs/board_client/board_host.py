@@ -20,6 +20,54 @@ def get_unsynced_board_data() -> str | None:
         print("Error fetching board:", e)
         return None
 
+def get_unsynced_boards_data(limit: int = 50) -> str | None:
+    """
+    Пачка ценников в аренду на GATEWAY_LEASE_SECONDS: другой шлюз их не получит.
+    Подтверждать через confirm_boards; неподтверждённые вернутся после аренды.
+    Листать не нужно — следующий вызов отдаст ещё не выданные ценники,
+    непустой "cursor" в ответе значит, что пачка полная и есть ещё
+    """
+    try:
+        url = f"{HOST}/board_host/unsync_boards?limit={limit}"
+        resp = urequests.get(url, headers=HEADERS)
+        if resp.status_code == 200:
+            data = resp.text
+            return data
+        else:
+            resp.close()
+            return None
+    except Exception as e:
+        print("Error fetching boards:", e)
+        return None
+
+def claim_boards_data(limit: int = 20, zone: str | None = None) -> str | None:
+    try:
+        url = f"{HOST}/board_host/claim?limit={limit}"
+        if zone:
+            url += f"&zone={zone}"
+        resp = urequests.post(url, headers=HEADERS)
+        if resp.status_code == 200:
+            data = resp.text
+            return data
+        else:
+            resp.close()
+            return None
+    except Exception as e:
+        print("Error claiming boards:", e)
+        return None
+
+def ack_boards(items: list) -> bool:
+    """items — [{"board_id": ..., "sync_version": ...}] из ответа claim"""
+    try:
+        url = f"{HOST}/board_host/outbox/ack"
+        payload = {"items": items}
+        resp = urequests.post(url, json=payload, headers=HEADERS)
+        resp.close()
+        return resp.status_code == 200
+    except Exception as e:
+        print("Error acking boards:", e)
+        return False
+
 def confirm_board(board_id: str) -> bool:
     try:
         url = f"{HOST}/board_host/confirm_board"
@@ -31,3 +79,13 @@ def confirm_board(board_id: str) -> bool:
         print("Error confirming board:", e)
         return False
 
+def confirm_boards(board_ids: list) -> bool:
+    try:
+        url = f"{HOST}/board_host/confirm_boards"
+        payload = {"board_ids": board_ids}
+        resp = urequests.post(url, json=payload, headers=HEADERS)
+        resp.close()
+        return resp.status_code == 200
+    except Exception as e:
+        print("Error confirming boards:", e)
+        return False
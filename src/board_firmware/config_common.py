@@ -27,6 +27,8 @@ RELAY_ENABLED = True
 # --- ТАЙМАУТЫ ---
 ACK_TIMEOUT_MS = 3000
 MAX_SEND_RETRIES = 3
+SELECTIVE_REPEAT = True  # Досылать только потерянные фрагменты (NACK) под тем же msg_id
+NACK_GAP_MS = 1500       # Пауза во фрагментах, после которой получатель шлёт NACK
 SEND_ID_EVERY_X_SECONDS = 300
 
 # --- БУФЕРЫ ---
@@ -4,6 +4,7 @@ import time
 
 import utils
 from constants import LOG
+from uart_framing import FrameReader, encode
 
 # TODO
 # from constants import LoRaConst
@@ -41,6 +42,9 @@ class LoRaMini:
             rx=machine.Pin(config.LORA_RX)
         )
         
+        # Границы сообщений — кадры uart_framing, а не паузы на линии
+        self.rx = FrameReader()
+        
         utils.log(f"[LoRaMini] Node {config.NODE_NAME} inited", LOG.INFO)
     
     def set_mode_normal(self):
@@ -100,9 +104,10 @@ class LoRaMini:
         
         # Отправка
         try:
-            bytes_written = self.uart.write(string_bytes)
+            frame = encode(string_bytes)
+            bytes_written = self.uart.write(frame)
             
-            if bytes_written == len(string_bytes):                
+            if bytes_written == len(frame):                
                 # Добавление в историю
                 self.history.add(id)
                 
@@ -116,7 +121,7 @@ class LoRaMini:
                     f"[ERROR] Sent not all: {bytes_written}/{len(string_bytes)} bytes",
                     level=LOG.ERROR
                 )
-                return -bytes_written # not all
+                return -bytes_written # not all (с учетом байтов кадра)
             
         except Exception as e:
             utils.log(f"[ERROR] Sending error: {e}", LOG.ERROR)
@@ -130,26 +135,22 @@ class LoRaMini:
             Строка или None
         """
         start_time = time.ticks_ms()
-        last_data_time = start_time
-        buffer = b''
+        payload = None
 
-        while time.ticks_diff(time.ticks_ms(), start_time) < timeout_ms:
-            if self.uart.any():
-                chunk = self.uart.read()
-                if chunk:
-                    buffer += chunk
-                    last_data_time = time.ticks_ms()
-            
-            # Если прошло N мс без данных - считаем пакет полным
-            if buffer and time.ticks_diff(time.ticks_ms(), last_data_time) > 50:
+        while True:
+            self.rx.feed_from(self.uart)
+            frame = self.rx.next_frame()
+            if frame is not None:
+                payload = bytes(frame)
+                break
+            if time.ticks_diff(time.ticks_ms(), start_time) >= timeout_ms:
                 break
-            
             time.sleep_ms(10)
         
-        if buffer:
+        if payload:
             try:
                 # Декодируем байты обратно в строку UTF-8
-                return buffer.decode('utf-8')
+                return payload.decode('utf-8')
             except UnicodeDecodeError:
                 utils.log("[ERROR] lora.receive_msg(): can't decode", LOG.ERROR)
         
@@ -0,0 +1,194 @@
+# uart_framing.py
+"""
+Кадры на UART между ESP32 и модулем E32.
+
+Модуль в прозрачном режиме отдаёт поток байтов без границ пакетов:
+два пакета подряд от соседей склеиваются. Поэтому каждый пакет
+оборачивается в кадр:
+
+Байт      | Назначение
+----------|------------------------------------------
+0-1       | SYNC (0xA5 0x5A)
+2         | длина полезной нагрузки N (0..MAX_PAYLOAD)
+3..3+N-1  | полезная нагрузка
+3+N..4+N  | CRC-16/CCITT-FALSE по байту длины и нагрузке (big-endian)
+
+FrameReader разбирает кадры из кольцевого буфера, выделенного один раз:
+несколько кадров за одно чтение отдаются сразу, мусор и обрывки
+пропускаются поиском следующего SYNC.
+"""
+
+from array import array
+
+SYNC0 = 0xA5
+SYNC1 = 0x5A
+OVERHEAD = 5            # SYNC + длина + CRC
+MAX_PAYLOAD = 250
+MAX_FRAME = MAX_PAYLOAD + OVERHEAD
+
+
+def _make_crc_table():
+    table = array('H', [0] * 256)
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table[i] = crc & 0xFFFF
+    return table
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def crc16(data, crc=0xFFFF):
+    """CRC-16/CCITT-FALSE; data — bytes, bytearray или memoryview"""
+    table = _CRC_TABLE
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+    return crc
+
+
+def _crc_len(n):
+    """CRC после байта длины — начальное значение для нагрузки"""
+    return ((0xFFFF << 8) & 0xFFFF) ^ _CRC_TABLE[0xFF ^ n]
+
+
+def encode_into(payload, out):
+    """
+    Записать кадр с payload в начало out (bytearray >= len(payload) + OVERHEAD).
+    Возвращает длину кадра
+    """
+    n = len(payload)
+    if n > MAX_PAYLOAD:
+        raise ValueError("Frame payload too big: {}".format(n))
+    out[0] = SYNC0
+    out[1] = SYNC1
+    out[2] = n
+    out[3:3 + n] = payload
+    crc = crc16(payload, _crc_len(n))
+    out[3 + n] = crc >> 8
+    out[4 + n] = crc & 0xFF
+    return n + OVERHEAD
+
+
+def encode(payload):
+    out = bytearray(len(payload) + OVERHEAD)
+    encode_into(payload, out)
+    return out
+
+
+class FrameReader:
+    """
+    Разбор кадров из кольцевого буфера.
+
+    Источник — UART с readinto() (feed_from) или готовые куски байтов (feed).
+    next_frame() возвращает memoryview полезной нагрузки — он действителен
+    до следующего вызова feed()/feed_from()/next_frame()
+    """
+
+    def __init__(self, size=512):
+        # Полный буфер обязан содержать целый кадр, иначе разбор встанет
+        if size <= MAX_FRAME:
+            raise ValueError("FrameReader buffer must be larger than {}".format(MAX_FRAME))
+        self.size = size
+        self.buf = bytearray(size)
+        self.mv = memoryview(self.buf)
+        # Кадр, переходящий через конец кольца, собирается здесь
+        self.scratch = bytearray(MAX_FRAME)
+        self.scratch_mv = memoryview(self.scratch)
+        self.head = 0    # начало непрочитанных данных
+        self.count = 0   # сколько байтов непрочитано
+        self.stats = {'frames': 0, 'crc_errors': 0, 'skipped': 0}
+
+    # --- приём ---
+
+    def free(self):
+        return self.size - self.count
+
+    def _tail(self):
+        tail = self.head + self.count
+        return tail - self.size if tail >= self.size else tail
+
+    def feed_from(self, uart):
+        """
+        Дочитать из UART сколько поместится, без промежуточных bytes.
+        Не поместившееся остаётся в буфере UART до следующего вызова
+        """
+        total = 0
+        while self.count < self.size and uart.any():
+            tail = self._tail()
+            end = min(self.size, tail + self.free())
+            n = uart.readinto(self.mv[tail:end])
+            if not n:
+                break
+            self.count += n
+            total += n
+        return total
+
+    def feed(self, data, start=0):
+        """
+        Добавить байты data[start:] (например, из asyncio.StreamReader).
+        Возвращает, сколько поместилось: остаток подать после next_frame()
+        """
+        pos = start
+        length = len(data)
+        while pos < length and self.count < self.size:
+            tail = self._tail()
+            n = min(length - pos, self.size - tail, self.free())
+            self.buf[tail:tail + n] = data[pos:pos + n]
+            self.count += n
+            pos += n
+        return pos - start
+
+    # --- разбор ---
+
+    def _at(self, offset):
+        pos = self.head + offset
+        return self.buf[pos - self.size if pos >= self.size else pos]
+
+    def _skip(self, n):
+        self.head += n
+        if self.head >= self.size:
+            self.head -= self.size
+        self.count -= n
+
+    def _view(self, offset, n):
+        """n байтов с offset от head одним куском: прямо из кольца или через scratch"""
+        start = self.head + offset
+        if start >= self.size:
+            start -= self.size
+        if start + n <= self.size:
+            return self.mv[start:start + n]
+        first = self.size - start
+        self.scratch[:first] = self.mv[start:self.size]
+        self.scratch[first:n] = self.mv[0:n - first]
+        return self.scratch_mv[:n]
+
+    def next_frame(self):
+        """Следующая полезная нагрузка (memoryview) или None, если целого кадра пока нет"""
+        while self.count >= OVERHEAD:
+            if self._at(0) != SYNC0 or self._at(1) != SYNC1:
+                self._skip(1)
+                self.stats['skipped'] += 1
+                continue
+
+            n = self._at(2)
+            if n > MAX_PAYLOAD:
+                self._skip(1)
+                self.stats['skipped'] += 1
+                continue
+            if self.count < n + OVERHEAD:
+                return None  # кадр ещё не дошёл целиком
+
+            payload = self._view(3, n)
+            expected = (self._at(3 + n) << 8) | self._at(4 + n)
+            if crc16(payload, _crc_len(n)) != expected:
+                # Ложный SYNC внутри данных или битый кадр: ищем дальше со следующего байта
+                self._skip(1)
+                self.stats['crc_errors'] += 1
+                continue
+
+            self._skip(n + OVERHEAD)
+            self.stats['frames'] += 1
+            return payload
+        return None
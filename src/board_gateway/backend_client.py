@@ -0,0 +1,119 @@
+"""
+Клиент backend для шлюза: одно постоянное HTTP/1.1 соединение
+на весь процесс вместо нового соединения на каждый вызов.
+"""
+
+import http.client
+import json
+from urllib.parse import urlsplit, urlencode
+
+from firmware import iter_mesh_records
+
+
+class BackendError(Exception):
+    pass
+
+
+class BackendClient:
+    # Ошибки, после которых соединение пересоздаём и повторяем запрос один раз:
+    # сервер закрыл простаивавшее keep-alive соединение
+    RECONNECT_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                        ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, base_url, token, timeout=30.0):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port
+        self.https = url.scheme == "https"
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self.conn = None
+        self.requests = 0
+        self.connects = 0
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        self.conn = cls(self.host, self.port, timeout=self.timeout)
+        self.connects += 1
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def request(self, method, path, params=None, body=None):
+        response, data = self.exchange(method, path, params, body)
+        return json.loads(data) if data else None
+
+    def exchange(self, method, path, params=None, body=None):
+        """Запрос без разбора тела: (ответ, байты тела)"""
+        url = self.prefix + path
+        if params:
+            url += "?" + urlencode({k: v for k, v in params.items() if v is not None})
+        payload = json.dumps(body).encode() if body is not None else None
+
+        for attempt in (1, 2):
+            if self.conn is None:
+                self._connect()
+            try:
+                self.conn.request(method, url, body=payload, headers=self.headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                break
+            except self.RECONNECT_ERRORS:
+                self.close()
+                if attempt == 2:
+                    raise
+            except (OSError, http.client.HTTPException):
+                self.close()
+                raise
+
+        self.requests += 1
+        if response.will_close:
+            self.close()
+        if response.status >= 400:
+            raise BackendError(f"{method} {path}: {response.status} {data[:200]!r}")
+        return response, data
+
+    # --- ручки /board_host ---
+
+    def claim(self, limit, zone=None, lease_seconds=None):
+        """Пачка ценников в аренду: [{"sync_version", "board": {...}, ...}]"""
+        result = self.request("POST", "/board_host/claim",
+                              params={"limit": limit, "zone": zone, "lease_seconds": lease_seconds})
+        return result["entries"]
+
+    def claim_mesh(self, limit, zone=None, lease_seconds=None):
+        """
+        То же в аренду, но готовыми бинарными ценами (SET_PRICE_BIN) для
+        MeshNode.send на хабе: [(board_id, sync_version, тело)]
+        """
+        _, data = self.exchange("GET", "/board_host/unsync_boards/mesh",
+                                 params={"limit": limit, "zone": zone,
+                                         "lease_seconds": lease_seconds})
+        return [(board_id, sync_version, bytes(price))
+                for board_id, sync_version, price in iter_mesh_records(data)]
+
+    def ack(self, items):
+        """items — [{"board_id", "sync_version"}] доставленных по ACK ценников"""
+        return self.request("POST", "/board_host/outbox/ack", body={"items": items})
+
+    def release(self, items, retry_after=0):
+        """
+        items — [{"board_id", "sync_version"}] ценников, которые шлюз не доставит:
+        аренда снимается, запись вернётся в выдачу через retry_after секунд
+        """
+        return self.request("POST", "/board_host/outbox/release",
+                            params={"retry_after": retry_after}, body={"items": items})
+
+    def send_presence(self, heartbeats):
+        return self.request("POST", "/board_host/presence", body={"heartbeats": heartbeats})
+
+    def send_telemetry(self, snapshots, latencies):
+        return self.request("POST", "/board_host/telemetry",
+                            body={"snapshots": snapshots, "latencies": latencies})
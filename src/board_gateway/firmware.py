@@ -0,0 +1,22 @@
+"""
+Модули прошивки (board_firmware/Proto mesh), общие со шлюзом: разбор бинарных
+записей backend, размер данных mesh-фрагмента и типы сообщений берутся
+из одного места и не расходятся с тем, что крутится на хабе.
+"""
+
+import os
+import sys
+
+FIRMWARE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                             os.pardir, "board_firmware"))
+PROTO_MESH_DIR = os.path.join(FIRMWARE_DIR, "Proto mesh")
+
+# Как в sim_uart.py: Proto mesh раньше корня прошивки, там свой constants.py
+if PROTO_MESH_DIR not in sys.path:
+    sys.path[:0] = [PROTO_MESH_DIR, FIRMWARE_DIR]
+
+from constants import MSG_TYPE
+from lora_mesh import MeshHeader
+from price_codec import iter_mesh_records
+
+FRAGMENT_DATA_SIZE = MeshHeader.DATA_SIZE
@@ -0,0 +1,331 @@
+"""
+Шлюз backend -> LoRa-хаб: долгоживущий процесс на CPython.
+
+Забирает ценники из backend пачками в аренду (/board_host/claim) по одному
+keep-alive соединению (с --binary — готовыми бинарными ценами из
+/board_host/unsync_boards/mesh), отдаёт их хабу по последовательному порту конвейером
+с ограниченным окном неподтверждённых сообщений и подтверждает в backend
+(/board_host/outbox/ack) только после mesh-ACK от ценника. Недоставленное
+не подтверждается: аренда истечёт, и ценник будет выдан снова. Ценники без
+номера узла в id шлюз отпускает (/board_host/outbox/release) с отсрочкой.
+Пока backend недоступен, подтверждения и присутствие с телеметрией копятся
+в ограниченных буферах и потом уходят пачками в пределах лимитов backend.
+Формат бинарных записей и размер фрагмента берутся из кода прошивки
+(firmware.py), поэтому рядом должен лежать каталог board_firmware.
+
+    python gateway.py --backend http://localhost:8000 --token ... --serial /dev/ttyUSB0
+    python gateway.py --backend http://localhost:8000 --token ... --loopback --duration 60
+"""
+
+import argparse
+import base64
+import collections
+import itertools
+import json
+import os
+import re
+import signal
+import time
+
+from backend_client import BackendClient, BackendError
+from hub_link import SerialHubLink, LoopbackHub, MSG_TYPE_SET_PRICE, MSG_TYPE_SET_PRICE_BIN
+
+# pricer_000123 -> узел 123
+NODE_ID_RE = re.compile(r"(\d+)$")
+
+# Лимиты одного запроса в backend (MAX_BATCH_SIZE, MAX_PRESENCE_BATCH
+# и MAX_TELEMETRY_BATCH в routers/board_host.py)
+ACK_CHUNK = 500
+PRESENCE_CHUNK = 5000
+TELEMETRY_CHUNK = 5000
+# Сколько записей присутствия и телеметрии держать, пока backend недоступен:
+# сверх этого вытесняются самые старые
+MAX_BUFFERED = 20000
+# Ценник без номера узла не доставить, пока его не переименуют
+UNADDRESSABLE_RETRY_SECONDS = 600
+
+
+def take(buffer, count):
+    return list(itertools.islice(buffer, count))
+
+
+def drop(buffer, count):
+    for _ in range(count):
+        buffer.popleft()
+
+
+def node_for_board(board_id: str):
+    match = NODE_ID_RE.search(board_id or "")
+    return int(match.group(1)) if match else None
+
+
+class RateMeter:
+    """Доставленные обновления в минуту за скользящее окно"""
+
+    def __init__(self, window=60.0):
+        self.window = window
+        self.events = collections.deque()
+        self.total = 0
+
+    def add(self, now):
+        self.events.append(now)
+        self.total += 1
+
+    def per_minute(self, now):
+        while self.events and self.events[0] < now - self.window:
+            self.events.popleft()
+        return len(self.events) * 60.0 / self.window
+
+
+class Gateway:
+    def __init__(self, client, link, window=8, batch=32, zone=None, lease_seconds=60,
+                 ack_timeout=20.0, ack_batch=50, flush_interval=1.0, idle_sleep=1.0,
+                 report_interval=10.0, binary=False):
+        self.client = client
+        self.link = link
+        self.window = window
+        self.batch = batch
+        self.zone = zone
+        self.lease_seconds = lease_seconds
+        self.ack_timeout = ack_timeout
+        self.ack_batch = ack_batch
+        self.flush_interval = flush_interval
+        self.idle_sleep = idle_sleep
+        self.report_interval = report_interval
+        self.binary = binary
+
+        self.queue = collections.deque()  # ждут отправки хабу
+        self.inflight = {}                # seq -> (entry, node, время отправки хабу или выхода в эфир)
+        self.seq = 0
+        self.acks = collections.deque()   # подтверждения для backend
+        self.releases = collections.deque()  # ценники, от которых шлюз отказался
+        self.heartbeats = collections.deque(maxlen=MAX_BUFFERED)
+        self.snapshots = collections.deque(maxlen=MAX_BUFFERED)
+        self.latencies = collections.deque(maxlen=MAX_BUFFERED)
+        self.next_claim = 0.0
+        self.next_flush = 0.0
+        self.next_report = time.monotonic() + report_interval
+        self.delivered = RateMeter()
+        self.failed = 0
+        self.started = time.monotonic()
+        self.running = True
+
+    # --- backend ---
+
+    def refill(self, now):
+        # Берём новую пачку, когда очередь почти пуста: аренда не тратится
+        # на ценники, которые долго ждали бы своей очереди в эфир
+        if self.queue or now < self.next_claim:
+            return
+        try:
+            if self.binary:
+                entries = [
+                    {"board": {"board_id": board_id}, "sync_version": sync_version, "mesh": body}
+                    for board_id, sync_version, body in self.client.claim_mesh(
+                        self.batch, zone=self.zone, lease_seconds=self.lease_seconds)
+                ]
+            else:
+                entries = self.client.claim(self.batch, zone=self.zone, lease_seconds=self.lease_seconds)
+        except (BackendError, OSError) as e:
+            print(f"Claim failed: {e}")
+            entries = []
+        if not entries:
+            self.next_claim = now + self.idle_sleep
+            return
+        for entry in entries:
+            board = entry["board"]
+            node = node_for_board(board["board_id"])
+            if node is None:
+                print(f"Skip {board['board_id']}: no mesh node id in board id")
+                self.releases.append({"board_id": board["board_id"],
+                                      "sync_version": entry["sync_version"]})
+                self.failed += 1
+                continue
+            self.queue.append((entry, node))
+
+    def flush(self, now, force=False):
+        if not force and now < self.next_flush and len(self.acks) < self.ack_batch:
+            return
+        self.next_flush = now + self.flush_interval
+        # У каждого приёмника своя попытка: отказ одной ручки не держит остальные.
+        # Неотправленное остаётся в буфере до следующего сброса
+        for name, send in (("acks", self.flush_acks), ("releases", self.flush_releases),
+                           ("presence", self.flush_presence), ("telemetry", self.flush_telemetry)):
+            try:
+                send()
+            except (BackendError, OSError) as e:
+                print(f"Flush {name} failed: {e}")
+
+    def flush_acks(self):
+        while self.acks:
+            chunk = take(self.acks, ACK_CHUNK)
+            result = self.client.ack(chunk)
+            drop(self.acks, len(chunk))
+            if result["stale"]:
+                # За время доставки ценник успели изменить — новая версия придёт отдельно
+                print(f"Stale acks: {', '.join(result['stale'])}")
+
+    def flush_releases(self):
+        while self.releases:
+            chunk = take(self.releases, ACK_CHUNK)
+            self.client.release(chunk, retry_after=UNADDRESSABLE_RETRY_SECONDS)
+            drop(self.releases, len(chunk))
+
+    def flush_presence(self):
+        while self.heartbeats:
+            chunk = take(self.heartbeats, PRESENCE_CHUNK)
+            self.client.send_presence(chunk)
+            drop(self.heartbeats, len(chunk))
+
+    def flush_telemetry(self):
+        while self.snapshots or self.latencies:
+            snapshots = take(self.snapshots, TELEMETRY_CHUNK)
+            latencies = take(self.latencies, TELEMETRY_CHUNK - len(snapshots))
+            self.client.send_telemetry(snapshots, latencies)
+            drop(self.snapshots, len(snapshots))
+            drop(self.latencies, len(latencies))
+
+    # --- хаб ---
+
+    def pump(self, now):
+        while self.queue and len(self.inflight) < self.window:
+            entry, node = self.queue.popleft()
+            self.seq = (self.seq + 1) & 0xFFFFFFFF
+            message = {"op": "send", "seq": self.seq, "to": node}
+            if "mesh" in entry:
+                message["msg_type"] = MSG_TYPE_SET_PRICE_BIN
+                message["data_b64"] = base64.b64encode(entry["mesh"]).decode()
+            else:
+                message["msg_type"] = MSG_TYPE_SET_PRICE
+                message["data"] = json.dumps(entry["board"]["product"], separators=(",", ":"),
+                                             ensure_ascii=False)
+            self.link.send(message)
+            self.inflight[self.seq] = (entry, node, now)
+
+    def handle(self, message, now):
+        op = message.get("op")
+        if op == "sent":
+            # Хаб выпустил сообщение в эфир: отсюда считаем ожидание ACK
+            item = self.inflight.get(message["seq"])
+            if item is not None:
+                self.inflight[message["seq"]] = (item[0], item[1], now)
+        elif op == "ack":
+            item = self.inflight.pop(message["seq"], None)
+            if item is None:
+                return
+            entry, node, sent_at = item
+            self.acks.append({"board_id": entry["board"]["board_id"],
+                              "sync_version": entry["sync_version"]})
+            self.latencies.append({"node": node, "latency_ms": round((now - sent_at) * 1000, 1)})
+            self.delivered.add(now)
+        elif op == "fail":
+            if self.inflight.pop(message["seq"], None) is not None:
+                self.failed += 1
+        elif op == "heartbeat":
+            self.heartbeats.append({"node_id": message["node"], "hops": message.get("hops"),
+                                    "rssi": message.get("rssi"), "seen_at": time.time()})
+        elif op == "stats":
+            self.snapshots.append({key: value for key, value in message.items() if key != "op"})
+
+    def expire(self, now):
+        # Хаб потерял сообщение (перезагрузка, переполнение): освобождаем окно
+        for seq in [seq for seq, (_, _, sent_at) in self.inflight.items()
+                    if now - sent_at > self.ack_timeout]:
+            del self.inflight[seq]
+            self.failed += 1
+
+    # --- цикл ---
+
+    def report(self, now):
+        if now < self.next_report:
+            return
+        self.next_report = now + self.report_interval
+        print(f"delivered={self.delivered.total} failed={self.failed} "
+              f"rate={self.delivered.per_minute(now):.1f}/min queue={len(self.queue)} "
+              f"inflight={len(self.inflight)} http_requests={self.client.requests} "
+              f"http_connects={self.client.connects}")
+
+    def step(self, timeout=0.05):
+        now = time.monotonic()
+        self.refill(now)
+        self.pump(now)
+        message = self.link.receive(timeout)
+        while message is not None:
+            self.handle(message, time.monotonic())
+            message = self.link.receive(0)
+        now = time.monotonic()
+        self.expire(now)
+        self.flush(now)
+        self.report(now)
+
+    def run(self, duration=None):
+        deadline = None if duration is None else time.monotonic() + duration
+        while self.running and (deadline is None or time.monotonic() < deadline):
+            self.step()
+        # Дожидаемся ACK по уже отправленному и сбрасываем подтверждения
+        drain_deadline = time.monotonic() + self.ack_timeout
+        while self.inflight and time.monotonic() < drain_deadline:
+            message = self.link.receive(0.1)
+            if message is not None:
+                self.handle(message, time.monotonic())
+        self.flush(time.monotonic(), force=True)
+        return self.summary()
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        return {
+            "delivered": self.delivered.total,
+            "failed": self.failed,
+            "elapsed_s": round(elapsed, 1),
+            "updates_per_minute": round(self.delivered.total * 60 / elapsed, 1) if elapsed else 0.0,
+            "http_requests": self.client.requests,
+            "http_connects": self.client.connects,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", default=os.getenv("BACKEND_URL", "http://localhost:8000"))
+    parser.add_argument("--token", default=os.getenv("GATEWAY_TOKEN"))
+    parser.add_argument("--zone", default=os.getenv("GATEWAY_ZONE"))
+    parser.add_argument("--serial", help="порт хаба, например /dev/ttyUSB0")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--loopback", action="store_true", help="имитация хаба вместо порта")
+    parser.add_argument("--loss", type=float, default=0.0, help="доля потерь в имитации")
+    parser.add_argument("--airtime-ms", type=int, default=250, help="эфир одного фрагмента в имитации")
+    parser.add_argument("--window", type=int, default=8, help="сообщений без ACK одновременно")
+    parser.add_argument("--batch", type=int, default=32, help="ценников за один claim")
+    parser.add_argument("--binary", action="store_true",
+                        help="слать цены в бинарном формате (SET_PRICE_BIN) вместо JSON")
+    parser.add_argument("--lease", type=int, default=60, help="секунд аренды")
+    parser.add_argument("--ack-timeout", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, help="секунд работы; по умолчанию бесконечно")
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error("--token or GATEWAY_TOKEN is required")
+    if not args.serial and not args.loopback:
+        parser.error("either --serial or --loopback is required")
+
+    if args.loopback:
+        link = LoopbackHub(airtime_ms=args.airtime_ms, loss=args.loss, heartbeat_nodes=20)
+    else:
+        link = SerialHubLink(args.serial, args.baudrate)
+    client = BackendClient(args.backend, args.token)
+    gateway = Gateway(client, link, window=args.window, batch=args.batch, zone=args.zone,
+                      lease_seconds=args.lease, ack_timeout=args.ack_timeout, binary=args.binary)
+
+    def stop(signum, frame):
+        gateway.running = False
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    try:
+        print(json.dumps(gateway.run(args.duration)))
+    finally:
+        client.close()
+        link.close()
+
+
+if __name__ == "__main__":
+    main()
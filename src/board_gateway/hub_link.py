@@ -0,0 +1,145 @@
+"""
+Связь шлюза с LoRa-хабом (Proto mesh/hub_bridge.py) по последовательному порту.
+
+Протокол — JSON по строке на сообщение:
+
+    шлюз -> хаб  {"op": "send", "seq": 7, "to": 12, "msg_type": 3, "data": "<json цены>"}
+                 {"op": "send", "seq": 8, "to": 12, "msg_type": 8, "data_b64": "<бинарная цена>"}
+    хаб -> шлюз  {"op": "sent", "seq": 7, "msg_id": 1193046}
+                 {"op": "ack", "seq": 7}
+                 {"op": "fail", "seq": 7, "reason": "timeout"}
+                 {"op": "heartbeat", "node": 12, "hops": 1}
+                 {"op": "stats", "node": 1, "tx": ..., "rx": ..., ...}
+"""
+
+import base64
+import heapq
+import json
+import math
+import random
+import time
+
+from firmware import MSG_TYPE, FRAGMENT_DATA_SIZE
+
+MSG_TYPE_SET_PRICE = MSG_TYPE.SET_PRICE
+MSG_TYPE_SET_PRICE_BIN = MSG_TYPE.SET_PRICE_BIN
+
+
+def encode_line(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class SerialHubLink:
+    """Хаб на реальном порту; нужен pyserial"""
+
+    def __init__(self, port, baudrate=115200):
+        import serial
+
+        self.serial = serial.Serial(port, baudrate=baudrate, timeout=0)
+        self.buffer = bytearray()
+
+    def send(self, message: dict):
+        self.serial.write(encode_line(message))
+
+    def receive(self, timeout: float):
+        deadline = time.monotonic() + timeout
+        while True:
+            newline = self.buffer.find(b"\n")
+            if newline >= 0:
+                line = bytes(self.buffer[:newline])
+                del self.buffer[:newline + 1]
+                try:
+                    return json.loads(line)
+                except ValueError:
+                    # Логи MicroPython в том же порту — не наши сообщения
+                    continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self.serial.timeout = remaining
+            chunk = self.serial.read(max(1, self.serial.in_waiting))
+            if chunk:
+                self.buffer += chunk
+
+    def close(self):
+        self.serial.close()
+
+
+class LoopbackHub:
+    """
+    Замена хаба для проверки шлюза без железа. Эфир полудуплексный:
+    кадры уходят строго по очереди, каждый фрагмент занимает airtime_ms,
+    ACK приходит через ack_delay_ms после последнего фрагмента.
+    loss — доля сообщений без ACK (хаб сообщит fail через ack_timeout_ms)
+    """
+
+    def __init__(self, airtime_ms=250, fragment_gap_ms=100, ack_delay_ms=(150, 600),
+                 loss=0.0, ack_timeout_ms=3000, heartbeat_nodes=0, seed=None):
+        self.airtime = airtime_ms / 1000
+        self.fragment_gap = fragment_gap_ms / 1000
+        self.ack_delay = (ack_delay_ms[0] / 1000, ack_delay_ms[1] / 1000)
+        self.loss = loss
+        self.ack_timeout = ack_timeout_ms / 1000
+        self.rnd = random.Random(seed)
+        self.radio_free_at = 0.0
+        self.events = []  # куча (время, порядок, сообщение)
+        self.order = 0
+        self.stats = {"tx": 0, "rx": 0, "relayed": 0, "acks": 0,
+                      "dropped_duplicate": 0, "dropped_ttl": 0, "timeouts": 0}
+        self.heartbeat_nodes = heartbeat_nodes
+        self.next_heartbeat = time.monotonic()
+        self.next_stats = time.monotonic() + 10
+
+    def _schedule(self, at, message):
+        self.order += 1
+        heapq.heappush(self.events, (at, self.order, message))
+
+    def send(self, message: dict):
+        if message.get("op") != "send":
+            return
+        now = time.monotonic()
+        if "data_b64" in message:
+            size = len(base64.b64decode(message["data_b64"]))
+        else:
+            size = len(message["data"].encode())
+        frames = max(1, math.ceil(size / FRAGMENT_DATA_SIZE))
+        start = max(now, self.radio_free_at)
+        done = start + frames * self.airtime + (frames - 1) * self.fragment_gap
+        self.radio_free_at = done
+        self.stats["tx"] += frames
+
+        seq = message["seq"]
+        self._schedule(done, {"op": "sent", "seq": seq, "msg_id": self.order})
+        if self.rnd.random() < self.loss:
+            self.stats["timeouts"] += 1
+            self._schedule(done + self.ack_timeout, {"op": "fail", "seq": seq, "reason": "timeout"})
+        else:
+            self.stats["acks"] += 1
+            self.stats["rx"] += 1
+            self._schedule(done + self.rnd.uniform(*self.ack_delay), {"op": "ack", "seq": seq})
+
+    def _background(self, now):
+        if self.heartbeat_nodes and now >= self.next_heartbeat:
+            self.next_heartbeat = now + 1.0
+            node = self.rnd.randint(2, self.heartbeat_nodes + 1)
+            self._schedule(now, {"op": "heartbeat", "node": node, "hops": self.rnd.randint(0, 3)})
+        if now >= self.next_stats:
+            self.next_stats = now + 10
+            self._schedule(now, {"op": "stats", "node": 1, **self.stats})
+
+    def receive(self, timeout: float):
+        deadline = time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            self._background(now)
+            if self.events and self.events[0][0] <= now:
+                return heapq.heappop(self.events)[2]
+            wake = deadline
+            if self.events:
+                wake = min(wake, self.events[0][0])
+            if wake <= now:
+                return None
+            time.sleep(wake - now)
+
+    def close(self):
+        pass
@@ -1,8 +1,54 @@
 import os
 from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
 
 PRJ_DIR = Path(__file__).parent.parent
-DATA_DIR = PRJ_DIR / "data"
+DATA_DIR = Path(os.getenv("DATA_DIR", PRJ_DIR / "data"))
 
 if not os.path.exists(DATA_DIR):
-    os.mkdir(DATA_DIR)
\ No newline at end of file
+    os.mkdir(DATA_DIR)
+
+# Профиль движка SQLite: "tuned" (WAL + прагмы) или "default" (как создаёт SQLAlchemy)
+DB_PROFILE = os.getenv("DB_PROFILE", "tuned")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MMAP_SIZE_MB = int(os.getenv("DB_MMAP_SIZE_MB", 256))
+DB_CACHE_SIZE_MB = int(os.getenv("DB_CACHE_SIZE_MB", 64))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", 5000))
+
+# Сессии админки: токен выдаётся при логине и живёт SESSION_TTL_SECONDS
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 12 * 60 * 60))
+MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", 10000))
+# "1" — пускать в /api/boards, /api/boards/import и /api/update_board запросы
+# без Authorization, как у админки, собранной до появления токенов. Только для
+# такого бандла и на время его пересборки: по умолчанию токен обязателен
+FRONT_LEGACY_AUTH = os.getenv("FRONT_LEGACY_AUTH", "0") == "1"
+# Потоков под bcrypt: пачка логинов не займёт больше ядер, чем указано
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", 2))
+
+# Сколько готовых JSON-пакетов для шлюза держать в памяти
+PAYLOAD_CACHE_SIZE = int(os.getenv("PAYLOAD_CACHE_SIZE", 10000))
+
+# Шлюзы: "имя=токен" через запятую; GATEWAY_TOKEN остаётся шлюзом "default"
+GATEWAY_TOKENS = os.getenv("GATEWAY_TOKENS", "")
+# Сколько секунд ценник закреплён за шлюзом, забравшим его в работу
+GATEWAY_LEASE_SECONDS = int(os.getenv("GATEWAY_LEASE_SECONDS", 60))
+# Токен для /metrics; пусто — подходит токен любого шлюза
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Телеметрия шлюзов: как часто пересчитывать агрегаты и сколько хранить
+TELEMETRY_ROLLUP_INTERVAL_SECONDS = int(os.getenv("TELEMETRY_ROLLUP_INTERVAL_SECONDS", 60))
+TELEMETRY_RAW_RETENTION_HOURS = int(os.getenv("TELEMETRY_RAW_RETENTION_HOURS", 24))
+TELEMETRY_MINUTE_RETENTION_DAYS = int(os.getenv("TELEMETRY_MINUTE_RETENTION_DAYS", 7))
+TELEMETRY_HOUR_RETENTION_DAYS = int(os.getenv("TELEMETRY_HOUR_RETENTION_DAYS", 90))
+
+# Присутствие ценников: буфер heartbeat-ов сбрасывается в базу раз в
+# PRESENCE_FLUSH_SECONDS; ценник без heartbeat дольше порога — stale, затем offline
+PRESENCE_FLUSH_SECONDS = float(os.getenv("PRESENCE_FLUSH_SECONDS", 5))
+PRESENCE_STALE_SECONDS = int(os.getenv("PRESENCE_STALE_SECONDS", 15 * 60))
+PRESENCE_OFFLINE_SECONDS = int(os.getenv("PRESENCE_OFFLINE_SECONDS", 60 * 60))
+
+# Кэширование фронтенда: index.html — коротко, прочая статика без хеша в имени
+FRONT_INDEX_MAX_AGE = int(os.getenv("FRONT_INDEX_MAX_AGE", 60))
+FRONT_STATIC_MAX_AGE = int(os.getenv("FRONT_STATIC_MAX_AGE", 60 * 60))
@@ -0,0 +1,252 @@
+import bisect
+import collections
+import functools
+import re
+import threading
+import time
+
+from sqlalchemy import event
+
+# Метрики в памяти процесса, выдача в текстовом формате Prometheus.
+# Счётчики обновляются из event loop и из потоков драйвера SQLite, поэтому под замком
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names, values) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield self.name, format_labels(self.labelnames, labels), value
+
+
+class Gauge:
+    """Значение считается в момент выдачи: fn() -> число или {labels: число}"""
+    kind = "gauge"
+
+    def __init__(self, name, help, fn, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.fn = fn
+
+    def samples(self):
+        value = self.fn()
+        if not isinstance(value, dict):
+            value = {(): value}
+        for labels, item in sorted(value.items()):
+            yield self.name, format_labels(self.labelnames, labels), item
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # labels -> [счётчики по корзинам..., +Inf, сумма]
+        self._values = {}
+
+    def observe(self, labels: tuple, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {labels: list(counts) for labels, counts in self._values.items()}
+        names = self.labelnames + ("le",)
+        for labels, counts in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield self.name + "_bucket", format_labels(names, labels + (format_value(bound),)), cumulative
+            yield self.name + "_sum", format_labels(self.labelnames, labels), counts[-1]
+            yield self.name + "_count", format_labels(self.labelnames, labels), cumulative
+
+
+class RateMeter:
+    """События в секунду за скользящее окно, без обращений к базе"""
+
+    def __init__(self, window: float = 60.0):
+        self.window = window
+        self._lock = threading.Lock()
+        self._events = collections.deque()
+
+    def add(self, amount: int = 1):
+        with self._lock:
+            self._events.append((time.monotonic(), amount))
+
+    def rate(self) -> float:
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            while self._events and self._events[0][0] < cutoff:
+                self._events.popleft()
+            total = sum(amount for _, amount in self._events)
+        return total / self.window
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status"),
+))
+sql_statements = registry.register(Histogram(
+    "sql_statement_duration_seconds", "SQL statement execution time by operation and table",
+    ("operation", "table"), buckets=SQL_BUCKETS,
+))
+board_confirms = registry.register(Counter(
+    "board_confirms_total", "Boards confirmed by gateways", ("source",),
+))
+confirm_rate = RateMeter()
+registry.register(Gauge(
+    "board_confirm_rate", "Boards confirmed per second over the last minute", confirm_rate.rate,
+))
+
+# Состояние очереди снимается одним запросом при выдаче /metrics, не на каждом запросе
+sync_queue = {"unsynced": 0, "oldest_age": 0.0}
+registry.register(Gauge(
+    "unsynced_boards", "Boards waiting in the sync outbox", lambda: sync_queue["unsynced"],
+))
+registry.register(Gauge(
+    "unsynced_oldest_age_seconds", "Age of the oldest outbox entry", lambda: sync_queue["oldest_age"],
+))
+
+startup = {"seconds": 0.0}
+registry.register(Gauge(
+    "app_startup_seconds", "Time spent in the startup hook of this worker", lambda: startup["seconds"],
+))
+
+
+def record_confirms(source: str, count: int):
+    if count:
+        board_confirms.inc(source, amount=count)
+        confirm_rate.add(count)
+
+
+class MetricsMiddleware:
+    """ASGI-мидлварь: маршрут берётся из шаблона (/api/boards), а не из пути с параметрами"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_requests.observe(
+                (scope["method"], getattr(route, "path", "static"), str(status)),
+                time.perf_counter() - start,
+            )
+
+
+# Операция и основная таблица: для меток хватает, кардинальность ограничена схемой
+STATEMENT_RE = re.compile(
+    r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH|PRAGMA|CREATE|ALTER|DROP)\b"
+    r"(?:.*?\b(?:FROM|INTO|UPDATE|TABLE)\s+\"?(\w+))?",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def statement_labels(statement: str) -> tuple:
+    match = STATEMENT_RE.match(statement)
+    if not match:
+        return ("other", "")
+    operation = match.group(1).upper()
+    table = match.group(2) or ""
+    if operation == "UPDATE":
+        table = statement.split(None, 2)[1].strip('"')
+    elif operation in ("CREATE", "ALTER", "DROP", "PRAGMA"):
+        table = ""
+    return (operation.lower(), table)
+
+
+def instrument_engine(sync_engine):
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        sql_statements.observe(statement_labels(statement), elapsed)
+
+    # Упавший запрос не доходит до after_cursor_execute: снимаем его отметку здесь,
+    # иначе стек растёт, а следующий запрос получит чужое время начала
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        if context.execution_context is not None and context.connection is not None:
+            starts = context.connection.info.get("query_start")
+            if starts:
+                starts.pop()
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+
+class ChangeNotifier:
+    """
+    Внутрипроцессное уведомление об изменениях ценников.
+    notify() можно звать из любого потока (sync-обработчики живут в threadpool),
+    wait() ждёт в event loop без опросов базы.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._waiters = set()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def notify(self):
+        with self._lock:
+            self._version += 1
+            waiters, self._waiters = self._waiters, set()
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    async def wait(self, since: int, timeout: float) -> bool:
+        """True — были изменения после версии since, False — вышел таймаут"""
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            if self._version != since:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+board_changes = ChangeNotifier()
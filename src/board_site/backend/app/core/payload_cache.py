@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from typing import Optional
+
+from core import config
+
+
+class PayloadCache:
+    """
+    Готовые байты ответа для шлюза по ценнику.
+    Запись действительна только для той sync_version, с которой её положили,
+    поэтому устаревший пакет отдать нельзя даже без явной инвалидации.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items = OrderedDict()  # {board_id: (sync_version, payload)}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, board_id: str, version: int) -> Optional[bytes]:
+        item = self._items.get(board_id)
+        if item is None or item[0] != version:
+            self.misses += 1
+            return None
+        self._items.move_to_end(board_id)
+        self.hits += 1
+        return item[1]
+
+    def put(self, board_id: str, version: int, payload: bytes):
+        self._items[board_id] = (version, payload)
+        self._items.move_to_end(board_id)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, board_id: str):
+        self._items.pop(board_id, None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._items),
+            "max_size": self.max_size,
+        }
+
+
+board_payloads = PayloadCache(config.PAYLOAD_CACHE_SIZE)
+board_mesh_payloads = PayloadCache(config.PAYLOAD_CACHE_SIZE)
+
+
+def invalidate_board(board_id: str):
+    board_payloads.invalidate(board_id)
+    board_mesh_payloads.invalidate(board_id)
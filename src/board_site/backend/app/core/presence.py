@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+from sqlalchemy import text
+
+from core import config
+from database.db import AsyncSessionLocal
+
+# Один UPSERT на узел за сброс: last_seen не откатывается назад,
+# если пачка от медленного шлюза пришла позже свежей
+UPSERT_PRESENCE_SQL = text("""
+    INSERT INTO board_presence (node_id, gateway, first_seen, last_seen, heartbeats, hops, rssi)
+    VALUES (:node_id, :gateway, :first_seen, :last_seen, :heartbeats, :hops, :rssi)
+    ON CONFLICT(node_id) DO UPDATE SET
+        heartbeats = board_presence.heartbeats + excluded.heartbeats,
+        gateway = CASE WHEN excluded.last_seen >= board_presence.last_seen
+                       THEN excluded.gateway ELSE board_presence.gateway END,
+        hops = CASE WHEN excluded.last_seen >= board_presence.last_seen
+                    THEN excluded.hops ELSE board_presence.hops END,
+        rssi = CASE WHEN excluded.last_seen >= board_presence.last_seen
+                    THEN excluded.rssi ELSE board_presence.rssi END,
+        last_seen = MAX(board_presence.last_seen, excluded.last_seen)
+""")
+
+
+class PresenceBuffer:
+    """
+    Write-behind буфер heartbeat-ов: в памяти держится последняя запись по узлу,
+    в базу всё уходит одной транзакцией при flush()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def add(self, gateway: str, node_id: int, seen_at: float, hops=None, rssi=None):
+        with self._lock:
+            record = self._records.get(node_id)
+            if record is None:
+                self._records[node_id] = {
+                    "node_id": node_id, "gateway": gateway, "first_seen": seen_at,
+                    "last_seen": seen_at, "heartbeats": 1, "hops": hops, "rssi": rssi,
+                }
+                return
+            record["heartbeats"] += 1
+            record["first_seen"] = min(record["first_seen"], seen_at)
+            if seen_at >= record["last_seen"]:
+                record.update(gateway=gateway, last_seen=seen_at, hops=hops, rssi=rssi)
+
+    def take(self) -> list:
+        with self._lock:
+            records, self._records = self._records, {}
+        return list(records.values())
+
+    def restore(self, records: list):
+        # Сброс не удался — возвращаем записи, не затирая пришедшие за это время
+        with self._lock:
+            for record in records:
+                current = self._records.setdefault(record["node_id"], record)
+                if current is record:
+                    continue
+                current["heartbeats"] += record["heartbeats"]
+                current["first_seen"] = min(current["first_seen"], record["first_seen"])
+                if record["last_seen"] > current["last_seen"]:
+                    current.update(gateway=record["gateway"], last_seen=record["last_seen"],
+                                   hops=record["hops"], rssi=record["rssi"])
+
+    async def flush(self) -> int:
+        records = self.take()
+        if not records:
+            return 0
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(UPSERT_PRESENCE_SQL, records)
+                await db.commit()
+        except Exception:
+            self.restore(records)
+            raise
+        return len(records)
+
+
+presence = PresenceBuffer()
+
+
+async def run_flusher(interval: float = None):
+    """Фоновая задача приложения: сброс буфера раз в interval и при остановке"""
+    interval = config.PRESENCE_FLUSH_SECONDS if interval is None else interval
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await presence.flush()
+            except Exception as e:
+                print(f"Presence flush failed: {e}")
+    finally:
+        await presence.flush()
+
+
+def presence_status(last_seen: float, now: float = None) -> str:
+    age = (time.time() if now is None else now) - last_seen
+    if age >= config.PRESENCE_OFFLINE_SECONDS:
+        return "offline"
+    if age >= config.PRESENCE_STALE_SECONDS:
+        return "stale"
+    return "online"
@@ -0,0 +1,41 @@
+"""
+Компактный бинарный формат цены для LoRa mesh.
+Эталонный декодер для ценников — board_firmware/Proto mesh/price_codec.py,
+формат в обоих файлах должен совпадать.
+
+Байт    | Назначение
+--------|------------------------------------------
+0       | биты 4-7: версия формата, бит 0: есть скидка
+1-4     | res_price.rubs (uint32)
+5       | res_price.kopecks
+        | если есть скидка:
++0..+3  |   base_price.rubs (uint32)
++4      |   base_price.kopecks
++5..+6  |   discount * 100 (uint16, сотые доли процента)
++0      | длина названия в байтах
++1..    | название (utf-8, не больше 255 байт)
+"""
+
+import struct
+
+FORMAT_VERSION = 1
+FLAG_DISCOUNT = 0x01
+
+MAX_NAME_BYTES = 255
+
+
+def encode_price(name: str, rubs: int, kopecks: int,
+                 base_rubs=None, base_kopecks=None, discount=None) -> bytes:
+    has_discount = discount is not None and base_rubs is not None
+    flags = (FORMAT_VERSION << 4) | (FLAG_DISCOUNT if has_discount else 0)
+
+    parts = [struct.pack(">BIB", flags, rubs, kopecks)]
+    if has_discount:
+        parts.append(struct.pack(">IBH", base_rubs, base_kopecks, round(discount * 100)))
+
+    # Обрезаем по границе символа, чтобы не получить битый utf-8
+    name_bytes = name.encode()[:MAX_NAME_BYTES].decode("utf-8", "ignore").encode()
+    parts.append(struct.pack(">B", len(name_bytes)))
+    parts.append(name_bytes)
+    return b"".join(parts)
+
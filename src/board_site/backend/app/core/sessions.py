@@ -0,0 +1,73 @@
+import secrets
+import time
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from core import config
+
+
+class SessionStore:
+    """Токены сессий в памяти процесса: проверка — один поиск в словаре"""
+
+    def __init__(self, ttl_seconds: int, max_sessions: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions = {}  # {token: (login, expires_at)}
+
+    def issue(self, login: str) -> str:
+        if len(self._sessions) >= self.max_sessions:
+            self.purge_expired()
+        # Словарь хранит порядок вставки — первыми вытесняем самые старые
+        while len(self._sessions) >= self.max_sessions:
+            del self._sessions[next(iter(self._sessions))]
+
+        token = secrets.token_urlsafe(32)
+        self._sessions[token] = (login, time.monotonic() + self.ttl_seconds)
+        return token
+
+    def get(self, token: str) -> Optional[str]:
+        session = self._sessions.get(token)
+        if session is None:
+            return None
+        login, expires_at = session
+        if expires_at < time.monotonic():
+            del self._sessions[token]
+            return None
+        return login
+
+    def revoke(self, token: str):
+        self._sessions.pop(token, None)
+
+    def purge_expired(self):
+        now = time.monotonic()
+        expired = [token for token, (_, expires_at) in self._sessions.items() if expires_at < now]
+        for token in expired:
+            del self._sessions[token]
+
+
+sessions = SessionStore(config.SESSION_TTL_SECONDS, config.MAX_SESSIONS)
+
+
+def bearer_token(authorization: Optional[str]) -> Optional[str]:
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    return authorization[len("Bearer "):]
+
+
+async def require_user(authorization: Optional[str] = Header(None)) -> str:
+    token = bearer_token(authorization)
+    login = sessions.get(token) if token else None
+    if login is None:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    return login
+
+
+async def require_front_user(authorization: Optional[str] = Header(None)) -> str:
+    """
+    require_user для ручек, которые вызывает админка. С FRONT_LEGACY_AUTH запросы
+    без Authorization пропускаются; присланный токен проверяется всегда
+    """
+    if authorization is None and config.FRONT_LEGACY_AUTH:
+        return "legacy-front"
+    return await require_user(authorization)
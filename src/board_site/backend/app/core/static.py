@@ -0,0 +1,76 @@
+import os
+import re
+from mimetypes import guess_type
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import StaticFiles, NotModifiedResponse
+
+from core import config
+
+# Сжатые копии рядом с оригиналом: index-97AWfbG-.js.br, index-97AWfbG-.js.gz
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# При равном q из Accept-Encoding brotli лучше
+ENCODING_PREFERENCE = ("br", "gzip")
+
+# Vite кладёт в assets/ файлы с хешем содержимого в имени: index-97AWfbG-.js
+HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8,}\.\w+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def accepted_encodings(header: str) -> list:
+    weights = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        name = name.strip().lower()
+        if name in ENCODING_SUFFIXES and q > 0:
+            weights[name] = q
+    return sorted(weights, key=lambda name: (-weights[name], ENCODING_PREFERENCE.index(name)))
+
+
+def cache_control(full_path) -> str:
+    path = str(full_path)
+    name = os.path.basename(path)
+    if name.endswith(".html"):
+        # Ссылки на новый бандл появляются только в index.html
+        return f"public, max-age={config.FRONT_INDEX_MAX_AGE}, must-revalidate"
+    if os.path.basename(os.path.dirname(path)) == "assets" and HASHED_ASSET_RE.search(name):
+        return IMMUTABLE
+    return f"public, max-age={config.FRONT_STATIC_MAX_AGE}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles, отдающий заранее сжатые .br/.gz по Accept-Encoding
+    и выставляющий Cache-Control: immutable для хешированных ассетов
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        request_headers = Headers(scope=scope)
+        media_type = guess_type(str(full_path))[0] or "text/plain"
+        headers = {"Cache-Control": cache_control(full_path), "Vary": "Accept-Encoding"}
+
+        for encoding in accepted_encodings(request_headers.get("accept-encoding", "")):
+            variant = f"{full_path}{ENCODING_SUFFIXES[encoding]}"
+            try:
+                variant_stat = os.stat(variant)
+            except OSError:
+                continue
+            full_path, stat_result = variant, variant_stat
+            headers["Content-Encoding"] = encoding
+            break
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result,
+                                media_type=media_type, headers=headers)
+        # ETag у сжатой копии свой, сверяем с ним
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
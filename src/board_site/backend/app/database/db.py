@@ -1,16 +1,103 @@
-from sqlalchemy import create_engine
+import zlib
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable, CreateIndex
 
+from core import config
 from core.config import DATA_DIR
+from core.metrics import instrument_engine
 
 DB_PATH = DATA_DIR / "database.db"
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+DB_PROFILES = {
+    "default": None,
+    "tuned": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": config.DB_MMAP_SIZE_MB * 1024 * 1024,
+        "cache_size": -config.DB_CACHE_SIZE_MB * 1024,  # отрицательное значение — в КиБ
+        "busy_timeout": config.DB_BUSY_TIMEOUT_MS,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def set_sqlite_pragmas(engine, pragmas):
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def unicode_lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+def register_sqlite_functions(engine):
+    # Встроенный lower() в SQLite меняет регистр только у ASCII, а поиск
+    # по кириллице должен совпадать с регистронезависимым FTS-индексом
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function("unicode_lower", 1, unicode_lower, deterministic=True)
+
+
+def engine_options(profile):
+    if profile not in DB_PROFILES:
+        raise ValueError(f"Unknown DB profile: {profile}")
+
+    pragmas = DB_PROFILES[profile]
+    if pragmas is None:
+        return None, {"connect_args": {"check_same_thread": False}}
+
+    # В WAL читатели не блокируют писателя, поэтому держим по соединению
+    # на поток threadpool вместо пяти соединений пула по умолчанию
+    return pragmas, {
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": config.DB_BUSY_TIMEOUT_MS / 1000,
+        },
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_POOL_SIZE,
+    }
+
+
+def create_db_engine(url=SQLALCHEMY_DATABASE_URL, profile=config.DB_PROFILE):
+    pragmas, options = engine_options(profile)
+    db_engine = create_engine(url, poolclass=QueuePool, **options)
+    register_sqlite_functions(db_engine)
+    if pragmas:
+        set_sqlite_pragmas(db_engine, pragmas)
+    return db_engine
+
+
+def create_async_db_engine(url=ASYNC_DATABASE_URL, profile=config.DB_PROFILE):
+    pragmas, options = engine_options(profile)
+    db_engine = create_async_engine(url, poolclass=AsyncAdaptedQueuePool, **options)
+    register_sqlite_functions(db_engine.sync_engine)
+    if pragmas:
+        set_sqlite_pragmas(db_engine.sync_engine, pragmas)
+    return db_engine
+
+
+# Синхронный движок — для инициализации схемы, миграций и скриптов;
+# обработчики запросов работают через асинхронный
+engine = create_db_engine()
+async_engine = create_async_db_engine()
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 def get_db():
     db = SessionLocal()
@@ -19,6 +106,113 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Меняется вместе с migrate_db, если миграция не видна по DDL моделей
+MIGRATIONS_REVISION = 1
+
+
+def schema_fingerprint(extra: str = "") -> int:
+    """Отпечаток схемы моделей; хранится в PRAGMA user_version самой базы"""
+    from .models import Base
+
+    ddl = [str(MIGRATIONS_REVISION), extra]
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        ddl += sorted(str(CreateIndex(index).compile(dialect=engine.dialect)) for index in table.indexes)
+    # user_version — знаковое 32-битное
+    return zlib.crc32("\n".join(ddl).encode()) & 0x7FFFFFFF
+
+
+def schema_marker() -> int:
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def set_schema_marker(value: int):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {int(value)}")
+
+
 def init_db():
     from .models import BoardORM, UserORM, Base
     Base.metadata.create_all(bind=engine)
+    migrate_db()
+
+def load_db_state():
+    """Схема уже на месте: только состояние процесса, без DDL"""
+    global _fts_enabled
+    with engine.connect() as conn:
+        _fts_enabled = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = 'boards_fts'"
+        ).first() is not None
+
+def migrate_db():
+    """Доводит существующую базу до текущей схемы (create_all не трогает старые таблицы)"""
+    from .models import BoardORM
+    from . import outbox
+
+    with engine.begin() as conn:
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(boards)")}
+        if "sync_version" not in columns:
+            conn.exec_driver_sql(
+                "ALTER TABLE boards ADD COLUMN sync_version INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.exec_driver_sql("UPDATE boards SET sync_version = rowid")
+        if "zone" not in columns:
+            conn.exec_driver_sql("ALTER TABLE boards ADD COLUMN zone VARCHAR")
+
+        outbox_columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(sync_outbox)")}
+        for name, ddl in (("lease_owner", "VARCHAR"), ("lease_expires_at", "FLOAT"),
+                          ("leased_version", "INTEGER")):
+            if name not in outbox_columns:
+                conn.exec_driver_sql(f"ALTER TABLE sync_outbox ADD COLUMN {name} {ddl}")
+
+        for index in BoardORM.__table__.indexes:
+            index.create(conn, checkfirst=True)
+
+        # Несинхронизированные ценники без записи в очереди (база до появления outbox)
+        conn.execute(outbox.BACKFILL_SQL, outbox.enqueue_params(None, outbox.PRIORITY_BULK))
+
+    migrate_fts()
+
+# Полнотекстовый индекс по названию товара. Триграммы дают поиск
+# по подстроке; содержимое не дублируется, индекс ссылается на boards.rowid
+BOARDS_FTS_DDL = (
+    """CREATE VIRTUAL TABLE boards_fts USING fts5(
+        product, content='boards', content_rowid='rowid', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER boards_fts_ai AFTER INSERT ON boards BEGIN
+        INSERT INTO boards_fts(rowid, product) VALUES (new.rowid, new.product);
+    END""",
+    """CREATE TRIGGER boards_fts_ad AFTER DELETE ON boards BEGIN
+        INSERT INTO boards_fts(boards_fts, rowid, product) VALUES ('delete', old.rowid, old.product);
+    END""",
+    """CREATE TRIGGER boards_fts_au AFTER UPDATE OF product ON boards BEGIN
+        INSERT INTO boards_fts(boards_fts, rowid, product) VALUES ('delete', old.rowid, old.product);
+        INSERT INTO boards_fts(rowid, product) VALUES (new.rowid, new.product);
+    END""",
+    "INSERT INTO boards_fts(boards_fts) VALUES ('rebuild')",
+)
+
+_fts_enabled = False
+
+def fts_enabled() -> bool:
+    return _fts_enabled
+
+def migrate_fts():
+    global _fts_enabled
+    try:
+        with engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE name = 'boards_fts'"
+            ).first()
+            if not exists:
+                for statement in BOARDS_FTS_DDL:
+                    conn.exec_driver_sql(statement)
+        _fts_enabled = True
+    except OperationalError as e:
+        # SQLite без FTS5/trigram: поиск работает через LIKE
+        print(f"FTS index is not available: {e}")
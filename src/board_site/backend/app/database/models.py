@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean
+from sqlalchemy import Column, Integer, String, Float, Boolean, Index, select, update, func
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -12,6 +12,149 @@ class BoardORM(Base):
     discount = Column(Float)
     installed_at = Column(String, nullable=False)
     synced = Column(Boolean, default=True)
+    sync_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Зона хаба: ценник с зоной раздаётся только шлюзам этой зоны
+    zone = Column(String)
+
+    __table_args__ = (
+        Index("ix_boards_synced_id", "synced", "id"),
+        Index("ix_boards_sync_version", "sync_version"),
+        Index("ix_boards_product_id", "product", "id"),
+        Index("ix_boards_base_price_id", "base_price", "id"),
+    )
+
+
+def max_sync_version():
+    return select(func.coalesce(func.max(BoardORM.sync_version), 0)).correlate(None).scalar_subquery()
+
+
+def next_sync_version():
+    # Только для UPDATE одной строки. Выполняется внутри пишущего запроса, поэтому
+    # версии не повторяются: SQLite держит блокировку записи до конца транзакции.
+    # В многострочном UPDATE подзапрос считается один раз — см. stamp_sync_versions
+    return max_sync_version() + 1
+
+
+def stamp_sync_versions(board_ids, **values):
+    """
+    UPDATE ценников board_ids со своей новой версией у каждого: MAX + номер строки.
+    sync_version остаётся уникальным курсором изменений и для пачек
+    """
+    ranked = (
+        select(BoardORM.id, func.row_number().over(order_by=BoardORM.id).label("rn"))
+        .where(BoardORM.id.in_(board_ids))
+        .subquery()
+    )
+    return (
+        update(BoardORM)
+        .where(BoardORM.id == ranked.c.id)
+        .values(sync_version=max_sync_version() + ranked.c.rn, **values)
+    )
+
+
+class SyncOutboxORM(Base):
+    """
+    Очередь отправки в эфир: не больше одной записи на ценник.
+    Новая правка заменяет ждущую (coalescing), superseded считает вытесненные версии
+    """
+    __tablename__ = "sync_outbox"
+
+    id = Column(Integer, primary_key=True)
+    board_id = Column(String, nullable=False, unique=True)
+    sync_version = Column(Integer, nullable=False)
+    priority = Column(Integer, nullable=False)
+    created_at = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)
+    superseded = Column(Integer, nullable=False, default=0)
+    # Аренда: шлюз, до какого времени и какую версию он забрал
+    lease_owner = Column(String)
+    lease_expires_at = Column(Float)
+    leased_version = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_sync_outbox_dispatch", "priority", "id"),
+    )
+
+
+class BoardPresenceORM(Base):
+    """Последний heartbeat (SEND_ID) каждого узла mesh-сети"""
+    __tablename__ = "board_presence"
+
+    node_id = Column(Integer, primary_key=True)
+    gateway = Column(String, nullable=False)
+    first_seen = Column(Float, nullable=False)
+    last_seen = Column(Float, nullable=False)
+    heartbeats = Column(Integer, nullable=False, default=0)
+    hops = Column(Integer)
+    rssi = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_board_presence_last_seen", "last_seen"),
+    )
+
+
+# Телеметрия шлюзов: счётчики MeshNode.stats приходят накопленными,
+# в журнал пишутся приращения с прошлого снимка
+TELEMETRY_COUNTERS = ("tx", "rx", "relayed", "acks", "dropped_duplicate", "dropped_ttl", "timeouts")
+
+
+class TelemetryEventORM(Base):
+    """Сырой журнал, только дописывается: приращения счётчиков или одна задержка ACK"""
+    __tablename__ = "telemetry_events"
+
+    id = Column(Integer, primary_key=True)
+    ts = Column(Float, nullable=False)
+    gateway = Column(String, nullable=False)
+    node = Column(Integer, nullable=False)
+    tx = Column(Integer, nullable=False, default=0)
+    rx = Column(Integer, nullable=False, default=0)
+    relayed = Column(Integer, nullable=False, default=0)
+    acks = Column(Integer, nullable=False, default=0)
+    dropped_duplicate = Column(Integer, nullable=False, default=0)
+    dropped_ttl = Column(Integer, nullable=False, default=0)
+    timeouts = Column(Integer, nullable=False, default=0)
+    latency_ms = Column(Float)
+
+    __table_args__ = (
+        Index("ix_telemetry_events_ts", "ts"),
+    )
+
+
+class TelemetryRollupORM(Base):
+    """Агрегаты по минутам и часам (resolution — длина корзины в секундах)"""
+    __tablename__ = "telemetry_rollups"
+
+    resolution = Column(Integer, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    gateway = Column(String, primary_key=True)
+    node = Column(Integer, primary_key=True)
+    tx = Column(Integer, nullable=False, default=0)
+    rx = Column(Integer, nullable=False, default=0)
+    relayed = Column(Integer, nullable=False, default=0)
+    acks = Column(Integer, nullable=False, default=0)
+    dropped_duplicate = Column(Integer, nullable=False, default=0)
+    dropped_ttl = Column(Integer, nullable=False, default=0)
+    timeouts = Column(Integer, nullable=False, default=0)
+    latency_count = Column(Integer, nullable=False, default=0)
+    latency_sum = Column(Float, nullable=False, default=0)
+    latency_min = Column(Float)
+    latency_max = Column(Float)
+
+
+class TelemetryNodeORM(Base):
+    """Последний накопленный снимок узла — база для приращений"""
+    __tablename__ = "telemetry_nodes"
+
+    gateway = Column(String, primary_key=True)
+    node = Column(Integer, primary_key=True)
+    last_seen = Column(Float, nullable=False)
+    tx = Column(Integer, nullable=False, default=0)
+    rx = Column(Integer, nullable=False, default=0)
+    relayed = Column(Integer, nullable=False, default=0)
+    acks = Column(Integer, nullable=False, default=0)
+    dropped_duplicate = Column(Integer, nullable=False, default=0)
+    dropped_ttl = Column(Integer, nullable=False, default=0)
+    timeouts = Column(Integer, nullable=False, default=0)
 
 
 class UserORM(Base):
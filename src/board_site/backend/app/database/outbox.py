@@ -0,0 +1,113 @@
+import time
+
+from sqlalchemy import text
+
+# Классы приоритета: меньше — раньше в эфир
+PRIORITY_PROMO_PRICE_UP = 0   # рост цены на ценнике со скидкой
+PRIORITY_PRICE = 1            # любая смена цены или скидки
+PRIORITY_CONTENT = 2          # название, дата установки
+PRIORITY_BULK = 3             # массовый импорт
+
+PRIORITY_NAMES = {
+    PRIORITY_PROMO_PRICE_UP: "promo_price_up",
+    PRIORITY_PRICE: "price",
+    PRIORITY_CONTENT: "content",
+    PRIORITY_BULK: "bulk",
+}
+
+# Запись на ценник одна: новая версия вытесняет ждущую, приоритет берётся
+# наивысший — в эфир всё равно уйдёт итоговое состояние со всеми правками.
+# Отложенную шлюзом запись (RELEASE_LATER_SQL) правка возвращает в очередь сразу
+ENQUEUE_SQL = text("""
+    INSERT INTO sync_outbox (board_id, sync_version, priority, created_at, updated_at, superseded)
+    SELECT id, sync_version, :priority, :now, :now, 0 FROM boards WHERE id = :board_id
+    ON CONFLICT(board_id) DO UPDATE SET
+        sync_version = excluded.sync_version,
+        priority = MIN(priority, excluded.priority),
+        updated_at = excluded.updated_at,
+        superseded = superseded + 1,
+        lease_expires_at = CASE WHEN lease_owner IS NULL THEN NULL ELSE lease_expires_at END
+""")
+
+# Подтверждать можно только ту версию, что ушла в эфир, и только шлюзу,
+# который держит аренду: если за это время пришла новая правка или аренду
+# перехватил другой шлюз, запись остаётся в очереди
+ACK_OUTBOX_SQL = text("""
+    DELETE FROM sync_outbox
+    WHERE board_id = :board_id AND sync_version = :sync_version AND lease_owner = :gateway
+""")
+ACK_BOARD_SQL = text("""
+    UPDATE boards
+    SET synced = 1,
+        sync_version = (SELECT COALESCE(MAX(sync_version), 0) + 1 FROM boards)
+    WHERE id = :board_id AND sync_version = :sync_version
+      AND EXISTS (SELECT 1 FROM sync_outbox o
+                  WHERE o.board_id = :board_id AND o.sync_version = :sync_version
+                    AND o.lease_owner = :gateway)
+""")
+
+# Забрать пачку в аренду. Свободные, просроченные (и отложенные, чей срок
+# вышел) и собственные записи, чья версия сменилась после захвата; один UPDATE
+# под блокировкой записи SQLite, так что два шлюза не получат один ценник
+CLAIM_SQL = text("""
+    UPDATE sync_outbox
+    SET lease_owner = :gateway, lease_expires_at = :expires, leased_version = sync_version
+    WHERE id IN (
+        SELECT o.id FROM sync_outbox o JOIN boards b ON b.id = o.board_id
+        WHERE (o.lease_expires_at IS NULL
+               OR o.lease_expires_at < :now
+               OR (o.lease_owner = :gateway AND o.leased_version != o.sync_version))
+          AND (b.zone IS NULL OR b.zone = :zone)
+        ORDER BY o.priority, o.id
+        LIMIT :limit
+    )
+    RETURNING board_id
+""")
+
+# Устаревший ACK: запись осталась в очереди с новой версией, но аренду
+# под старую отпускаем сразу, а не ждём её истечения. Если шлюз уже
+# перезахватил новую версию, leased_version другая и аренда остаётся
+RELEASE_LEASE_SQL = text("""
+    UPDATE sync_outbox SET lease_owner = NULL, lease_expires_at = NULL, leased_version = NULL
+    WHERE board_id = :board_id AND lease_owner = :gateway AND leased_version = :sync_version
+""")
+
+# Шлюз не может доставить ценник (например, в id нет номера узла mesh):
+# аренду снимает, а запись откладывает до :retry_at, иначе она вернулась бы
+# первой же пачкой и занимала в ней место
+RELEASE_LATER_SQL = text("""
+    UPDATE sync_outbox SET lease_owner = NULL, leased_version = NULL, lease_expires_at = :retry_at
+    WHERE board_id = :board_id AND lease_owner = :gateway AND leased_version = :sync_version
+""")
+
+BACKFILL_SQL = text("""
+    INSERT OR IGNORE INTO sync_outbox (board_id, sync_version, priority, created_at, updated_at, superseded)
+    SELECT id, sync_version, :priority, :now, :now, 0 FROM boards WHERE synced = 0
+""")
+
+
+def res_price(base_price, discount):
+    if base_price is None:
+        return None
+    return base_price * (1 - (discount or 0) / 100)
+
+
+def change_priority(old, new) -> int:
+    """old/new — объекты с product, base_price, discount"""
+    old_price = res_price(old.base_price, old.discount)
+    new_price = res_price(new.base_price, new.discount)
+    if old_price != new_price or old.discount != new.discount:
+        if new.discount and old_price is not None and new_price > old_price:
+            return PRIORITY_PROMO_PRICE_UP
+        return PRIORITY_PRICE
+    return PRIORITY_CONTENT
+
+
+def enqueue_params(board_id: str, priority: int) -> dict:
+    return {"board_id": board_id, "priority": priority, "now": time.time()}
+
+
+def claim_params(gateway: str, zone, limit: int, lease_seconds: float) -> dict:
+    now = time.time()
+    return {"gateway": gateway, "zone": zone, "limit": limit,
+            "now": now, "expires": now + lease_seconds}
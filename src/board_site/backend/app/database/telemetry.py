@@ -0,0 +1,154 @@
+import asyncio
+import math
+import time
+
+from sqlalchemy import text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import config
+from .db import AsyncSessionLocal
+from .models import TELEMETRY_COUNTERS, TelemetryNodeORM
+
+MINUTE = 60
+HOUR = 60 * 60
+
+RESOLUTIONS = {"minute": MINUTE, "hour": HOUR}
+
+_COLUMNS = ", ".join(TELEMETRY_COUNTERS)
+
+INSERT_EVENT_SQL = text(f"""
+    INSERT INTO telemetry_events (ts, gateway, node, {_COLUMNS}, latency_ms)
+    VALUES (:ts, :gateway, :node, {", ".join(":" + name for name in TELEMETRY_COUNTERS)}, :latency_ms)
+""")
+
+# Агрегаты пересчитываются целыми корзинами: повторный прогон по тем же
+# минутам даёт тот же результат, опоздавшие события просто попадают в пересчёт
+DELETE_ROLLUPS_SQL = text("""
+    DELETE FROM telemetry_rollups
+    WHERE resolution = :resolution AND bucket >= :start AND bucket < :end
+""")
+MINUTE_ROLLUP_SQL = text(f"""
+    INSERT INTO telemetry_rollups (resolution, bucket, gateway, node, {_COLUMNS},
+                                   latency_count, latency_sum, latency_min, latency_max)
+    SELECT {MINUTE}, CAST(ts / {MINUTE} AS INTEGER) * {MINUTE} AS minute, gateway, node,
+           {", ".join(f"SUM({name})" for name in TELEMETRY_COUNTERS)},
+           COUNT(latency_ms), COALESCE(SUM(latency_ms), 0), MIN(latency_ms), MAX(latency_ms)
+    FROM telemetry_events
+    WHERE ts >= :start AND ts < :end
+    GROUP BY minute, gateway, node
+""")
+HOUR_ROLLUP_SQL = text(f"""
+    INSERT INTO telemetry_rollups (resolution, bucket, gateway, node, {_COLUMNS},
+                                   latency_count, latency_sum, latency_min, latency_max)
+    SELECT {HOUR}, bucket / {HOUR} * {HOUR} AS hour, gateway, node,
+           {", ".join(f"SUM({name})" for name in TELEMETRY_COUNTERS)},
+           SUM(latency_count), SUM(latency_sum), MIN(latency_min), MAX(latency_max)
+    FROM telemetry_rollups
+    WHERE resolution = {MINUTE} AND bucket >= :start AND bucket < :end
+    GROUP BY hour, gateway, node
+""")
+
+COMPACT_SQL = (
+    text("DELETE FROM telemetry_events WHERE ts < :raw_cutoff"),
+    text(f"DELETE FROM telemetry_rollups WHERE resolution = {MINUTE} AND bucket < :minute_cutoff"),
+    text(f"DELETE FROM telemetry_rollups WHERE resolution = {HOUR} AND bucket < :hour_cutoff"),
+)
+
+def floor_to(ts: float, step: int) -> int:
+    return int(ts // step * step)
+
+
+def counter_deltas(last, snapshot: dict) -> dict:
+    # Счётчик меньше прошлого — узел перезагрузился и считает с нуля
+    deltas = {}
+    for name in TELEMETRY_COUNTERS:
+        value = snapshot[name]
+        previous = getattr(last, name) if last is not None else 0
+        deltas[name] = value - previous if value >= previous else value
+    return deltas
+
+
+async def record(db: AsyncSession, gateway: str, snapshots: list, latencies: list,
+                 now: float = None) -> int:
+    """snapshots — накопленные MeshNode.stats по узлам, latencies — (node, ms)"""
+    now = time.time() if now is None else now
+    nodes = {snapshot["node"] for snapshot in snapshots}
+    known = {
+        node.node: node
+        for node in (await db.scalars(
+            select(TelemetryNodeORM).where(
+                TelemetryNodeORM.gateway == gateway, TelemetryNodeORM.node.in_(nodes)
+            )
+        )).all()
+    } if nodes else {}
+
+    events = []
+    for snapshot in snapshots:
+        last = known.get(snapshot["node"])
+        events.append({"ts": now, "gateway": gateway, "node": snapshot["node"],
+                       "latency_ms": None, **counter_deltas(last, snapshot)})
+        if last is None:
+            last = known[snapshot["node"]] = TelemetryNodeORM(gateway=gateway, node=snapshot["node"])
+            db.add(last)
+        last.last_seen = now
+        for name in TELEMETRY_COUNTERS:
+            setattr(last, name, snapshot[name])
+
+    zeros = dict.fromkeys(TELEMETRY_COUNTERS, 0)
+    events += [
+        {"ts": now, "gateway": gateway, "node": node, "latency_ms": latency_ms, **zeros}
+        for node, latency_ms in latencies
+    ]
+    if events:
+        await db.execute(INSERT_EVENT_SQL, events)
+    return len(events)
+
+
+async def maintain(db: AsyncSession, now: float = None, last_rollup_at: float = None):
+    """
+    Пересчитывает минутные и часовые агрегаты и чистит старое по срокам хранения.
+    last_rollup_at — время прошлого прогона: пересчёт начинается чуть раньше него,
+    None — все минуты, по которым ещё есть сырые данные
+    """
+    now = time.time() if now is None else now
+    raw_cutoff = now - config.TELEMETRY_RAW_RETENTION_HOURS * HOUR
+    # Сырых данных старше raw_cutoff уже нет, эти минуты не трогаем
+    start = math.ceil(raw_cutoff / MINUTE) * MINUTE
+    if last_rollup_at is not None:
+        start = max(start, floor_to(last_rollup_at, MINUTE) - 2 * MINUTE)
+    end = floor_to(now, MINUTE)
+
+    if start < end:
+        minute_range = {"resolution": MINUTE, "start": start, "end": end}
+        await db.execute(DELETE_ROLLUPS_SQL, minute_range)
+        await db.execute(MINUTE_ROLLUP_SQL, minute_range)
+        hour_range = {"resolution": HOUR, "start": floor_to(start, HOUR), "end": end}
+        await db.execute(DELETE_ROLLUPS_SQL, hour_range)
+        await db.execute(HOUR_ROLLUP_SQL, hour_range)
+
+    cutoffs = {
+        "raw_cutoff": raw_cutoff,
+        "minute_cutoff": now - config.TELEMETRY_MINUTE_RETENTION_DAYS * 24 * HOUR,
+        "hour_cutoff": now - config.TELEMETRY_HOUR_RETENTION_DAYS * 24 * HOUR,
+    }
+    for statement in COMPACT_SQL:
+        await db.execute(statement, cutoffs)
+
+
+async def run_maintainer(interval: float = None):
+    """
+    Фоновая задача приложения: maintain раз в interval, даже когда шлюзы
+    молчат — последние минуты свернутся, а сырые данные уйдут по сроку
+    """
+    interval = config.TELEMETRY_ROLLUP_INTERVAL_SECONDS if interval is None else interval
+    last_rollup_at = None
+    while True:
+        now = time.time()
+        try:
+            async with AsyncSessionLocal() as db:
+                await maintain(db, now, last_rollup_at)
+                await db.commit()
+            last_rollup_at = now
+        except Exception as e:
+            print(f"Telemetry maintenance failed: {e}")
+        await asyncio.sleep(interval)
@@ -1,7 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from core import config
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt освобождает GIL, но каждая проверка — сотни мс CPU,
+# поэтому выполняем их в отдельном ограниченном пуле
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=config.BCRYPT_WORKERS, thread_name_prefix="bcrypt"
+)
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +20,10 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_executor, verify_password, plain_password, hashed_password
+    )
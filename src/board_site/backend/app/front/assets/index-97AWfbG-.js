@@ -6,4 +6,4 @@
 `+i[a].replace(" at new "," at ");return l.displayName&&b.includes("<anonymous>")&&(b=b.replace("<anonymous>",l.displayName)),b}while(1<=a&&0<=e);break}}}finally{Zn=!1,Error.prepareStackTrace=u}return(u=l?l.displayName||l.name:"")?Tu(u):""}function _v(l,t){switch(l.tag){case 26:case 27:case 5:return Tu(l.type);case 16:return Tu("Lazy");case 13:return l.child!==t&&t!==null?Tu("Suspense Fallback"):Tu("Suspense");case 19:return Tu("SuspenseList");case 0:case 15:return xn(l.type,!1);case 11:return xn(l.type.render,!1);case 1:return xn(l.type,!0);case 31:return Tu("Activity");default:return""}}function mi(l){try{var t="",u=null;do t+=_v(l,u),u=l,l=l.return;while(l);return t}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var Vn=Object.prototype.hasOwnProperty,Ln=O.unstable_scheduleCallback,Kn=O.unstable_cancelCallback,Ov=O.unstable_shouldYield,Mv=O.unstable_requestPaint,Fl=O.unstable_now,Dv=O.unstable_getCurrentPriorityLevel,hi=O.unstable_ImmediatePriority,oi=O.unstable_UserBlockingPriority,Te=O.unstable_NormalPriority,Uv=O.unstable_LowPriority,Si=O.unstable_IdlePriority,pv=O.log,Nv=O.unstable_setDisableYieldValue,Da=null,kl=null;function $t(l){if(typeof pv=="function"&&Nv(l),kl&&typeof kl.setStrictMode=="function")try{kl.setStrictMode(Da,l)}catch{}}var Il=Math.clz32?Math.clz32:Cv,Hv=Math.log,Rv=Math.LN2;function Cv(l){return l>>>=0,l===0?32:31-(Hv(l)/Rv|0)|0}var Ae=256,_e=262144,Oe=4194304;function Au(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Me(l,t,u){var a=l.pendingLanes;if(a===0)return 0;var e=0,n=l.suspendedLanes,f=l.pingedLanes;l=l.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?e=Au(a):(f&=c,f!==0?e=Au(f):u||(u=c&~l,u!==0&&(e=Au(u))))):(c=a&~n,c!==0?e=Au(c):f!==0?e=Au(f):u||(u=a&~l,u!==0&&(e=Au(u)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,u=t&-t,n>=u||n===32&&(u&4194048)!==0)?t:e}function Ua(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function qv(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function gi(){var l=Oe;return Oe<<=1,(Oe&62914560)===0&&(Oe=4194304),l}function Jn(l){for(var t=[],u=0;31>u;u++)t.push(l);return t}function pa(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Bv(l,t,u,a,e,n){var f=l.pendingLanes;l.pendingLanes=u,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=u,l.entangledLanes&=u,l.errorRecoveryDisabledLanes&=u,l.shellSuspendCounter=0;var c=l.entanglements,i=l.expirationTimes,m=l.hiddenUpdates;for(u=f&~u;0<u;){var b=31-Il(u),E=1<<b;c[b]=0,i[b]=-1;var h=m[b];if(h!==null)for(m[b]=null,b=0;b<h.length;b++){var g=h[b];g!==null&&(g.lane&=-536870913)}u&=~E}a!==0&&bi(l,a,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(f&~t))}function bi(l,t,u){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-Il(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|u&261930}function ri(l,t){var u=l.entangledLanes|=t;for(l=l.entanglements;u;){var a=31-Il(u),e=1<<a;e&t|l[a]&t&&(l[a]|=t),u&=~e}}function zi(l,t){var u=t&-t;return u=(u&42)!==0?1:wn(u),(u&(l.suspendedLanes|t))!==0?0:u}function wn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Wn(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Ei(){var l=A.p;return l!==0?l:(l=window.event,l===void 0?32:fv(l.type))}function Ti(l,t){var u=A.p;try{return A.p=l,t()}finally{A.p=u}}var Ft=Math.random().toString(36).slice(2),pl="__reactFiber$"+Ft,xl="__reactProps$"+Ft,xu="__reactContainer$"+Ft,$n="__reactEvents$"+Ft,Yv="__reactListeners$"+Ft,jv="__reactHandles$"+Ft,Ai="__reactResources$"+Ft,Na="__reactMarker$"+Ft;function Fn(l){delete l[pl],delete l[xl],delete l[$n],delete l[Yv],delete l[jv]}function Vu(l){var t=l[pl];if(t)return t;for(var u=l.parentNode;u;){if(t=u[xu]||u[pl]){if(u=t.alternate,t.child!==null||u!==null&&u.child!==null)for(l=Ly(l);l!==null;){if(u=l[pl])return u;l=Ly(l)}return t}l=u,u=l.parentNode}return null}function Lu(l){if(l=l[pl]||l[xu]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Ha(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(S(33))}function Ku(l){var t=l[Ai];return t||(t=l[Ai]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Dl(l){l[Na]=!0}var _i=new Set,Oi={};function _u(l,t){Ju(l,t),Ju(l+"Capture",t)}function Ju(l,t){for(Oi[l]=t,l=0;l<t.length;l++)_i.add(t[l])}var Gv=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Mi={},Di={};function Xv(l){return Vn.call(Di,l)?!0:Vn.call(Mi,l)?!1:Gv.test(l)?Di[l]=!0:(Mi[l]=!0,!1)}function De(l,t,u){if(Xv(t))if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+u)}}function Ue(l,t,u){if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+u)}}function Nt(l,t,u,a){if(a===null)l.removeAttribute(u);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(u);return}l.setAttributeNS(t,u,""+a)}}function ct(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Ui(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Qv(l,t,u){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var e=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(f){u=""+f,n.call(this,f)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return u},setValue:function(f){u=""+f},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function kn(l){if(!l._valueTracker){var t=Ui(l)?"checked":"value";l._valueTracker=Qv(l,t,""+l[t])}}function pi(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var u=t.getValue(),a="";return l&&(a=Ui(l)?l.checked?"true":"false":l.value),l=a,l!==u?(t.setValue(l),!0):!1}function pe(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Zv=/[\n"\\]/g;function it(l){return l.replace(Zv,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function In(l,t,u,a,e,n,f,c){l.name="",f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.type=f:l.removeAttribute("type"),t!=null?f==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+ct(t)):l.value!==""+ct(t)&&(l.value=""+ct(t)):f!=="submit"&&f!=="reset"||l.removeAttribute("value"),t!=null?Pn(l,f,ct(t)):u!=null?Pn(l,f,ct(u)):a!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+ct(c):l.removeAttribute("name")}function Ni(l,t,u,a,e,n,f,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||u!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){kn(l);return}u=u!=null?""+ct(u):"",t=t!=null?""+ct(t):u,c||t===l.value||(l.value=t),l.defaultValue=t}a=a??e,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=c?l.checked:!!a,l.defaultChecked=!!a,f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"&&(l.name=f),kn(l)}function Pn(l,t,u){t==="number"&&pe(l.ownerDocument)===l||l.defaultValue===""+u||(l.defaultValue=""+u)}function wu(l,t,u,a){if(l=l.options,t){t={};for(var e=0;e<u.length;e++)t["$"+u[e]]=!0;for(u=0;u<l.length;u++)e=t.hasOwnProperty("$"+l[u].value),l[u].selected!==e&&(l[u].selected=e),e&&a&&(l[u].defaultSelected=!0)}else{for(u=""+ct(u),t=null,e=0;e<l.length;e++){if(l[e].value===u){l[e].selected=!0,a&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Hi(l,t,u){if(t!=null&&(t=""+ct(t),t!==l.value&&(l.value=t),u==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=u!=null?""+ct(u):""}function Ri(l,t,u,a){if(t==null){if(a!=null){if(u!=null)throw Error(S(92));if(gt(a)){if(1<a.length)throw Error(S(93));a=a[0]}u=a}u==null&&(u=""),t=u}u=ct(t),l.defaultValue=u,a=l.textContent,a===u&&a!==""&&a!==null&&(l.value=a),kn(l)}function Wu(l,t){if(t){var u=l.firstChild;if(u&&u===l.lastChild&&u.nodeType===3){u.nodeValue=t;return}}l.textContent=t}var xv=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Ci(l,t,u){var a=t.indexOf("--")===0;u==null||typeof u=="boolean"||u===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,u):typeof u!="number"||u===0||xv.has(t)?t==="float"?l.cssFloat=u:l[t]=(""+u).trim():l[t]=u+"px"}function qi(l,t,u){if(t!=null&&typeof t!="object")throw Error(S(62));if(l=l.style,u!=null){for(var a in u)!u.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var e in t)a=t[e],t.hasOwnProperty(e)&&u[e]!==a&&Ci(l,e,a)}else for(var n in t)t.hasOwnProperty(n)&&Ci(l,n,t[n])}function lf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Vv=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Lv=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Ne(l){return Lv.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Ht(){}var tf=null;function uf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var $u=null,Fu=null;function Bi(l){var t=Lu(l);if(t&&(l=t.stateNode)){var u=l[xl]||null;l:switch(l=t.stateNode,t.type){case"input":if(In(l,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name),t=u.name,u.type==="radio"&&t!=null){for(u=l;u.parentNode;)u=u.parentNode;for(u=u.querySelectorAll('input[name="'+it(""+t)+'"][type="radio"]'),t=0;t<u.length;t++){var a=u[t];if(a!==l&&a.form===l.form){var e=a[xl]||null;if(!e)throw Error(S(90));In(a,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<u.length;t++)a=u[t],a.form===l.form&&pi(a)}break l;case"textarea":Hi(l,u.value,u.defaultValue);break l;case"select":t=u.value,t!=null&&wu(l,!!u.multiple,t,!1)}}}var af=!1;function Yi(l,t,u){if(af)return l(t,u);af=!0;try{var a=l(t);return a}finally{if(af=!1,($u!==null||Fu!==null)&&(bn(),$u&&(t=$u,l=Fu,Fu=$u=null,Bi(t),l)))for(t=0;t<l.length;t++)Bi(l[t])}}function Ra(l,t){var u=l.stateNode;if(u===null)return null;var a=u[xl]||null;if(a===null)return null;u=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(u&&typeof u!="function")throw Error(S(231,t,typeof u));return u}var Rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ef=!1;if(Rt)try{var Ca={};Object.defineProperty(Ca,"passive",{get:function(){ef=!0}}),window.addEventListener("test",Ca,Ca),window.removeEventListener("test",Ca,Ca)}catch{ef=!1}var kt=null,nf=null,He=null;function ji(){if(He)return He;var l,t=nf,u=t.length,a,e="value"in kt?kt.value:kt.textContent,n=e.length;for(l=0;l<u&&t[l]===e[l];l++);var f=u-l;for(a=1;a<=f&&t[u-a]===e[n-a];a++);return He=e.slice(l,1<a?1-a:void 0)}function Re(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Ce(){return!0}function Gi(){return!1}function Vl(l){function t(u,a,e,n,f){this._reactName=u,this._targetInst=e,this.type=a,this.nativeEvent=n,this.target=f,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(u=l[c],this[c]=u?u(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Ce:Gi,this.isPropagationStopped=Gi,this}return M(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var u=this.nativeEvent;u&&(u.preventDefault?u.preventDefault():typeof u.returnValue!="unknown"&&(u.returnValue=!1),this.isDefaultPrevented=Ce)},stopPropagation:function(){var u=this.nativeEvent;u&&(u.stopPropagation?u.stopPropagation():typeof u.cancelBubble!="unknown"&&(u.cancelBubble=!0),this.isPropagationStopped=Ce)},persist:function(){},isPersistent:Ce}),t}var Ou={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},qe=Vl(Ou),qa=M({},Ou,{view:0,detail:0}),Kv=Vl(qa),ff,cf,Ba,Be=M({},qa,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:yf,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Ba&&(Ba&&l.type==="mousemove"?(ff=l.screenX-Ba.screenX,cf=l.screenY-Ba.screenY):cf=ff=0,Ba=l),ff)},movementY:function(l){return"movementY"in l?l.movementY:cf}}),Xi=Vl(Be),Jv=M({},Be,{dataTransfer:0}),wv=Vl(Jv),Wv=M({},qa,{relatedTarget:0}),sf=Vl(Wv),$v=M({},Ou,{animationName:0,elapsedTime:0,pseudoElement:0}),Fv=Vl($v),kv=M({},Ou,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),Iv=Vl(kv),Pv=M({},Ou,{data:0}),Qi=Vl(Pv),ld={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},td={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},ud={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function ad(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=ud[l])?!!t[l]:!1}function yf(){return ad}var ed=M({},qa,{key:function(l){if(l.key){var t=ld[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=Re(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?td[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:yf,charCode:function(l){return l.type==="keypress"?Re(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?Re(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),nd=Vl(ed),fd=M({},Be,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Zi=Vl(fd),cd=M({},qa,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:yf}),id=Vl(cd),sd=M({},Ou,{propertyName:0,elapsedTime:0,pseudoElement:0}),yd=Vl(sd),vd=M({},Be,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),dd=Vl(vd),md=M({},Ou,{newState:0,oldState:0}),hd=Vl(md),od=[9,13,27,32],vf=Rt&&"CompositionEvent"in window,Ya=null;Rt&&"documentMode"in document&&(Ya=document.documentMode);var Sd=Rt&&"TextEvent"in window&&!Ya,xi=Rt&&(!vf||Ya&&8<Ya&&11>=Ya),Vi=" ",Li=!1;function Ki(l,t){switch(l){case"keyup":return od.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Ji(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var ku=!1;function gd(l,t){switch(l){case"compositionend":return Ji(t);case"keypress":return t.which!==32?null:(Li=!0,Vi);case"textInput":return l=t.data,l===Vi&&Li?null:l;default:return null}}function bd(l,t){if(ku)return l==="compositionend"||!vf&&Ki(l,t)?(l=ji(),He=nf=kt=null,ku=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return xi&&t.locale!=="ko"?null:t.data;default:return null}}var rd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function wi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!rd[l.type]:t==="textarea"}function Wi(l,t,u,a){$u?Fu?Fu.push(a):Fu=[a]:$u=a,t=On(t,"onChange"),0<t.length&&(u=new qe("onChange","change",null,u,a),l.push({event:u,listeners:t}))}var ja=null,Ga=null;function zd(l){Ny(l,0)}function Ye(l){var t=Ha(l);if(pi(t))return l}function $i(l,t){if(l==="change")return t}var Fi=!1;if(Rt){var df;if(Rt){var mf="oninput"in document;if(!mf){var ki=document.createElement("div");ki.setAttribute("oninput","return;"),mf=typeof ki.oninput=="function"}df=mf}else df=!1;Fi=df&&(!document.documentMode||9<document.documentMode)}function Ii(){ja&&(ja.detachEvent("onpropertychange",Pi),Ga=ja=null)}function Pi(l){if(l.propertyName==="value"&&Ye(Ga)){var t=[];Wi(t,Ga,l,uf(l)),Yi(zd,t)}}function Ed(l,t,u){l==="focusin"?(Ii(),ja=t,Ga=u,ja.attachEvent("onpropertychange",Pi)):l==="focusout"&&Ii()}function Td(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Ye(Ga)}function Ad(l,t){if(l==="click")return Ye(t)}function _d(l,t){if(l==="input"||l==="change")return Ye(t)}function Od(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var Pl=typeof Object.is=="function"?Object.is:Od;function Xa(l,t){if(Pl(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var u=Object.keys(l),a=Object.keys(t);if(u.length!==a.length)return!1;for(a=0;a<u.length;a++){var e=u[a];if(!Vn.call(t,e)||!Pl(l[e],t[e]))return!1}return!0}function l0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function t0(l,t){var u=l0(l);l=0;for(var a;u;){if(u.nodeType===3){if(a=l+u.textContent.length,l<=t&&a>=t)return{node:u,offset:t-l};l=a}l:{for(;u;){if(u.nextSibling){u=u.nextSibling;break l}u=u.parentNode}u=void 0}u=l0(u)}}function u0(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?u0(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function a0(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=pe(l.document);t instanceof l.HTMLIFrameElement;){try{var u=typeof t.contentWindow.location.href=="string"}catch{u=!1}if(u)l=t.contentWindow;else break;t=pe(l.document)}return t}function hf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Md=Rt&&"documentMode"in document&&11>=document.documentMode,Iu=null,of=null,Qa=null,Sf=!1;function e0(l,t,u){var a=u.window===u?u.document:u.nodeType===9?u:u.ownerDocument;Sf||Iu==null||Iu!==pe(a)||(a=Iu,"selectionStart"in a&&hf(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Qa&&Xa(Qa,a)||(Qa=a,a=On(of,"onSelect"),0<a.length&&(t=new qe("onSelect","select",null,t,u),l.push({event:t,listeners:a}),t.target=Iu)))}function Mu(l,t){var u={};return u[l.toLowerCase()]=t.toLowerCase(),u["Webkit"+l]="webkit"+t,u["Moz"+l]="moz"+t,u}var Pu={animationend:Mu("Animation","AnimationEnd"),animationiteration:Mu("Animation","AnimationIteration"),animationstart:Mu("Animation","AnimationStart"),transitionrun:Mu("Transition","TransitionRun"),transitionstart:Mu("Transition","TransitionStart"),transitioncancel:Mu("Transition","TransitionCancel"),transitionend:Mu("Transition","TransitionEnd")},gf={},n0={};Rt&&(n0=document.createElement("div").style,"AnimationEvent"in window||(delete Pu.animationend.animation,delete Pu.animationiteration.animation,delete Pu.animationstart.animation),"TransitionEvent"in window||delete Pu.transitionend.transition);function Du(l){if(gf[l])return gf[l];if(!Pu[l])return l;var t=Pu[l],u;for(u in t)if(t.hasOwnProperty(u)&&u in n0)return gf[l]=t[u];return l}var f0=Du("animationend"),c0=Du("animationiteration"),i0=Du("animationstart"),Dd=Du("transitionrun"),Ud=Du("transitionstart"),pd=Du("transitioncancel"),s0=Du("transitionend"),y0=new Map,bf="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");bf.push("scrollEnd");function bt(l,t){y0.set(l,t),_u(t,[l])}var je=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},st=[],la=0,rf=0;function Ge(){for(var l=la,t=rf=la=0;t<l;){var u=st[t];st[t++]=null;var a=st[t];st[t++]=null;var e=st[t];st[t++]=null;var n=st[t];if(st[t++]=null,a!==null&&e!==null){var f=a.pending;f===null?e.next=e:(e.next=f.next,f.next=e),a.pending=e}n!==0&&v0(u,e,n)}}function Xe(l,t,u,a){st[la++]=l,st[la++]=t,st[la++]=u,st[la++]=a,rf|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function zf(l,t,u,a){return Xe(l,t,u,a),Qe(l)}function Uu(l,t){return Xe(l,null,null,t),Qe(l)}function v0(l,t,u){l.lanes|=u;var a=l.alternate;a!==null&&(a.lanes|=u);for(var e=!1,n=l.return;n!==null;)n.childLanes|=u,a=n.alternate,a!==null&&(a.childLanes|=u),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-Il(u),l=n.hiddenUpdates,a=l[e],a===null?l[e]=[t]:a.push(t),t.lane=u|536870912),n):null}function Qe(l){if(50<ie)throw ie=0,pc=null,Error(S(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ta={};function Nd(l,t,u,a){this.tag=l,this.key=u,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function lt(l,t,u,a){return new Nd(l,t,u,a)}function Ef(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Ct(l,t){var u=l.alternate;return u===null?(u=lt(l.tag,t,l.key,l.mode),u.elementType=l.elementType,u.type=l.type,u.stateNode=l.stateNode,u.alternate=l,l.alternate=u):(u.pendingProps=t,u.type=l.type,u.flags=0,u.subtreeFlags=0,u.deletions=null),u.flags=l.flags&65011712,u.childLanes=l.childLanes,u.lanes=l.lanes,u.child=l.child,u.memoizedProps=l.memoizedProps,u.memoizedState=l.memoizedState,u.updateQueue=l.updateQueue,t=l.dependencies,u.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},u.sibling=l.sibling,u.index=l.index,u.ref=l.ref,u.refCleanup=l.refCleanup,u}function d0(l,t){l.flags&=65011714;var u=l.alternate;return u===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,t=u.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Ze(l,t,u,a,e,n){var f=0;if(a=l,typeof l=="function")Ef(l)&&(f=1);else if(typeof l=="string")f=Bm(l,u,p.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case Tt:return l=lt(31,u,t,e),l.elementType=Tt,l.lanes=n,l;case Yl:return pu(u.children,e,n,t);case Ut:f=8,e|=24;break;case $l:return l=lt(12,u,t,e|2),l.elementType=$l,l.lanes=n,l;case Et:return l=lt(13,u,t,e),l.elementType=Et,l.lanes=n,l;case Xl:return l=lt(19,u,t,e),l.elementType=Xl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case ql:f=10;break l;case Wt:f=9;break l;case ft:f=11;break l;case w:f=14;break l;case Ql:f=16,a=null;break l}f=29,u=Error(S(130,l===null?"null":typeof l,"")),a=null}return t=lt(f,u,t,e),t.elementType=l,t.type=a,t.lanes=n,t}function pu(l,t,u,a){return l=lt(7,l,a,t),l.lanes=u,l}function Tf(l,t,u){return l=lt(6,l,null,t),l.lanes=u,l}function m0(l){var t=lt(18,null,null,0);return t.stateNode=l,t}function Af(l,t,u){return t=lt(4,l.children!==null?l.children:[],l.key,t),t.lanes=u,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var h0=new WeakMap;function yt(l,t){if(typeof l=="object"&&l!==null){var u=h0.get(l);return u!==void 0?u:(t={value:l,source:t,stack:mi(t)},h0.set(l,t),t)}return{value:l,source:t,stack:mi(t)}}var ua=[],aa=0,xe=null,Za=0,vt=[],dt=0,It=null,_t=1,Ot="";function qt(l,t){ua[aa++]=Za,ua[aa++]=xe,xe=l,Za=t}function o0(l,t,u){vt[dt++]=_t,vt[dt++]=Ot,vt[dt++]=It,It=l;var a=_t;l=Ot;var e=32-Il(a)-1;a&=~(1<<e),u+=1;var n=32-Il(t)+e;if(30<n){var f=e-e%5;n=(a&(1<<f)-1).toString(32),a>>=f,e-=f,_t=1<<32-Il(t)+e|u<<e|a,Ot=n+l}else _t=1<<n|u<<e|a,Ot=l}function _f(l){l.return!==null&&(qt(l,1),o0(l,1,0))}function Of(l){for(;l===xe;)xe=ua[--aa],ua[aa]=null,Za=ua[--aa],ua[aa]=null;for(;l===It;)It=vt[--dt],vt[dt]=null,Ot=vt[--dt],vt[dt]=null,_t=vt[--dt],vt[dt]=null}function S0(l,t){vt[dt++]=_t,vt[dt++]=Ot,vt[dt++]=It,_t=t.id,Ot=t.overflow,It=l}var Nl=null,dl=null,W=!1,Pt=null,mt=!1,Mf=Error(S(519));function lu(l){var t=Error(S(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw xa(yt(t,l)),Mf}function g0(l){var t=l.stateNode,u=l.type,a=l.memoizedProps;switch(t[pl]=l,t[xl]=a,u){case"dialog":V("cancel",t),V("close",t);break;case"iframe":case"object":case"embed":V("load",t);break;case"video":case"audio":for(u=0;u<ye.length;u++)V(ye[u],t);break;case"source":V("error",t);break;case"img":case"image":case"link":V("error",t),V("load",t);break;case"details":V("toggle",t);break;case"input":V("invalid",t),Ni(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":V("invalid",t);break;case"textarea":V("invalid",t),Ri(t,a.value,a.defaultValue,a.children)}u=a.children,typeof u!="string"&&typeof u!="number"&&typeof u!="bigint"||t.textContent===""+u||a.suppressHydrationWarning===!0||qy(t.textContent,u)?(a.popover!=null&&(V("beforetoggle",t),V("toggle",t)),a.onScroll!=null&&V("scroll",t),a.onScrollEnd!=null&&V("scrollend",t),a.onClick!=null&&(t.onclick=Ht),t=!0):t=!1,t||lu(l,!0)}function b0(l){for(Nl=l.return;Nl;)switch(Nl.tag){case 5:case 31:case 13:mt=!1;return;case 27:case 3:mt=!0;return;default:Nl=Nl.return}}function ea(l){if(l!==Nl)return!1;if(!W)return b0(l),W=!0,!1;var t=l.tag,u;if((u=t!==3&&t!==27)&&((u=t===5)&&(u=l.type,u=!(u!=="form"&&u!=="button")||Lc(l.type,l.memoizedProps)),u=!u),u&&dl&&lu(l),b0(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(S(317));dl=Vy(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(S(317));dl=Vy(l)}else t===27?(t=dl,hu(l.type)?(l=$c,$c=null,dl=l):dl=t):dl=Nl?ot(l.stateNode.nextSibling):null;return!0}function Nu(){dl=Nl=null,W=!1}function Df(){var l=Pt;return l!==null&&(wl===null?wl=l:wl.push.apply(wl,l),Pt=null),l}function xa(l){Pt===null?Pt=[l]:Pt.push(l)}var Uf=y(null),Hu=null,Bt=null;function tu(l,t,u){_(Uf,t._currentValue),t._currentValue=u}function Yt(l){l._currentValue=Uf.current,T(Uf)}function pf(l,t,u){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===u)break;l=l.return}}function Nf(l,t,u,a){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var f=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var i=0;i<t.length;i++)if(c.context===t[i]){n.lanes|=u,c=n.alternate,c!==null&&(c.lanes|=u),pf(n.return,u,l),a||(f=null);break l}n=c.next}}else if(e.tag===18){if(f=e.return,f===null)throw Error(S(341));f.lanes|=u,n=f.alternate,n!==null&&(n.lanes|=u),pf(f,u,l),f=null}else f=e.child;if(f!==null)f.return=e;else for(f=e;f!==null;){if(f===l){f=null;break}if(e=f.sibling,e!==null){e.return=f.return,f=e;break}f=f.return}e=f}}function na(l,t,u,a){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var f=e.alternate;if(f===null)throw Error(S(387));if(f=f.memoizedProps,f!==null){var c=e.type;Pl(e.pendingProps.value,f.value)||(l!==null?l.push(c):l=[c])}}else if(e===ul.current){if(f=e.alternate,f===null)throw Error(S(387));f.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(oe):l=[oe])}e=e.return}l!==null&&Nf(t,l,u,a),t.flags|=262144}function Ve(l){for(l=l.firstContext;l!==null;){if(!Pl(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Ru(l){Hu=l,Bt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Hl(l){return r0(Hu,l)}function Le(l,t){return Hu===null&&Ru(l),r0(l,t)}function r0(l,t){var u=t._currentValue;if(t={context:t,memoizedValue:u,next:null},Bt===null){if(l===null)throw Error(S(308));Bt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Bt=Bt.next=t;return u}var Hd=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(u,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(u){return u()})}},Rd=O.unstable_scheduleCallback,Cd=O.unstable_NormalPriority,Tl={$$typeof:ql,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Hf(){return{controller:new Hd,data:new Map,refCount:0}}function Va(l){l.refCount--,l.refCount===0&&Rd(Cd,function(){l.controller.abort()})}var La=null,Rf=0,fa=0,ca=null;function qd(l,t){if(La===null){var u=La=[];Rf=0,fa=Bc(),ca={status:"pending",value:void 0,then:function(a){u.push(a)}}}return Rf++,t.then(z0,z0),t}function z0(){if(--Rf===0&&La!==null){ca!==null&&(ca.status="fulfilled");var l=La;La=null,fa=0,ca=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Bd(l,t){var u=[],a={status:"pending",value:null,reason:null,then:function(e){u.push(e)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var e=0;e<u.length;e++)(0,u[e])(t)},function(e){for(a.status="rejected",a.reason=e,e=0;e<u.length;e++)(0,u[e])(void 0)}),a}var E0=r.S;r.S=function(l,t){ey=Fl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&qd(l,t),E0!==null&&E0(l,t)};var Cu=y(null);function Cf(){var l=Cu.current;return l!==null?l:vl.pooledCache}function Ke(l,t){t===null?_(Cu,Cu.current):_(Cu,t.pool)}function T0(){var l=Cf();return l===null?null:{parent:Tl._currentValue,pool:l}}var ia=Error(S(460)),qf=Error(S(474)),Je=Error(S(542)),we={then:function(){}};function A0(l){return l=l.status,l==="fulfilled"||l==="rejected"}function _0(l,t,u){switch(u=l[u],u===void 0?l.push(t):u!==t&&(t.then(Ht,Ht),t=u),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,M0(l),l;default:if(typeof t.status=="string")t.then(Ht,Ht);else{if(l=vl,l!==null&&100<l.shellSuspendCounter)throw Error(S(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=a}},function(a){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,M0(l),l}throw Bu=t,ia}}function qu(l){try{var t=l._init;return t(l._payload)}catch(u){throw u!==null&&typeof u=="object"&&typeof u.then=="function"?(Bu=u,ia):u}}var Bu=null;function O0(){if(Bu===null)throw Error(S(459));var l=Bu;return Bu=null,l}function M0(l){if(l===ia||l===Je)throw Error(S(483))}var sa=null,Ka=0;function We(l){var t=Ka;return Ka+=1,sa===null&&(sa=[]),_0(sa,l,t)}function Ja(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function $e(l,t){throw t.$$typeof===P?Error(S(525)):(l=Object.prototype.toString.call(t),Error(S(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function D0(l){function t(v,s){if(l){var d=v.deletions;d===null?(v.deletions=[s],v.flags|=16):d.push(s)}}function u(v,s){if(!l)return null;for(;s!==null;)t(v,s),s=s.sibling;return null}function a(v){for(var s=new Map;v!==null;)v.key!==null?s.set(v.key,v):s.set(v.index,v),v=v.sibling;return s}function e(v,s){return v=Ct(v,s),v.index=0,v.sibling=null,v}function n(v,s,d){return v.index=d,l?(d=v.alternate,d!==null?(d=d.index,d<s?(v.flags|=67108866,s):d):(v.flags|=67108866,s)):(v.flags|=1048576,s)}function f(v){return l&&v.alternate===null&&(v.flags|=67108866),v}function c(v,s,d,z){return s===null||s.tag!==6?(s=Tf(d,v.mode,z),s.return=v,s):(s=e(s,d),s.return=v,s)}function i(v,s,d,z){var R=d.type;return R===Yl?b(v,s,d.props.children,z,d.key):s!==null&&(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===Ql&&qu(R)===s.type)?(s=e(s,d.props),Ja(s,d),s.return=v,s):(s=Ze(d.type,d.key,d.props,null,v.mode,z),Ja(s,d),s.return=v,s)}function m(v,s,d,z){return s===null||s.tag!==4||s.stateNode.containerInfo!==d.containerInfo||s.stateNode.implementation!==d.implementation?(s=Af(d,v.mode,z),s.return=v,s):(s=e(s,d.children||[]),s.return=v,s)}function b(v,s,d,z,R){return s===null||s.tag!==7?(s=pu(d,v.mode,z,R),s.return=v,s):(s=e(s,d),s.return=v,s)}function E(v,s,d){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Tf(""+s,v.mode,d),s.return=v,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case ll:return d=Ze(s.type,s.key,s.props,null,v.mode,d),Ja(d,s),d.return=v,d;case El:return s=Af(s,v.mode,d),s.return=v,s;case Ql:return s=qu(s),E(v,s,d)}if(gt(s)||Zl(s))return s=pu(s,v.mode,d,null),s.return=v,s;if(typeof s.then=="function")return E(v,We(s),d);if(s.$$typeof===ql)return E(v,Le(v,s),d);$e(v,s)}return null}function h(v,s,d,z){var R=s!==null?s.key:null;if(typeof d=="string"&&d!==""||typeof d=="number"||typeof d=="bigint")return R!==null?null:c(v,s,""+d,z);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case ll:return d.key===R?i(v,s,d,z):null;case El:return d.key===R?m(v,s,d,z):null;case Ql:return d=qu(d),h(v,s,d,z)}if(gt(d)||Zl(d))return R!==null?null:b(v,s,d,z,null);if(typeof d.then=="function")return h(v,s,We(d),z);if(d.$$typeof===ql)return h(v,s,Le(v,d),z);$e(v,d)}return null}function g(v,s,d,z,R){if(typeof z=="string"&&z!==""||typeof z=="number"||typeof z=="bigint")return v=v.get(d)||null,c(s,v,""+z,R);if(typeof z=="object"&&z!==null){switch(z.$$typeof){case ll:return v=v.get(z.key===null?d:z.key)||null,i(s,v,z,R);case El:return v=v.get(z.key===null?d:z.key)||null,m(s,v,z,R);case Ql:return z=qu(z),g(v,s,d,z,R)}if(gt(z)||Zl(z))return v=v.get(d)||null,b(s,v,z,R,null);if(typeof z.then=="function")return g(v,s,d,We(z),R);if(z.$$typeof===ql)return g(v,s,d,Le(s,z),R);$e(s,z)}return null}function D(v,s,d,z){for(var R=null,F=null,N=s,X=s=0,J=null;N!==null&&X<d.length;X++){N.index>X?(J=N,N=null):J=N.sibling;var k=h(v,N,d[X],z);if(k===null){N===null&&(N=J);break}l&&N&&k.alternate===null&&t(v,N),s=n(k,s,X),F===null?R=k:F.sibling=k,F=k,N=J}if(X===d.length)return u(v,N),W&&qt(v,X),R;if(N===null){for(;X<d.length;X++)N=E(v,d[X],z),N!==null&&(s=n(N,s,X),F===null?R=N:F.sibling=N,F=N);return W&&qt(v,X),R}for(N=a(N);X<d.length;X++)J=g(N,v,X,d[X],z),J!==null&&(l&&J.alternate!==null&&N.delete(J.key===null?X:J.key),s=n(J,s,X),F===null?R=J:F.sibling=J,F=J);return l&&N.forEach(function(ru){return t(v,ru)}),W&&qt(v,X),R}function C(v,s,d,z){if(d==null)throw Error(S(151));for(var R=null,F=null,N=s,X=s=0,J=null,k=d.next();N!==null&&!k.done;X++,k=d.next()){N.index>X?(J=N,N=null):J=N.sibling;var ru=h(v,N,k.value,z);if(ru===null){N===null&&(N=J);break}l&&N&&ru.alternate===null&&t(v,N),s=n(ru,s,X),F===null?R=ru:F.sibling=ru,F=ru,N=J}if(k.done)return u(v,N),W&&qt(v,X),R;if(N===null){for(;!k.done;X++,k=d.next())k=E(v,k.value,z),k!==null&&(s=n(k,s,X),F===null?R=k:F.sibling=k,F=k);return W&&qt(v,X),R}for(N=a(N);!k.done;X++,k=d.next())k=g(N,v,X,k.value,z),k!==null&&(l&&k.alternate!==null&&N.delete(k.key===null?X:k.key),s=n(k,s,X),F===null?R=k:F.sibling=k,F=k);return l&&N.forEach(function(Jm){return t(v,Jm)}),W&&qt(v,X),R}function sl(v,s,d,z){if(typeof d=="object"&&d!==null&&d.type===Yl&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case ll:l:{for(var R=d.key;s!==null;){if(s.key===R){if(R=d.type,R===Yl){if(s.tag===7){u(v,s.sibling),z=e(s,d.props.children),z.return=v,v=z;break l}}else if(s.elementType===R||typeof R=="object"&&R!==null&&R.$$typeof===Ql&&qu(R)===s.type){u(v,s.sibling),z=e(s,d.props),Ja(z,d),z.return=v,v=z;break l}u(v,s);break}else t(v,s);s=s.sibling}d.type===Yl?(z=pu(d.props.children,v.mode,z,d.key),z.return=v,v=z):(z=Ze(d.type,d.key,d.props,null,v.mode,z),Ja(z,d),z.return=v,v=z)}return f(v);case El:l:{for(R=d.key;s!==null;){if(s.key===R)if(s.tag===4&&s.stateNode.containerInfo===d.containerInfo&&s.stateNode.implementation===d.implementation){u(v,s.sibling),z=e(s,d.children||[]),z.return=v,v=z;break l}else{u(v,s);break}else t(v,s);s=s.sibling}z=Af(d,v.mode,z),z.return=v,v=z}return f(v);case Ql:return d=qu(d),sl(v,s,d,z)}if(gt(d))return D(v,s,d,z);if(Zl(d)){if(R=Zl(d),typeof R!="function")throw Error(S(150));return d=R.call(d),C(v,s,d,z)}if(typeof d.then=="function")return sl(v,s,We(d),z);if(d.$$typeof===ql)return sl(v,s,Le(v,d),z);$e(v,d)}return typeof d=="string"&&d!==""||typeof d=="number"||typeof d=="bigint"?(d=""+d,s!==null&&s.tag===6?(u(v,s.sibling),z=e(s,d),z.return=v,v=z):(u(v,s),z=Tf(d,v.mode,z),z.return=v,v=z),f(v)):u(v,s)}return function(v,s,d,z){try{Ka=0;var R=sl(v,s,d,z);return sa=null,R}catch(N){if(N===ia||N===Je)throw N;var F=lt(29,N,null,v.mode);return F.lanes=z,F.return=v,F}}}var Yu=D0(!0),U0=D0(!1),uu=!1;function Bf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Yf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function au(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function eu(l,t,u){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(tl&2)!==0){var e=a.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),a.pending=t,t=Qe(l),v0(l,null,u),t}return Xe(l,a,t,u),Qe(l)}function wa(l,t,u){if(t=t.updateQueue,t!==null&&(t=t.shared,(u&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,ri(l,u)}}function jf(l,t){var u=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,u===a)){var e=null,n=null;if(u=u.firstBaseUpdate,u!==null){do{var f={lane:u.lane,tag:u.tag,payload:u.payload,callback:null,next:null};n===null?e=n=f:n=n.next=f,u=u.next}while(u!==null);n===null?e=n=t:n=n.next=t}else e=n=t;u={baseState:a.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=u;return}l=u.lastBaseUpdate,l===null?u.firstBaseUpdate=t:l.next=t,u.lastBaseUpdate=t}var Gf=!1;function Wa(){if(Gf){var l=ca;if(l!==null)throw l}}function $a(l,t,u,a){Gf=!1;var e=l.updateQueue;uu=!1;var n=e.firstBaseUpdate,f=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var i=c,m=i.next;i.next=null,f===null?n=m:f.next=m,f=i;var b=l.alternate;b!==null&&(b=b.updateQueue,c=b.lastBaseUpdate,c!==f&&(c===null?b.firstBaseUpdate=m:c.next=m,b.lastBaseUpdate=i))}if(n!==null){var E=e.baseState;f=0,b=m=i=null,c=n;do{var h=c.lane&-536870913,g=h!==c.lane;if(g?(K&h)===h:(a&h)===h){h!==0&&h===fa&&(Gf=!0),b!==null&&(b=b.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var D=l,C=c;h=t;var sl=u;switch(C.tag){case 1:if(D=C.payload,typeof D=="function"){E=D.call(sl,E,h);break l}E=D;break l;case 3:D.flags=D.flags&-65537|128;case 0:if(D=C.payload,h=typeof D=="function"?D.call(sl,E,h):D,h==null)break l;E=M({},E,h);break l;case 2:uu=!0}}h=c.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=e.callbacks,g===null?e.callbacks=[h]:g.push(h))}else g={lane:h,tag:c.tag,payload:c.payload,callback:c.callback,next:null},b===null?(m=b=g,i=E):b=b.next=g,f|=h;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;g=c,c=g.next,g.next=null,e.lastBaseUpdate=g,e.shared.pending=null}}while(!0);b===null&&(i=E),e.baseState=i,e.firstBaseUpdate=m,e.lastBaseUpdate=b,n===null&&(e.shared.lanes=0),su|=f,l.lanes=f,l.memoizedState=E}}function p0(l,t){if(typeof l!="function")throw Error(S(191,l));l.call(t)}function N0(l,t){var u=l.callbacks;if(u!==null)for(l.callbacks=null,l=0;l<u.length;l++)p0(u[l],t)}var ya=y(null),Fe=y(0);function H0(l,t){l=Kt,_(Fe,l),_(ya,t),Kt=l|t.baseLanes}function Xf(){_(Fe,Kt),_(ya,ya.current)}function Qf(){Kt=Fe.current,T(ya),T(Fe)}var tt=y(null),ht=null;function nu(l){var t=l.alternate;_(bl,bl.current&1),_(tt,l),ht===null&&(t===null||ya.current!==null||t.memoizedState!==null)&&(ht=l)}function Zf(l){_(bl,bl.current),_(tt,l),ht===null&&(ht=l)}function R0(l){l.tag===22?(_(bl,bl.current),_(tt,l),ht===null&&(ht=l)):fu()}function fu(){_(bl,bl.current),_(tt,tt.current)}function ut(l){T(tt),ht===l&&(ht=null),T(bl)}var bl=y(0);function ke(l){for(var t=l;t!==null;){if(t.tag===13){var u=t.memoizedState;if(u!==null&&(u=u.dehydrated,u===null||wc(u)||Wc(u)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var jt=0,G=null,cl=null,Al=null,Ie=!1,va=!1,ju=!1,Pe=0,Fa=0,da=null,Yd=0;function ol(){throw Error(S(321))}function xf(l,t){if(t===null)return!1;for(var u=0;u<t.length&&u<l.length;u++)if(!Pl(l[u],t[u]))return!1;return!0}function Vf(l,t,u,a,e,n){return jt=n,G=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,r.H=l===null||l.memoizedState===null?os:ec,ju=!1,n=u(a,e),ju=!1,va&&(n=q0(t,u,a,e)),C0(l),n}function C0(l){r.H=Pa;var t=cl!==null&&cl.next!==null;if(jt=0,Al=cl=G=null,Ie=!1,Fa=0,da=null,t)throw Error(S(300));l===null||_l||(l=l.dependencies,l!==null&&Ve(l)&&(_l=!0))}function q0(l,t,u,a){G=l;var e=0;do{if(va&&(da=null),Fa=0,va=!1,25<=e)throw Error(S(301));if(e+=1,Al=cl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}r.H=Ss,n=t(u,a)}while(va);return n}function jd(){var l=r.H,t=l.useState()[0];return t=typeof t.then=="function"?ka(t):t,l=l.useState()[0],(cl!==null?cl.memoizedState:null)!==l&&(G.flags|=1024),t}function Lf(){var l=Pe!==0;return Pe=0,l}function Kf(l,t,u){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~u}function Jf(l){if(Ie){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Ie=!1}jt=0,Al=cl=G=null,va=!1,Fa=Pe=0,da=null}function Gl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Al===null?G.memoizedState=Al=l:Al=Al.next=l,Al}function rl(){if(cl===null){var l=G.alternate;l=l!==null?l.memoizedState:null}else l=cl.next;var t=Al===null?G.memoizedState:Al.next;if(t!==null)Al=t,cl=l;else{if(l===null)throw G.alternate===null?Error(S(467)):Error(S(310));cl=l,l={memoizedState:cl.memoizedState,baseState:cl.baseState,baseQueue:cl.baseQueue,queue:cl.queue,next:null},Al===null?G.memoizedState=Al=l:Al=Al.next=l}return Al}function ln(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function ka(l){var t=Fa;return Fa+=1,da===null&&(da=[]),l=_0(da,l,t),t=G,(Al===null?t.memoizedState:Al.next)===null&&(t=t.alternate,r.H=t===null||t.memoizedState===null?os:ec),l}function tn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return ka(l);if(l.$$typeof===ql)return Hl(l)}throw Error(S(438,String(l)))}function wf(l){var t=null,u=G.updateQueue;if(u!==null&&(t=u.memoCache),t==null){var a=G.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),u===null&&(u=ln(),G.updateQueue=u),u.memoCache=t,u=t.data[t.index],u===void 0)for(u=t.data[t.index]=Array(l),a=0;a<l;a++)u[a]=Zu;return t.index++,u}function Gt(l,t){return typeof t=="function"?t(l):t}function un(l){var t=rl();return Wf(t,cl,l)}function Wf(l,t,u){var a=l.queue;if(a===null)throw Error(S(311));a.lastRenderedReducer=u;var e=l.baseQueue,n=a.pending;if(n!==null){if(e!==null){var f=e.next;e.next=n.next,n.next=f}t.baseQueue=e=n,a.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=f=null,i=null,m=t,b=!1;do{var E=m.lane&-536870913;if(E!==m.lane?(K&E)===E:(jt&E)===E){var h=m.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null}),E===fa&&(b=!0);else if((jt&h)===h){m=m.next,h===fa&&(b=!0);continue}else E={lane:0,revertLane:m.revertLane,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=E,f=n):i=i.next=E,G.lanes|=h,su|=h;E=m.action,ju&&u(n,E),n=m.hasEagerState?m.eagerState:u(n,E)}else h={lane:E,revertLane:m.revertLane,gesture:m.gesture,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=h,f=n):i=i.next=h,G.lanes|=E,su|=E;m=m.next}while(m!==null&&m!==t);if(i===null?f=n:i.next=c,!Pl(n,l.memoizedState)&&(_l=!0,b&&(u=ca,u!==null)))throw u;l.memoizedState=n,l.baseState=f,l.baseQueue=i,a.lastRenderedState=n}return e===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function $f(l){var t=rl(),u=t.queue;if(u===null)throw Error(S(311));u.lastRenderedReducer=l;var a=u.dispatch,e=u.pending,n=t.memoizedState;if(e!==null){u.pending=null;var f=e=e.next;do n=l(n,f.action),f=f.next;while(f!==e);Pl(n,t.memoizedState)||(_l=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),u.lastRenderedState=n}return[n,a]}function B0(l,t,u){var a=G,e=rl(),n=W;if(n){if(u===void 0)throw Error(S(407));u=u()}else u=t();var f=!Pl((cl||e).memoizedState,u);if(f&&(e.memoizedState=u,_l=!0),e=e.queue,If(G0.bind(null,a,e,l),[l]),e.getSnapshot!==t||f||Al!==null&&Al.memoizedState.tag&1){if(a.flags|=2048,ma(9,{destroy:void 0},j0.bind(null,a,e,u,t),null),vl===null)throw Error(S(349));n||(jt&127)!==0||Y0(a,t,u)}return u}function Y0(l,t,u){l.flags|=16384,l={getSnapshot:t,value:u},t=G.updateQueue,t===null?(t=ln(),G.updateQueue=t,t.stores=[l]):(u=t.stores,u===null?t.stores=[l]:u.push(l))}function j0(l,t,u,a){t.value=u,t.getSnapshot=a,X0(t)&&Q0(l)}function G0(l,t,u){return u(function(){X0(t)&&Q0(l)})}function X0(l){var t=l.getSnapshot;l=l.value;try{var u=t();return!Pl(l,u)}catch{return!0}}function Q0(l){var t=Uu(l,2);t!==null&&Wl(t,l,2)}function Ff(l){var t=Gl();if(typeof l=="function"){var u=l;if(l=u(),ju){$t(!0);try{u()}finally{$t(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:l},t}function Z0(l,t,u,a){return l.baseState=u,Wf(l,cl,typeof a=="function"?a:Gt)}function Gd(l,t,u,a,e){if(nn(l))throw Error(S(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(f){n.listeners.push(f)}};r.T!==null?u(!0):n.isTransition=!1,a(n),u=t.pending,u===null?(n.next=t.pending=n,x0(t,n)):(n.next=u.next,t.pending=u.next=n)}}function x0(l,t){var u=t.action,a=t.payload,e=l.state;if(t.isTransition){var n=r.T,f={};r.T=f;try{var c=u(e,a),i=r.S;i!==null&&i(f,c),V0(l,t,c)}catch(m){kf(l,t,m)}finally{n!==null&&f.types!==null&&(n.types=f.types),r.T=n}}else try{n=u(e,a),V0(l,t,n)}catch(m){kf(l,t,m)}}function V0(l,t,u){u!==null&&typeof u=="object"&&typeof u.then=="function"?u.then(function(a){L0(l,t,a)},function(a){return kf(l,t,a)}):L0(l,t,u)}function L0(l,t,u){t.status="fulfilled",t.value=u,K0(t),l.state=u,t=l.pending,t!==null&&(u=t.next,u===t?l.pending=null:(u=u.next,t.next=u,x0(l,u)))}function kf(l,t,u){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=u,K0(t),t=t.next;while(t!==a)}l.action=null}function K0(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function J0(l,t){return t}function w0(l,t){if(W){var u=vl.formState;if(u!==null){l:{var a=G;if(W){if(dl){t:{for(var e=dl,n=mt;e.nodeType!==8;){if(!n){e=null;break t}if(e=ot(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){dl=ot(e.nextSibling),a=e.data==="F!";break l}}lu(a)}a=!1}a&&(t=u[0])}}return u=Gl(),u.memoizedState=u.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:J0,lastRenderedState:t},u.queue=a,u=ds.bind(null,G,a),a.dispatch=u,a=Ff(!1),n=ac.bind(null,G,!1,a.queue),a=Gl(),e={state:t,dispatch:null,action:l,pending:null},a.queue=e,u=Gd.bind(null,G,e,n,u),e.dispatch=u,a.memoizedState=l,[t,u,!1]}function W0(l){var t=rl();return $0(t,cl,l)}function $0(l,t,u){if(t=Wf(l,t,J0)[0],l=un(Gt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=ka(t)}catch(f){throw f===ia?Je:f}else a=t;t=rl();var e=t.queue,n=e.dispatch;return u!==t.memoizedState&&(G.flags|=2048,ma(9,{destroy:void 0},Xd.bind(null,e,u),null)),[a,n,l]}function Xd(l,t){l.action=t}function F0(l){var t=rl(),u=cl;if(u!==null)return $0(t,u,l);rl(),t=t.memoizedState,u=rl();var a=u.queue.dispatch;return u.memoizedState=l,[t,a,!1]}function ma(l,t,u,a){return l={tag:l,create:u,deps:a,inst:t,next:null},t=G.updateQueue,t===null&&(t=ln(),G.updateQueue=t),u=t.lastEffect,u===null?t.lastEffect=l.next=l:(a=u.next,u.next=l,l.next=a,t.lastEffect=l),l}function k0(){return rl().memoizedState}function an(l,t,u,a){var e=Gl();G.flags|=l,e.memoizedState=ma(1|t,{destroy:void 0},u,a===void 0?null:a)}function en(l,t,u,a){var e=rl();a=a===void 0?null:a;var n=e.memoizedState.inst;cl!==null&&a!==null&&xf(a,cl.memoizedState.deps)?e.memoizedState=ma(t,n,u,a):(G.flags|=l,e.memoizedState=ma(1|t,n,u,a))}function I0(l,t){an(8390656,8,l,t)}function If(l,t){en(2048,8,l,t)}function Qd(l){G.flags|=4;var t=G.updateQueue;if(t===null)t=ln(),G.updateQueue=t,t.events=[l];else{var u=t.events;u===null?t.events=[l]:u.push(l)}}function P0(l){var t=rl().memoizedState;return Qd({ref:t,nextImpl:l}),function(){if((tl&2)!==0)throw Error(S(440));return t.impl.apply(void 0,arguments)}}function ls(l,t){return en(4,2,l,t)}function ts(l,t){return en(4,4,l,t)}function us(l,t){if(typeof t=="function"){l=l();var u=t(l);return function(){typeof u=="function"?u():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function as(l,t,u){u=u!=null?u.concat([l]):null,en(4,4,us.bind(null,t,l),u)}function Pf(){}function es(l,t){var u=rl();t=t===void 0?null:t;var a=u.memoizedState;return t!==null&&xf(t,a[1])?a[0]:(u.memoizedState=[l,t],l)}function ns(l,t){var u=rl();t=t===void 0?null:t;var a=u.memoizedState;if(t!==null&&xf(t,a[1]))return a[0];if(a=l(),ju){$t(!0);try{l()}finally{$t(!1)}}return u.memoizedState=[a,t],a}function lc(l,t,u){return u===void 0||(jt&1073741824)!==0&&(K&261930)===0?l.memoizedState=t:(l.memoizedState=u,l=fy(),G.lanes|=l,su|=l,u)}function fs(l,t,u,a){return Pl(u,t)?u:ya.current!==null?(l=lc(l,u,a),Pl(l,t)||(_l=!0),l):(jt&42)===0||(jt&1073741824)!==0&&(K&261930)===0?(_l=!0,l.memoizedState=u):(l=fy(),G.lanes|=l,su|=l,t)}function cs(l,t,u,a,e){var n=A.p;A.p=n!==0&&8>n?n:8;var f=r.T,c={};r.T=c,ac(l,!1,t,u);try{var i=e(),m=r.S;if(m!==null&&m(c,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var b=Bd(i,a);Ia(l,t,b,nt(l))}else Ia(l,t,a,nt(l))}catch(E){Ia(l,t,{then:function(){},status:"rejected",reason:E},nt())}finally{A.p=n,f!==null&&c.types!==null&&(f.types=c.types),r.T=f}}function Zd(){}function tc(l,t,u,a){if(l.tag!==5)throw Error(S(476));var e=is(l).queue;cs(l,e,t,q,u===null?Zd:function(){return ss(l),u(a)})}function is(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:q,baseState:q,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:q},next:null};var u={};return t.next={memoizedState:u,baseState:u,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:u},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function ss(l){var t=is(l);t.next===null&&(t=l.alternate.memoizedState),Ia(l,t.next.queue,{},nt())}function uc(){return Hl(oe)}function ys(){return rl().memoizedState}function vs(){return rl().memoizedState}function xd(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var u=nt();l=au(u);var a=eu(t,l,u);a!==null&&(Wl(a,t,u),wa(a,t,u)),t={cache:Hf()},l.payload=t;return}t=t.return}}function Vd(l,t,u){var a=nt();u={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},nn(l)?ms(t,u):(u=zf(l,t,u,a),u!==null&&(Wl(u,l,a),hs(u,t,a)))}function ds(l,t,u){var a=nt();Ia(l,t,u,a)}function Ia(l,t,u,a){var e={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null};if(nn(l))ms(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var f=t.lastRenderedState,c=n(f,u);if(e.hasEagerState=!0,e.eagerState=c,Pl(c,f))return Xe(l,t,e,0),vl===null&&Ge(),!1}catch{}if(u=zf(l,t,e,a),u!==null)return Wl(u,l,a),hs(u,t,a),!0}return!1}function ac(l,t,u,a){if(a={lane:2,revertLane:Bc(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},nn(l)){if(t)throw Error(S(479))}else t=zf(l,u,a,2),t!==null&&Wl(t,l,2)}function nn(l){var t=l.alternate;return l===G||t!==null&&t===G}function ms(l,t){va=Ie=!0;var u=l.pending;u===null?t.next=t:(t.next=u.next,u.next=t),l.pending=t}function hs(l,t,u){if((u&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,ri(l,u)}}var Pa={readContext:Hl,use:tn,useCallback:ol,useContext:ol,useEffect:ol,useImperativeHandle:ol,useLayoutEffect:ol,useInsertionEffect:ol,useMemo:ol,useReducer:ol,useRef:ol,useState:ol,useDebugValue:ol,useDeferredValue:ol,useTransition:ol,useSyncExternalStore:ol,useId:ol,useHostTransitionStatus:ol,useFormState:ol,useActionState:ol,useOptimistic:ol,useMemoCache:ol,useCacheRefresh:ol};Pa.useEffectEvent=ol;var os={readContext:Hl,use:tn,useCallback:function(l,t){return Gl().memoizedState=[l,t===void 0?null:t],l},useContext:Hl,useEffect:I0,useImperativeHandle:function(l,t,u){u=u!=null?u.concat([l]):null,an(4194308,4,us.bind(null,t,l),u)},useLayoutEffect:function(l,t){return an(4194308,4,l,t)},useInsertionEffect:function(l,t){an(4,2,l,t)},useMemo:function(l,t){var u=Gl();t=t===void 0?null:t;var a=l();if(ju){$t(!0);try{l()}finally{$t(!1)}}return u.memoizedState=[a,t],a},useReducer:function(l,t,u){var a=Gl();if(u!==void 0){var e=u(t);if(ju){$t(!0);try{u(t)}finally{$t(!1)}}}else e=t;return a.memoizedState=a.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},a.queue=l,l=l.dispatch=Vd.bind(null,G,l),[a.memoizedState,l]},useRef:function(l){var t=Gl();return l={current:l},t.memoizedState=l},useState:function(l){l=Ff(l);var t=l.queue,u=ds.bind(null,G,t);return t.dispatch=u,[l.memoizedState,u]},useDebugValue:Pf,useDeferredValue:function(l,t){var u=Gl();return lc(u,l,t)},useTransition:function(){var l=Ff(!1);return l=cs.bind(null,G,l.queue,!0,!1),Gl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,u){var a=G,e=Gl();if(W){if(u===void 0)throw Error(S(407));u=u()}else{if(u=t(),vl===null)throw Error(S(349));(K&127)!==0||Y0(a,t,u)}e.memoizedState=u;var n={value:u,getSnapshot:t};return e.queue=n,I0(G0.bind(null,a,n,l),[l]),a.flags|=2048,ma(9,{destroy:void 0},j0.bind(null,a,n,u,t),null),u},useId:function(){var l=Gl(),t=vl.identifierPrefix;if(W){var u=Ot,a=_t;u=(a&~(1<<32-Il(a)-1)).toString(32)+u,t="_"+t+"R_"+u,u=Pe++,0<u&&(t+="H"+u.toString(32)),t+="_"}else u=Yd++,t="_"+t+"r_"+u.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:uc,useFormState:w0,useActionState:w0,useOptimistic:function(l){var t=Gl();t.memoizedState=t.baseState=l;var u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=u,t=ac.bind(null,G,!0,u),u.dispatch=t,[l,t]},useMemoCache:wf,useCacheRefresh:function(){return Gl().memoizedState=xd.bind(null,G)},useEffectEvent:function(l){var t=Gl(),u={impl:l};return t.memoizedState=u,function(){if((tl&2)!==0)throw Error(S(440));return u.impl.apply(void 0,arguments)}}},ec={readContext:Hl,use:tn,useCallback:es,useContext:Hl,useEffect:If,useImperativeHandle:as,useInsertionEffect:ls,useLayoutEffect:ts,useMemo:ns,useReducer:un,useRef:k0,useState:function(){return un(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=rl();return fs(u,cl.memoizedState,l,t)},useTransition:function(){var l=un(Gt)[0],t=rl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:B0,useId:ys,useHostTransitionStatus:uc,useFormState:W0,useActionState:W0,useOptimistic:function(l,t){var u=rl();return Z0(u,cl,l,t)},useMemoCache:wf,useCacheRefresh:vs};ec.useEffectEvent=P0;var Ss={readContext:Hl,use:tn,useCallback:es,useContext:Hl,useEffect:If,useImperativeHandle:as,useInsertionEffect:ls,useLayoutEffect:ts,useMemo:ns,useReducer:$f,useRef:k0,useState:function(){return $f(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=rl();return cl===null?lc(u,l,t):fs(u,cl.memoizedState,l,t)},useTransition:function(){var l=$f(Gt)[0],t=rl().memoizedState;return[typeof l=="boolean"?l:ka(l),t]},useSyncExternalStore:B0,useId:ys,useHostTransitionStatus:uc,useFormState:F0,useActionState:F0,useOptimistic:function(l,t){var u=rl();return cl!==null?Z0(u,cl,l,t):(u.baseState=l,[l,u.queue.dispatch])},useMemoCache:wf,useCacheRefresh:vs};Ss.useEffectEvent=P0;function nc(l,t,u,a){t=l.memoizedState,u=u(a,t),u=u==null?t:M({},t,u),l.memoizedState=u,l.lanes===0&&(l.updateQueue.baseState=u)}var fc={enqueueSetState:function(l,t,u){l=l._reactInternals;var a=nt(),e=au(a);e.payload=t,u!=null&&(e.callback=u),t=eu(l,e,a),t!==null&&(Wl(t,l,a),wa(t,l,a))},enqueueReplaceState:function(l,t,u){l=l._reactInternals;var a=nt(),e=au(a);e.tag=1,e.payload=t,u!=null&&(e.callback=u),t=eu(l,e,a),t!==null&&(Wl(t,l,a),wa(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var u=nt(),a=au(u);a.tag=2,t!=null&&(a.callback=t),t=eu(l,a,u),t!==null&&(Wl(t,l,u),wa(t,l,u))}};function gs(l,t,u,a,e,n,f){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,f):t.prototype&&t.prototype.isPureReactComponent?!Xa(u,a)||!Xa(e,n):!0}function bs(l,t,u,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(u,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(u,a),t.state!==l&&fc.enqueueReplaceState(t,t.state,null)}function Gu(l,t){var u=t;if("ref"in t){u={};for(var a in t)a!=="ref"&&(u[a]=t[a])}if(l=l.defaultProps){u===t&&(u=M({},u));for(var e in l)u[e]===void 0&&(u[e]=l[e])}return u}function rs(l){je(l)}function zs(l){console.error(l)}function Es(l){je(l)}function fn(l,t){try{var u=l.onUncaughtError;u(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function Ts(l,t,u){try{var a=l.onCaughtError;a(u.value,{componentStack:u.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function cc(l,t,u){return u=au(u),u.tag=3,u.payload={element:null},u.callback=function(){fn(l,t)},u}function As(l){return l=au(l),l.tag=3,l}function _s(l,t,u,a){var e=u.type.getDerivedStateFromError;if(typeof e=="function"){var n=a.value;l.payload=function(){return e(n)},l.callback=function(){Ts(t,u,a)}}var f=u.stateNode;f!==null&&typeof f.componentDidCatch=="function"&&(l.callback=function(){Ts(t,u,a),typeof e!="function"&&(yu===null?yu=new Set([this]):yu.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Ld(l,t,u,a,e){if(u.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=u.alternate,t!==null&&na(t,u,e,!0),u=tt.current,u!==null){switch(u.tag){case 31:case 13:return ht===null?rn():u.alternate===null&&Sl===0&&(Sl=3),u.flags&=-257,u.flags|=65536,u.lanes=e,a===we?u.flags|=16384:(t=u.updateQueue,t===null?u.updateQueue=new Set([a]):t.add(a),Rc(l,a,e)),!1;case 22:return u.flags|=65536,a===we?u.flags|=16384:(t=u.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},u.updateQueue=t):(u=t.retryQueue,u===null?t.retryQueue=new Set([a]):u.add(a)),Rc(l,a,e)),!1}throw Error(S(435,u.tag))}return Rc(l,a,e),rn(),!1}if(W)return t=tt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,a!==Mf&&(l=Error(S(422),{cause:a}),xa(yt(l,u)))):(a!==Mf&&(t=Error(S(423),{cause:a}),xa(yt(t,u))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,a=yt(a,u),e=cc(l.stateNode,a,e),jf(l,e),Sl!==4&&(Sl=2)),!1;var n=Error(S(520),{cause:a});if(n=yt(n,u),ce===null?ce=[n]:ce.push(n),Sl!==4&&(Sl=2),t===null)return!0;a=yt(a,u),u=t;do{switch(u.tag){case 3:return u.flags|=65536,l=e&-e,u.lanes|=l,l=cc(u.stateNode,a,l),jf(u,l),!1;case 1:if(t=u.type,n=u.stateNode,(u.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(yu===null||!yu.has(n))))return u.flags|=65536,e&=-e,u.lanes|=e,e=As(e),_s(e,l,u,a),jf(u,e),!1}u=u.return}while(u!==null);return!1}var ic=Error(S(461)),_l=!1;function Rl(l,t,u,a){t.child=l===null?U0(t,null,u,a):Yu(t,l.child,u,a)}function Os(l,t,u,a,e){u=u.render;var n=t.ref;if("ref"in a){var f={};for(var c in a)c!=="ref"&&(f[c]=a[c])}else f=a;return Ru(t),a=Vf(l,t,u,f,n,e),c=Lf(),l!==null&&!_l?(Kf(l,t,e),Xt(l,t,e)):(W&&c&&_f(t),t.flags|=1,Rl(l,t,a,e),t.child)}function Ms(l,t,u,a,e){if(l===null){var n=u.type;return typeof n=="function"&&!Ef(n)&&n.defaultProps===void 0&&u.compare===null?(t.tag=15,t.type=n,Ds(l,t,n,a,e)):(l=Ze(u.type,null,a,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Sc(l,e)){var f=n.memoizedProps;if(u=u.compare,u=u!==null?u:Xa,u(f,a)&&l.ref===t.ref)return Xt(l,t,e)}return t.flags|=1,l=Ct(n,a),l.ref=t.ref,l.return=t,t.child=l}function Ds(l,t,u,a,e){if(l!==null){var n=l.memoizedProps;if(Xa(n,a)&&l.ref===t.ref)if(_l=!1,t.pendingProps=a=n,Sc(l,e))(l.flags&131072)!==0&&(_l=!0);else return t.lanes=l.lanes,Xt(l,t,e)}return sc(l,t,u,a,e)}function Us(l,t,u,a){var e=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|u:u,l!==null){for(a=t.child=l.child,e=0;a!==null;)e=e|a.lanes|a.childLanes,a=a.sibling;a=e&~n}else a=0,t.child=null;return ps(l,t,n,u,a)}if((u&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Ke(t,n!==null?n.cachePool:null),n!==null?H0(t,n):Xf(),R0(t);else return a=t.lanes=536870912,ps(l,t,n!==null?n.baseLanes|u:u,u,a)}else n!==null?(Ke(t,n.cachePool),H0(t,n),fu(),t.memoizedState=null):(l!==null&&Ke(t,null),Xf(),fu());return Rl(l,t,e,u),t.child}function le(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function ps(l,t,u,a,e){var n=Cf();return n=n===null?null:{parent:Tl._currentValue,pool:n},t.memoizedState={baseLanes:u,cachePool:n},l!==null&&Ke(t,null),Xf(),R0(t),l!==null&&na(l,t,a,!0),t.childLanes=e,null}function cn(l,t){return t=yn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Ns(l,t,u){return Yu(t,l.child,null,u),l=cn(t,t.pendingProps),l.flags|=2,ut(t),t.memoizedState=null,l}function Kd(l,t,u){var a=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(W){if(a.mode==="hidden")return l=cn(t,a),t.lanes=536870912,le(null,l);if(Zf(t),(l=dl)?(l=xy(l,mt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:It!==null?{id:_t,overflow:Ot}:null,retryLane:536870912,hydrationErrors:null},u=m0(l),u.return=t,t.child=u,Nl=t,dl=null)):l=null,l===null)throw lu(t);return t.lanes=536870912,null}return cn(t,a)}var n=l.memoizedState;if(n!==null){var f=n.dehydrated;if(Zf(t),e)if(t.flags&256)t.flags&=-257,t=Ns(l,t,u);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(S(558));else if(_l||na(l,t,u,!1),e=(u&l.childLanes)!==0,_l||e){if(a=vl,a!==null&&(f=zi(a,u),f!==0&&f!==n.retryLane))throw n.retryLane=f,Uu(l,f),Wl(a,l,f),ic;rn(),t=Ns(l,t,u)}else l=n.treeContext,dl=ot(f.nextSibling),Nl=t,W=!0,Pt=null,mt=!1,l!==null&&S0(t,l),t=cn(t,a),t.flags|=4096;return t}return l=Ct(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function sn(l,t){var u=t.ref;if(u===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof u!="function"&&typeof u!="object")throw Error(S(284));(l===null||l.ref!==u)&&(t.flags|=4194816)}}function sc(l,t,u,a,e){return Ru(t),u=Vf(l,t,u,a,void 0,e),a=Lf(),l!==null&&!_l?(Kf(l,t,e),Xt(l,t,e)):(W&&a&&_f(t),t.flags|=1,Rl(l,t,u,e),t.child)}function Hs(l,t,u,a,e,n){return Ru(t),t.updateQueue=null,u=q0(t,a,u,e),C0(l),a=Lf(),l!==null&&!_l?(Kf(l,t,n),Xt(l,t,n)):(W&&a&&_f(t),t.flags|=1,Rl(l,t,u,n),t.child)}function Rs(l,t,u,a,e){if(Ru(t),t.stateNode===null){var n=ta,f=u.contextType;typeof f=="object"&&f!==null&&(n=Hl(f)),n=new u(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=fc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},Bf(t),f=u.contextType,n.context=typeof f=="object"&&f!==null?Hl(f):ta,n.state=t.memoizedState,f=u.getDerivedStateFromProps,typeof f=="function"&&(nc(t,u,f,a),n.state=t.memoizedState),typeof u.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(f=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),f!==n.state&&fc.enqueueReplaceState(n,n.state,null),$a(t,a,n,e),Wa(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,i=Gu(u,c);n.props=i;var m=n.context,b=u.contextType;f=ta,typeof b=="object"&&b!==null&&(f=Hl(b));var E=u.getDerivedStateFromProps;b=typeof E=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,b||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||m!==f)&&bs(t,n,a,f),uu=!1;var h=t.memoizedState;n.state=h,$a(t,a,n,e),Wa(),m=t.memoizedState,c||h!==m||uu?(typeof E=="function"&&(nc(t,u,E,a),m=t.memoizedState),(i=uu||gs(t,u,i,a,h,m,f))?(b||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=m),n.props=a,n.state=m,n.context=f,a=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,Yf(l,t),f=t.memoizedProps,b=Gu(u,f),n.props=b,E=t.pendingProps,h=n.context,m=u.contextType,i=ta,typeof m=="object"&&m!==null&&(i=Hl(m)),c=u.getDerivedStateFromProps,(m=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f!==E||h!==i)&&bs(t,n,a,i),uu=!1,h=t.memoizedState,n.state=h,$a(t,a,n,e),Wa();var g=t.memoizedState;f!==E||h!==g||uu||l!==null&&l.dependencies!==null&&Ve(l.dependencies)?(typeof c=="function"&&(nc(t,u,c,a),g=t.memoizedState),(b=uu||gs(t,u,b,a,h,g,i)||l!==null&&l.dependencies!==null&&Ve(l.dependencies))?(m||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,g,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,g,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=g),n.props=a,n.state=g,n.context=i,a=b):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,sn(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,u=a&&typeof u.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Yu(t,l.child,null,e),t.child=Yu(t,null,u,e)):Rl(l,t,u,e),t.memoizedState=n.state,l=t.child):l=Xt(l,t,e),l}function Cs(l,t,u,a){return Nu(),t.flags|=256,Rl(l,t,u,a),t.child}var yc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function vc(l){return{baseLanes:l,cachePool:T0()}}function dc(l,t,u){return l=l!==null?l.childLanes&~u:0,t&&(l|=et),l}function qs(l,t,u){var a=t.pendingProps,e=!1,n=(t.flags&128)!==0,f;if((f=n)||(f=l!==null&&l.memoizedState===null?!1:(bl.current&2)!==0),f&&(e=!0,t.flags&=-129),f=(t.flags&32)!==0,t.flags&=-33,l===null){if(W){if(e?nu(t):fu(),(l=dl)?(l=xy(l,mt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:It!==null?{id:_t,overflow:Ot}:null,retryLane:536870912,hydrationErrors:null},u=m0(l),u.return=t,t.child=u,Nl=t,dl=null)):l=null,l===null)throw lu(t);return Wc(l)?t.lanes=32:t.lanes=536870912,null}var c=a.children;return a=a.fallback,e?(fu(),e=t.mode,c=yn({mode:"hidden",children:c},e),a=pu(a,e,u,null),c.return=t,a.return=t,c.sibling=a,t.child=c,a=t.child,a.memoizedState=vc(u),a.childLanes=dc(l,f,u),t.memoizedState=yc,le(null,a)):(nu(t),mc(t,c))}var i=l.memoizedState;if(i!==null&&(c=i.dehydrated,c!==null)){if(n)t.flags&256?(nu(t),t.flags&=-257,t=hc(l,t,u)):t.memoizedState!==null?(fu(),t.child=l.child,t.flags|=128,t=null):(fu(),c=a.fallback,e=t.mode,a=yn({mode:"visible",children:a.children},e),c=pu(c,e,u,null),c.flags|=2,a.return=t,c.return=t,a.sibling=c,t.child=a,Yu(t,l.child,null,u),a=t.child,a.memoizedState=vc(u),a.childLanes=dc(l,f,u),t.memoizedState=yc,t=le(null,a));else if(nu(t),Wc(c)){if(f=c.nextSibling&&c.nextSibling.dataset,f)var m=f.dgst;f=m,a=Error(S(419)),a.stack="",a.digest=f,xa({value:a,source:null,stack:null}),t=hc(l,t,u)}else if(_l||na(l,t,u,!1),f=(u&l.childLanes)!==0,_l||f){if(f=vl,f!==null&&(a=zi(f,u),a!==0&&a!==i.retryLane))throw i.retryLane=a,Uu(l,a),Wl(f,l,a),ic;wc(c)||rn(),t=hc(l,t,u)}else wc(c)?(t.flags|=192,t.child=l.child,t=null):(l=i.treeContext,dl=ot(c.nextSibling),Nl=t,W=!0,Pt=null,mt=!1,l!==null&&S0(t,l),t=mc(t,a.children),t.flags|=4096);return t}return e?(fu(),c=a.fallback,e=t.mode,i=l.child,m=i.sibling,a=Ct(i,{mode:"hidden",children:a.children}),a.subtreeFlags=i.subtreeFlags&65011712,m!==null?c=Ct(m,c):(c=pu(c,e,u,null),c.flags|=2),c.return=t,a.return=t,a.sibling=c,t.child=a,le(null,a),a=t.child,c=l.child.memoizedState,c===null?c=vc(u):(e=c.cachePool,e!==null?(i=Tl._currentValue,e=e.parent!==i?{parent:i,pool:i}:e):e=T0(),c={baseLanes:c.baseLanes|u,cachePool:e}),a.memoizedState=c,a.childLanes=dc(l,f,u),t.memoizedState=yc,le(l.child,a)):(nu(t),u=l.child,l=u.sibling,u=Ct(u,{mode:"visible",children:a.children}),u.return=t,u.sibling=null,l!==null&&(f=t.deletions,f===null?(t.deletions=[l],t.flags|=16):f.push(l)),t.child=u,t.memoizedState=null,u)}function mc(l,t){return t=yn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function yn(l,t){return l=lt(22,l,null,t),l.lanes=0,l}function hc(l,t,u){return Yu(t,l.child,null,u),l=mc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Bs(l,t,u){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),pf(l.return,t,u)}function oc(l,t,u,a,e,n){var f=l.memoizedState;f===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:u,tailMode:e,treeForkCount:n}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=a,f.tail=u,f.tailMode=e,f.treeForkCount=n)}function Ys(l,t,u){var a=t.pendingProps,e=a.revealOrder,n=a.tail;a=a.children;var f=bl.current,c=(f&2)!==0;if(c?(f=f&1|2,t.flags|=128):f&=1,_(bl,f),Rl(l,t,a,u),a=W?Za:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Bs(l,u,t);else if(l.tag===19)Bs(l,u,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(u=t.child,e=null;u!==null;)l=u.alternate,l!==null&&ke(l)===null&&(e=u),u=u.sibling;u=e,u===null?(e=t.child,t.child=null):(e=u.sibling,u.sibling=null),oc(t,!1,e,u,n,a);break;case"backwards":case"unstable_legacy-backwards":for(u=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&ke(l)===null){t.child=e;break}l=e.sibling,e.sibling=u,u=e,e=l}oc(t,!0,u,null,n,a);break;case"together":oc(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Xt(l,t,u){if(l!==null&&(t.dependencies=l.dependencies),su|=t.lanes,(u&t.childLanes)===0)if(l!==null){if(na(l,t,u,!1),(u&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(S(153));if(t.child!==null){for(l=t.child,u=Ct(l,l.pendingProps),t.child=u,u.return=t;l.sibling!==null;)l=l.sibling,u=u.sibling=Ct(l,l.pendingProps),u.return=t;u.sibling=null}return t.child}function Sc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Ve(l)))}function Jd(l,t,u){switch(t.tag){case 3:jl(t,t.stateNode.containerInfo),tu(t,Tl,l.memoizedState.cache),Nu();break;case 27:case 5:Ma(t);break;case 4:jl(t,t.stateNode.containerInfo);break;case 10:tu(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Zf(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(nu(t),t.flags|=128,null):(u&t.child.childLanes)!==0?qs(l,t,u):(nu(t),l=Xt(l,t,u),l!==null?l.sibling:null);nu(t);break;case 19:var e=(l.flags&128)!==0;if(a=(u&t.childLanes)!==0,a||(na(l,t,u,!1),a=(u&t.childLanes)!==0),e){if(a)return Ys(l,t,u);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),_(bl,bl.current),a)break;return null;case 22:return t.lanes=0,Us(l,t,u,t.pendingProps);case 24:tu(t,Tl,l.memoizedState.cache)}return Xt(l,t,u)}function js(l,t,u){if(l!==null)if(l.memoizedProps!==t.pendingProps)_l=!0;else{if(!Sc(l,u)&&(t.flags&128)===0)return _l=!1,Jd(l,t,u);_l=(l.flags&131072)!==0}else _l=!1,W&&(t.flags&1048576)!==0&&o0(t,Za,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=qu(t.elementType),t.type=l,typeof l=="function")Ef(l)?(a=Gu(l,a),t.tag=1,t=Rs(null,t,l,a,u)):(t.tag=0,t=sc(null,t,l,a,u));else{if(l!=null){var e=l.$$typeof;if(e===ft){t.tag=11,t=Os(null,t,l,a,u);break l}else if(e===w){t.tag=14,t=Ms(null,t,l,a,u);break l}}throw t=pt(l)||l,Error(S(306,t,""))}}return t;case 0:return sc(l,t,t.type,t.pendingProps,u);case 1:return a=t.type,e=Gu(a,t.pendingProps),Rs(l,t,a,e,u);case 3:l:{if(jl(t,t.stateNode.containerInfo),l===null)throw Error(S(387));a=t.pendingProps;var n=t.memoizedState;e=n.element,Yf(l,t),$a(t,a,null,u);var f=t.memoizedState;if(a=f.cache,tu(t,Tl,a),a!==n.cache&&Nf(t,[Tl],u,!0),Wa(),a=f.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:f.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=Cs(l,t,a,u);break l}else if(a!==e){e=yt(Error(S(424)),t),xa(e),t=Cs(l,t,a,u);break l}else for(l=t.stateNode.containerInfo,l.nodeType===9?l=l.body:l=l.nodeName==="HTML"?l.ownerDocument.body:l,dl=ot(l.firstChild),Nl=t,W=!0,Pt=null,mt=!0,u=U0(t,null,a,u),t.child=u;u;)u.flags=u.flags&-3|4096,u=u.sibling;else{if(Nu(),a===e){t=Xt(l,t,u);break l}Rl(l,t,a,u)}t=t.child}return t;case 26:return sn(l,t),l===null?(u=Wy(t.type,null,t.pendingProps,null))?t.memoizedState=u:W||(u=t.type,l=t.pendingProps,a=Mn(Z.current).createElement(u),a[pl]=t,a[xl]=l,Cl(a,u,l),Dl(a),t.stateNode=a):t.memoizedState=Wy(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Ma(t),l===null&&W&&(a=t.stateNode=Ky(t.type,t.pendingProps,Z.current),Nl=t,mt=!0,e=dl,hu(t.type)?($c=e,dl=ot(a.firstChild)):dl=e),Rl(l,t,t.pendingProps.children,u),sn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&W&&((e=a=dl)&&(a=Tm(a,t.type,t.pendingProps,mt),a!==null?(t.stateNode=a,Nl=t,dl=ot(a.firstChild),mt=!1,e=!0):e=!1),e||lu(t)),Ma(t),e=t.type,n=t.pendingProps,f=l!==null?l.memoizedProps:null,a=n.children,Lc(e,n)?a=null:f!==null&&Lc(e,f)&&(t.flags|=32),t.memoizedState!==null&&(e=Vf(l,t,jd,null,null,u),oe._currentValue=e),sn(l,t),Rl(l,t,a,u),t.child;case 6:return l===null&&W&&((l=u=dl)&&(u=Am(u,t.pendingProps,mt),u!==null?(t.stateNode=u,Nl=t,dl=null,l=!0):l=!1),l||lu(t)),null;case 13:return qs(l,t,u);case 4:return jl(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Yu(t,null,a,u):Rl(l,t,a,u),t.child;case 11:return Os(l,t,t.type,t.pendingProps,u);case 7:return Rl(l,t,t.pendingProps,u),t.child;case 8:return Rl(l,t,t.pendingProps.children,u),t.child;case 12:return Rl(l,t,t.pendingProps.children,u),t.child;case 10:return a=t.pendingProps,tu(t,t.type,a.value),Rl(l,t,a.children,u),t.child;case 9:return e=t.type._context,a=t.pendingProps.children,Ru(t),e=Hl(e),a=a(e),t.flags|=1,Rl(l,t,a,u),t.child;case 14:return Ms(l,t,t.type,t.pendingProps,u);case 15:return Ds(l,t,t.type,t.pendingProps,u);case 19:return Ys(l,t,u);case 31:return Kd(l,t,u);case 22:return Us(l,t,u,t.pendingProps);case 24:return Ru(t),a=Hl(Tl),l===null?(e=Cf(),e===null&&(e=vl,n=Hf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=u),e=n),t.memoizedState={parent:a,cache:e},Bf(t),tu(t,Tl,e)):((l.lanes&u)!==0&&(Yf(l,t),$a(t,null,null,u),Wa()),e=l.memoizedState,n=t.memoizedState,e.parent!==a?(e={parent:a,cache:a},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),tu(t,Tl,a)):(a=n.cache,tu(t,Tl,a),a!==e.cache&&Nf(t,[Tl],u,!0))),Rl(l,t,t.pendingProps.children,u),t.child;case 29:throw t.pendingProps}throw Error(S(156,t.tag))}function Qt(l){l.flags|=4}function gc(l,t,u,a,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(yy())l.flags|=8192;else throw Bu=we,qf}else l.flags&=-16777217}function Gs(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!Py(t))if(yy())l.flags|=8192;else throw Bu=we,qf}function vn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?gi():536870912,l.lanes|=t,ga|=t)}function te(l,t){if(!W)switch(l.tailMode){case"hidden":t=l.tail;for(var u=null;t!==null;)t.alternate!==null&&(u=t),t=t.sibling;u===null?l.tail=null:u.sibling=null;break;case"collapsed":u=l.tail;for(var a=null;u!==null;)u.alternate!==null&&(a=u),u=u.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function ml(l){var t=l.alternate!==null&&l.alternate.child===l.child,u=0,a=0;if(t)for(var e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags&65011712,a|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags,a|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=a,l.childLanes=u,t}function wd(l,t,u){var a=t.pendingProps;switch(Of(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return ml(t),null;case 1:return ml(t),null;case 3:return u=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Yt(Tl),gl(),u.pendingContext&&(u.context=u.pendingContext,u.pendingContext=null),(l===null||l.child===null)&&(ea(t)?Qt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Df())),ml(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(Qt(t),n!==null?(ml(t),Gs(t,n)):(ml(t),gc(t,e,null,a,u))):n?n!==l.memoizedState?(Qt(t),ml(t),Gs(t,n)):(ml(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&Qt(t),ml(t),gc(t,e,l,a,u)),null;case 27:if(Ee(t),u=Z.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(S(166));return ml(t),null}l=p.current,ea(t)?g0(t):(l=Ky(e,a,u),t.stateNode=l,Qt(t))}return ml(t),null;case 5:if(Ee(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(S(166));return ml(t),null}if(n=p.current,ea(t))g0(t);else{var f=Mn(Z.current);switch(n){case 1:n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=f.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?f.createElement("select",{is:a.is}):f.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?f.createElement(e,{is:a.is}):f.createElement(e)}}n[pl]=t,n[xl]=a;l:for(f=t.child;f!==null;){if(f.tag===5||f.tag===6)n.appendChild(f.stateNode);else if(f.tag!==4&&f.tag!==27&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===t)break l;for(;f.sibling===null;){if(f.return===null||f.return===t)break l;f=f.return}f.sibling.return=f.return,f=f.sibling}t.stateNode=n;l:switch(Cl(n,e,a),e){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&Qt(t)}}return ml(t),gc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,u),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(S(166));if(l=Z.current,ea(t)){if(l=t.stateNode,u=t.memoizedProps,a=null,e=Nl,e!==null)switch(e.tag){case 27:case 5:a=e.memoizedProps}l[pl]=t,l=!!(l.nodeValue===u||a!==null&&a.suppressHydrationWarning===!0||qy(l.nodeValue,u)),l||lu(t,!0)}else l=Mn(l).createTextNode(a),l[pl]=t,t.stateNode=l}return ml(t),null;case 31:if(u=t.memoizedState,l===null||l.memoizedState!==null){if(a=ea(t),u!==null){if(l===null){if(!a)throw Error(S(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(S(557));l[pl]=t}else Nu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;ml(t),l=!1}else u=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),l=!0;if(!l)return t.flags&256?(ut(t),t):(ut(t),null);if((t.flags&128)!==0)throw Error(S(558))}return ml(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=ea(t),a!==null&&a.dehydrated!==null){if(l===null){if(!e)throw Error(S(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(S(317));e[pl]=t}else Nu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;ml(t),e=!1}else e=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(ut(t),t):(ut(t),null)}return ut(t),(t.flags&128)!==0?(t.lanes=u,t):(u=a!==null,l=l!==null&&l.memoizedState!==null,u&&(a=t.child,e=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(e=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==e&&(a.flags|=2048)),u!==l&&u&&(t.child.flags|=8192),vn(t,t.updateQueue),ml(t),null);case 4:return gl(),l===null&&Xc(t.stateNode.containerInfo),ml(t),null;case 10:return Yt(t.type),ml(t),null;case 19:if(T(bl),a=t.memoizedState,a===null)return ml(t),null;if(e=(t.flags&128)!==0,n=a.rendering,n===null)if(e)te(a,!1);else{if(Sl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=ke(l),n!==null){for(t.flags|=128,te(a,!1),l=n.updateQueue,t.updateQueue=l,vn(t,l),t.subtreeFlags=0,l=u,u=t.child;u!==null;)d0(u,l),u=u.sibling;return _(bl,bl.current&1|2),W&&qt(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&Fl()>Sn&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304)}else{if(!e)if(l=ke(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,vn(t,l),te(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!W)return ml(t),null}else 2*Fl()-a.renderingStartTime>Sn&&u!==536870912&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=Fl(),l.sibling=null,u=bl.current,_(bl,e?u&1|2:u&1),W&&qt(t,a.treeForkCount),l):(ml(t),null);case 22:case 23:return ut(t),Qf(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(u&536870912)!==0&&(t.flags&128)===0&&(ml(t),t.subtreeFlags&6&&(t.flags|=8192)):ml(t),u=t.updateQueue,u!==null&&vn(t,u.retryQueue),u=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==u&&(t.flags|=2048),l!==null&&T(Cu),null;case 24:return u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Yt(Tl),ml(t),null;case 25:return null;case 30:return null}throw Error(S(156,t.tag))}function Wd(l,t){switch(Of(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Yt(Tl),gl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Ee(t),null;case 31:if(t.memoizedState!==null){if(ut(t),t.alternate===null)throw Error(S(340));Nu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(ut(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(S(340));Nu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return T(bl),null;case 4:return gl(),null;case 10:return Yt(t.type),null;case 22:case 23:return ut(t),Qf(),l!==null&&T(Cu),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Yt(Tl),null;case 25:return null;default:return null}}function Xs(l,t){switch(Of(t),t.tag){case 3:Yt(Tl),gl();break;case 26:case 27:case 5:Ee(t);break;case 4:gl();break;case 31:t.memoizedState!==null&&ut(t);break;case 13:ut(t);break;case 19:T(bl);break;case 10:Yt(t.type);break;case 22:case 23:ut(t),Qf(),l!==null&&T(Cu);break;case 24:Yt(Tl)}}function ue(l,t){try{var u=t.updateQueue,a=u!==null?u.lastEffect:null;if(a!==null){var e=a.next;u=e;do{if((u.tag&l)===l){a=void 0;var n=u.create,f=u.inst;a=n(),f.destroy=a}u=u.next}while(u!==e)}}catch(c){nl(t,t.return,c)}}function cu(l,t,u){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var n=e.next;a=n;do{if((a.tag&l)===l){var f=a.inst,c=f.destroy;if(c!==void 0){f.destroy=void 0,e=t;var i=u,m=c;try{m()}catch(b){nl(e,i,b)}}}a=a.next}while(a!==n)}}catch(b){nl(t,t.return,b)}}function Qs(l){var t=l.updateQueue;if(t!==null){var u=l.stateNode;try{N0(t,u)}catch(a){nl(l,l.return,a)}}}function Zs(l,t,u){u.props=Gu(l.type,l.memoizedProps),u.state=l.memoizedState;try{u.componentWillUnmount()}catch(a){nl(l,t,a)}}function ae(l,t){try{var u=l.ref;if(u!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof u=="function"?l.refCleanup=u(a):u.current=a}}catch(e){nl(l,t,e)}}function Mt(l,t){var u=l.ref,a=l.refCleanup;if(u!==null)if(typeof a=="function")try{a()}catch(e){nl(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof u=="function")try{u(null)}catch(e){nl(l,t,e)}else u.current=null}function xs(l){var t=l.type,u=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":u.autoFocus&&a.focus();break l;case"img":u.src?a.src=u.src:u.srcSet&&(a.srcset=u.srcSet)}}catch(e){nl(l,l.return,e)}}function bc(l,t,u){try{var a=l.stateNode;Sm(a,l.type,u,t),a[xl]=t}catch(e){nl(l,l.return,e)}}function Vs(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&hu(l.type)||l.tag===4}function rc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Vs(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&hu(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function zc(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u).insertBefore(l,t):(t=u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u,t.appendChild(l),u=u._reactRootContainer,u!=null||t.onclick!==null||(t.onclick=Ht));else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode,t=null),l=l.child,l!==null))for(zc(l,t,u),l=l.sibling;l!==null;)zc(l,t,u),l=l.sibling}function dn(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.insertBefore(l,t):u.appendChild(l);else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode),l=l.child,l!==null))for(dn(l,t,u),l=l.sibling;l!==null;)dn(l,t,u),l=l.sibling}function Ls(l){var t=l.stateNode,u=l.memoizedProps;try{for(var a=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);Cl(t,a,u),t[pl]=l,t[xl]=u}catch(n){nl(l,l.return,n)}}var Zt=!1,Ol=!1,Ec=!1,Ks=typeof WeakSet=="function"?WeakSet:Set,Ul=null;function $d(l,t){if(l=l.containerInfo,xc=Cn,l=a0(l),hf(l)){if("selectionStart"in l)var u={start:l.selectionStart,end:l.selectionEnd};else l:{u=(u=l.ownerDocument)&&u.defaultView||window;var a=u.getSelection&&u.getSelection();if(a&&a.rangeCount!==0){u=a.anchorNode;var e=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{u.nodeType,n.nodeType}catch{u=null;break l}var f=0,c=-1,i=-1,m=0,b=0,E=l,h=null;t:for(;;){for(var g;E!==u||e!==0&&E.nodeType!==3||(c=f+e),E!==n||a!==0&&E.nodeType!==3||(i=f+a),E.nodeType===3&&(f+=E.nodeValue.length),(g=E.firstChild)!==null;)h=E,E=g;for(;;){if(E===l)break t;if(h===u&&++m===e&&(c=f),h===n&&++b===a&&(i=f),(g=E.nextSibling)!==null)break;E=h,h=E.parentNode}E=g}u=c===-1||i===-1?null:{start:c,end:i}}else u=null}u=u||{start:0,end:0}}else u=null;for(Vc={focusedElem:l,selectionRange:u},Cn=!1,Ul=t;Ul!==null;)if(t=Ul,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ul=l;else for(;Ul!==null;){switch(t=Ul,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(u=0;u<l.length;u++)e=l[u],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,u=t,e=n.memoizedProps,n=n.memoizedState,a=u.stateNode;try{var D=Gu(u.type,e);l=a.getSnapshotBeforeUpdate(D,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(C){nl(u,u.return,C)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,u=l.nodeType,u===9)Jc(l);else if(u===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Jc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(S(163))}if(l=t.sibling,l!==null){l.return=t.return,Ul=l;break}Ul=t.return}}function Js(l,t,u){var a=u.flags;switch(u.tag){case 0:case 11:case 15:Vt(l,u),a&4&&ue(5,u);break;case 1:if(Vt(l,u),a&4)if(l=u.stateNode,t===null)try{l.componentDidMount()}catch(f){nl(u,u.return,f)}else{var e=Gu(u.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){nl(u,u.return,f)}}a&64&&Qs(u),a&512&&ae(u,u.return);break;case 3:if(Vt(l,u),a&64&&(l=u.updateQueue,l!==null)){if(t=null,u.child!==null)switch(u.child.tag){case 27:case 5:t=u.child.stateNode;break;case 1:t=u.child.stateNode}try{N0(l,t)}catch(f){nl(u,u.return,f)}}break;case 27:t===null&&a&4&&Ls(u);case 26:case 5:Vt(l,u),t===null&&a&4&&xs(u),a&512&&ae(u,u.return);break;case 12:Vt(l,u);break;case 31:Vt(l,u),a&4&&$s(l,u);break;case 13:Vt(l,u),a&4&&Fs(l,u),a&64&&(l=u.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(u=em.bind(null,u),_m(l,u))));break;case 22:if(a=u.memoizedState!==null||Zt,!a){t=t!==null&&t.memoizedState!==null||Ol,e=Zt;var n=Ol;Zt=a,(Ol=t)&&!n?Lt(l,u,(u.subtreeFlags&8772)!==0):Vt(l,u),Zt=e,Ol=n}break;case 30:break;default:Vt(l,u)}}function ws(l){var t=l.alternate;t!==null&&(l.alternate=null,ws(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Fn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var hl=null,Ll=!1;function xt(l,t,u){for(u=u.child;u!==null;)Ws(l,t,u),u=u.sibling}function Ws(l,t,u){if(kl&&typeof kl.onCommitFiberUnmount=="function")try{kl.onCommitFiberUnmount(Da,u)}catch{}switch(u.tag){case 26:Ol||Mt(u,t),xt(l,t,u),u.memoizedState?u.memoizedState.count--:u.stateNode&&(u=u.stateNode,u.parentNode.removeChild(u));break;case 27:Ol||Mt(u,t);var a=hl,e=Ll;hu(u.type)&&(hl=u.stateNode,Ll=!1),xt(l,t,u),de(u.stateNode),hl=a,Ll=e;break;case 5:Ol||Mt(u,t);case 6:if(a=hl,e=Ll,hl=null,xt(l,t,u),hl=a,Ll=e,hl!==null)if(Ll)try{(hl.nodeType===9?hl.body:hl.nodeName==="HTML"?hl.ownerDocument.body:hl).removeChild(u.stateNode)}catch(n){nl(u,t,n)}else try{hl.removeChild(u.stateNode)}catch(n){nl(u,t,n)}break;case 18:hl!==null&&(Ll?(l=hl,Qy(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,u.stateNode),Oa(l)):Qy(hl,u.stateNode));break;case 4:a=hl,e=Ll,hl=u.stateNode.containerInfo,Ll=!0,xt(l,t,u),hl=a,Ll=e;break;case 0:case 11:case 14:case 15:cu(2,u,t),Ol||cu(4,u,t),xt(l,t,u);break;case 1:Ol||(Mt(u,t),a=u.stateNode,typeof a.componentWillUnmount=="function"&&Zs(u,t,a)),xt(l,t,u);break;case 21:xt(l,t,u);break;case 22:Ol=(a=Ol)||u.memoizedState!==null,xt(l,t,u),Ol=a;break;default:xt(l,t,u)}}function $s(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Oa(l)}catch(u){nl(t,t.return,u)}}}function Fs(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Oa(l)}catch(u){nl(t,t.return,u)}}function Fd(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Ks),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Ks),t;default:throw Error(S(435,l.tag))}}function mn(l,t){var u=Fd(l);t.forEach(function(a){if(!u.has(a)){u.add(a);var e=nm.bind(null,l,a);a.then(e,e)}})}function Kl(l,t){var u=t.deletions;if(u!==null)for(var a=0;a<u.length;a++){var e=u[a],n=l,f=t,c=f;l:for(;c!==null;){switch(c.tag){case 27:if(hu(c.type)){hl=c.stateNode,Ll=!1;break l}break;case 5:hl=c.stateNode,Ll=!1;break l;case 3:case 4:hl=c.stateNode.containerInfo,Ll=!0;break l}c=c.return}if(hl===null)throw Error(S(160));Ws(n,f,e),hl=null,Ll=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)ks(t,l),t=t.sibling}var rt=null;function ks(l,t){var u=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Kl(t,l),Jl(l),a&4&&(cu(3,l,l.return),ue(3,l),cu(5,l,l.return));break;case 1:Kl(t,l),Jl(l),a&512&&(Ol||u===null||Mt(u,u.return)),a&64&&Zt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(u=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=u===null?a:u.concat(a))));break;case 26:var e=rt;if(Kl(t,l),Jl(l),a&512&&(Ol||u===null||Mt(u,u.return)),a&4){var n=u!==null?u.memoizedState:null;if(a=l.memoizedState,u===null)if(a===null)if(l.stateNode===null){l:{a=l.type,u=l.memoizedProps,e=e.ownerDocument||e;t:switch(a){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Na]||n[pl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(a),e.head.insertBefore(n,e.querySelector("head > title"))),Cl(n,a,u),n[pl]=l,Dl(n),a=n;break l;case"link":var f=ky("link","href",e).get(a+(u.href||""));if(f){for(var c=0;c<f.length;c++)if(n=f[c],n.getAttribute("href")===(u.href==null||u.href===""?null:u.href)&&n.getAttribute("rel")===(u.rel==null?null:u.rel)&&n.getAttribute("title")===(u.title==null?null:u.title)&&n.getAttribute("crossorigin")===(u.crossOrigin==null?null:u.crossOrigin)){f.splice(c,1);break t}}n=e.createElement(a),Cl(n,a,u),e.head.appendChild(n);break;case"meta":if(f=ky("meta","content",e).get(a+(u.content||""))){for(c=0;c<f.length;c++)if(n=f[c],n.getAttribute("content")===(u.content==null?null:""+u.content)&&n.getAttribute("name")===(u.name==null?null:u.name)&&n.getAttribute("property")===(u.property==null?null:u.property)&&n.getAttribute("http-equiv")===(u.httpEquiv==null?null:u.httpEquiv)&&n.getAttribute("charset")===(u.charSet==null?null:u.charSet)){f.splice(c,1);break t}}n=e.createElement(a),Cl(n,a,u),e.head.appendChild(n);break;default:throw Error(S(468,a))}n[pl]=l,Dl(n),a=n}l.stateNode=a}else Iy(e,l.type,l.stateNode);else l.stateNode=Fy(e,a,l.memoizedProps);else n!==a?(n===null?u.stateNode!==null&&(u=u.stateNode,u.parentNode.removeChild(u)):n.count--,a===null?Iy(e,l.type,l.stateNode):Fy(e,a,l.memoizedProps)):a===null&&l.stateNode!==null&&bc(l,l.memoizedProps,u.memoizedProps)}break;case 27:Kl(t,l),Jl(l),a&512&&(Ol||u===null||Mt(u,u.return)),u!==null&&a&4&&bc(l,l.memoizedProps,u.memoizedProps);break;case 5:if(Kl(t,l),Jl(l),a&512&&(Ol||u===null||Mt(u,u.return)),l.flags&32){e=l.stateNode;try{Wu(e,"")}catch(D){nl(l,l.return,D)}}a&4&&l.stateNode!=null&&(e=l.memoizedProps,bc(l,e,u!==null?u.memoizedProps:e)),a&1024&&(Ec=!0);break;case 6:if(Kl(t,l),Jl(l),a&4){if(l.stateNode===null)throw Error(S(162));a=l.memoizedProps,u=l.stateNode;try{u.nodeValue=a}catch(D){nl(l,l.return,D)}}break;case 3:if(pn=null,e=rt,rt=Dn(t.containerInfo),Kl(t,l),rt=e,Jl(l),a&4&&u!==null&&u.memoizedState.isDehydrated)try{Oa(t.containerInfo)}catch(D){nl(l,l.return,D)}Ec&&(Ec=!1,Is(l));break;case 4:a=rt,rt=Dn(l.stateNode.containerInfo),Kl(t,l),Jl(l),rt=a;break;case 12:Kl(t,l),Jl(l);break;case 31:Kl(t,l),Jl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 13:Kl(t,l),Jl(l),l.child.flags&8192&&l.memoizedState!==null!=(u!==null&&u.memoizedState!==null)&&(on=Fl()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 22:e=l.memoizedState!==null;var i=u!==null&&u.memoizedState!==null,m=Zt,b=Ol;if(Zt=m||e,Ol=b||i,Kl(t,l),Ol=b,Zt=m,Jl(l),a&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(u===null||i||Zt||Ol||Xu(l)),u=null,t=l;;){if(t.tag===5||t.tag===26){if(u===null){i=u=t;try{if(n=i.stateNode,e)f=n.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none";else{c=i.stateNode;var E=i.memoizedProps.style,h=E!=null&&E.hasOwnProperty("display")?E.display:null;c.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(D){nl(i,i.return,D)}}}else if(t.tag===6){if(u===null){i=t;try{i.stateNode.nodeValue=e?"":i.memoizedProps}catch(D){nl(i,i.return,D)}}}else if(t.tag===18){if(u===null){i=t;try{var g=i.stateNode;e?Zy(g,!0):Zy(i.stateNode,!1)}catch(D){nl(i,i.return,D)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;u===t&&(u=null),t=t.return}u===t&&(u=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(u=a.retryQueue,u!==null&&(a.retryQueue=null,mn(l,u))));break;case 19:Kl(t,l),Jl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,mn(l,a)));break;case 30:break;case 21:break;default:Kl(t,l),Jl(l)}}function Jl(l){var t=l.flags;if(t&2){try{for(var u,a=l.return;a!==null;){if(Vs(a)){u=a;break}a=a.return}if(u==null)throw Error(S(160));switch(u.tag){case 27:var e=u.stateNode,n=rc(l);dn(l,n,e);break;case 5:var f=u.stateNode;u.flags&32&&(Wu(f,""),u.flags&=-33);var c=rc(l);dn(l,c,f);break;case 3:case 4:var i=u.stateNode.containerInfo,m=rc(l);zc(l,m,i);break;default:throw Error(S(161))}}catch(b){nl(l,l.return,b)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function Is(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;Is(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function Vt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)Js(l,t.alternate,t),t=t.sibling}function Xu(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:cu(4,t,t.return),Xu(t);break;case 1:Mt(t,t.return);var u=t.stateNode;typeof u.componentWillUnmount=="function"&&Zs(t,t.return,u),Xu(t);break;case 27:de(t.stateNode);case 26:case 5:Mt(t,t.return),Xu(t);break;case 22:t.memoizedState===null&&Xu(t);break;case 30:Xu(t);break;default:Xu(t)}l=l.sibling}}function Lt(l,t,u){for(u=u&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,e=l,n=t,f=n.flags;switch(n.tag){case 0:case 11:case 15:Lt(e,n,u),ue(4,n);break;case 1:if(Lt(e,n,u),a=n,e=a.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(m){nl(a,a.return,m)}if(a=n,e=a.updateQueue,e!==null){var c=a.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)p0(i[e],c)}catch(m){nl(a,a.return,m)}}u&&f&64&&Qs(n),ae(n,n.return);break;case 27:Ls(n);case 26:case 5:Lt(e,n,u),u&&a===null&&f&4&&xs(n),ae(n,n.return);break;case 12:Lt(e,n,u);break;case 31:Lt(e,n,u),u&&f&4&&$s(e,n);break;case 13:Lt(e,n,u),u&&f&4&&Fs(e,n);break;case 22:n.memoizedState===null&&Lt(e,n,u),ae(n,n.return);break;case 30:break;default:Lt(e,n,u)}t=t.sibling}}function Tc(l,t){var u=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==u&&(l!=null&&l.refCount++,u!=null&&Va(u))}function Ac(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l))}function zt(l,t,u,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)Ps(l,t,u,a),t=t.sibling}function Ps(l,t,u,a){var e=t.flags;switch(t.tag){case 0:case 11:case 15:zt(l,t,u,a),e&2048&&ue(9,t);break;case 1:zt(l,t,u,a);break;case 3:zt(l,t,u,a),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l)));break;case 12:if(e&2048){zt(l,t,u,a),l=t.stateNode;try{var n=t.memoizedProps,f=n.id,c=n.onPostCommit;typeof c=="function"&&c(f,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){nl(t,t.return,i)}}else zt(l,t,u,a);break;case 31:zt(l,t,u,a);break;case 13:zt(l,t,u,a);break;case 23:break;case 22:n=t.stateNode,f=t.alternate,t.memoizedState!==null?n._visibility&2?zt(l,t,u,a):ee(l,t):n._visibility&2?zt(l,t,u,a):(n._visibility|=2,ha(l,t,u,a,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Tc(f,t);break;case 24:zt(l,t,u,a),e&2048&&Ac(t.alternate,t);break;default:zt(l,t,u,a)}}function ha(l,t,u,a,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,f=t,c=u,i=a,m=f.flags;switch(f.tag){case 0:case 11:case 15:ha(n,f,c,i,e),ue(8,f);break;case 23:break;case 22:var b=f.stateNode;f.memoizedState!==null?b._visibility&2?ha(n,f,c,i,e):ee(n,f):(b._visibility|=2,ha(n,f,c,i,e)),e&&m&2048&&Tc(f.alternate,f);break;case 24:ha(n,f,c,i,e),e&&m&2048&&Ac(f.alternate,f);break;default:ha(n,f,c,i,e)}t=t.sibling}}function ee(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var u=l,a=t,e=a.flags;switch(a.tag){case 22:ee(u,a),e&2048&&Tc(a.alternate,a);break;case 24:ee(u,a),e&2048&&Ac(a.alternate,a);break;default:ee(u,a)}t=t.sibling}}var ne=8192;function oa(l,t,u){if(l.subtreeFlags&ne)for(l=l.child;l!==null;)ly(l,t,u),l=l.sibling}function ly(l,t,u){switch(l.tag){case 26:oa(l,t,u),l.flags&ne&&l.memoizedState!==null&&Ym(u,rt,l.memoizedState,l.memoizedProps);break;case 5:oa(l,t,u);break;case 3:case 4:var a=rt;rt=Dn(l.stateNode.containerInfo),oa(l,t,u),rt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=ne,ne=16777216,oa(l,t,u),ne=a):oa(l,t,u));break;default:oa(l,t,u)}}function ty(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function fe(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ul=a,ay(a,l)}ty(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)uy(l),l=l.sibling}function uy(l){switch(l.tag){case 0:case 11:case 15:fe(l),l.flags&2048&&cu(9,l,l.return);break;case 3:fe(l);break;case 12:fe(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,hn(l)):fe(l);break;default:fe(l)}}function hn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ul=a,ay(a,l)}ty(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:cu(8,t,t.return),hn(t);break;case 22:u=t.stateNode,u._visibility&2&&(u._visibility&=-3,hn(t));break;default:hn(t)}l=l.sibling}}function ay(l,t){for(;Ul!==null;){var u=Ul;switch(u.tag){case 0:case 11:case 15:cu(8,u,t);break;case 23:case 22:if(u.memoizedState!==null&&u.memoizedState.cachePool!==null){var a=u.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Va(u.memoizedState.cache)}if(a=u.child,a!==null)a.return=u,Ul=a;else l:for(u=l;Ul!==null;){a=Ul;var e=a.sibling,n=a.return;if(ws(a),a===u){Ul=null;break l}if(e!==null){e.return=n,Ul=e;break l}Ul=n}}}var kd={getCacheForType:function(l){var t=Hl(Tl),u=t.data.get(l);return u===void 0&&(u=l(),t.data.set(l,u)),u},cacheSignal:function(){return Hl(Tl).controller.signal}},Id=typeof WeakMap=="function"?WeakMap:Map,tl=0,vl=null,x=null,K=0,el=0,at=null,iu=!1,Sa=!1,_c=!1,Kt=0,Sl=0,su=0,Qu=0,Oc=0,et=0,ga=0,ce=null,wl=null,Mc=!1,on=0,ey=0,Sn=1/0,gn=null,yu=null,Ml=0,vu=null,ba=null,Jt=0,Dc=0,Uc=null,ny=null,ie=0,pc=null;function nt(){return(tl&2)!==0&&K!==0?K&-K:r.T!==null?Bc():Ei()}function fy(){if(et===0)if((K&536870912)===0||W){var l=_e;_e<<=1,(_e&3932160)===0&&(_e=262144),et=l}else et=536870912;return l=tt.current,l!==null&&(l.flags|=32),et}function Wl(l,t,u){(l===vl&&(el===2||el===9)||l.cancelPendingCommit!==null)&&(ra(l,0),du(l,K,et,!1)),pa(l,u),((tl&2)===0||l!==vl)&&(l===vl&&((tl&2)===0&&(Qu|=u),Sl===4&&du(l,K,et,!1)),Dt(l))}function cy(l,t,u){if((tl&6)!==0)throw Error(S(327));var a=!u&&(t&127)===0&&(t&l.expiredLanes)===0||Ua(l,t),e=a?tm(l,t):Hc(l,t,!0),n=a;do{if(e===0){Sa&&!a&&du(l,t,0,!1);break}else{if(u=l.current.alternate,n&&!Pd(u)){e=Hc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var f=0;else f=l.pendingLanes&-536870913,f=f!==0?f:f&536870912?536870912:0;if(f!==0){t=f;l:{var c=l;e=ce;var i=c.current.memoizedState.isDehydrated;if(i&&(ra(c,f).flags|=256),f=Hc(c,f,!1),f!==2){if(_c&&!i){c.errorRecoveryDisabledLanes|=n,Qu|=n,e=4;break l}n=wl,wl=e,n!==null&&(wl===null?wl=n:wl.push.apply(wl,n))}e=f}if(n=!1,e!==2)continue}}if(e===1){ra(l,0),du(l,t,0,!0);break}l:{switch(a=l,n=e,n){case 0:case 1:throw Error(S(345));case 4:if((t&4194048)!==t)break;case 6:du(a,t,et,!iu);break l;case 2:wl=null;break;case 3:case 5:break;default:throw Error(S(329))}if((t&62914560)===t&&(e=on+300-Fl(),10<e)){if(du(a,t,et,!iu),Me(a,0,!0)!==0)break l;Jt=t,a.timeoutHandle=Gy(iy.bind(null,a,u,wl,gn,Mc,t,et,Qu,ga,iu,n,"Throttled",-0,0),e);break l}iy(a,u,wl,gn,Mc,t,et,Qu,ga,iu,n,null,-0,0)}}break}while(!0);Dt(l)}function iy(l,t,u,a,e,n,f,c,i,m,b,E,h,g){if(l.timeoutHandle=-1,E=t.subtreeFlags,E&8192||(E&16785408)===16785408){E={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Ht},ly(t,n,E);var D=(n&62914560)===n?on-Fl():(n&4194048)===n?ey-Fl():0;if(D=jm(E,D),D!==null){Jt=n,l.cancelPendingCommit=D(Sy.bind(null,l,t,n,u,a,e,f,c,i,b,E,null,h,g)),du(l,n,f,!m);return}}Sy(l,t,n,u,a,e,f,c,i)}function Pd(l){for(var t=l;;){var u=t.tag;if((u===0||u===11||u===15)&&t.flags&16384&&(u=t.updateQueue,u!==null&&(u=u.stores,u!==null)))for(var a=0;a<u.length;a++){var e=u[a],n=e.getSnapshot;e=e.value;try{if(!Pl(n(),e))return!1}catch{return!1}}if(u=t.child,t.subtreeFlags&16384&&u!==null)u.return=t,t=u;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function du(l,t,u,a){t&=~Oc,t&=~Qu,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var e=t;0<e;){var n=31-Il(e),f=1<<n;a[n]=-1,e&=~f}u!==0&&bi(l,u,t)}function bn(){return(tl&6)===0?(se(0),!1):!0}function Nc(){if(x!==null){if(el===0)var l=x.return;else l=x,Bt=Hu=null,Jf(l),sa=null,Ka=0,l=x;for(;l!==null;)Xs(l.alternate,l),l=l.return;x=null}}function ra(l,t){var u=l.timeoutHandle;u!==-1&&(l.timeoutHandle=-1,rm(u)),u=l.cancelPendingCommit,u!==null&&(l.cancelPendingCommit=null,u()),Jt=0,Nc(),vl=l,x=u=Ct(l.current,null),K=t,el=0,at=null,iu=!1,Sa=Ua(l,t),_c=!1,ga=et=Oc=Qu=su=Sl=0,wl=ce=null,Mc=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var e=31-Il(a),n=1<<e;t|=l[e],a&=~n}return Kt=t,Ge(),u}function sy(l,t){G=null,r.H=Pa,t===ia||t===Je?(t=O0(),el=3):t===qf?(t=O0(),el=4):el=t===ic?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,at=t,x===null&&(Sl=1,fn(l,yt(t,l.current)))}function yy(){var l=tt.current;return l===null?!0:(K&4194048)===K?ht===null:(K&62914560)===K||(K&536870912)!==0?l===ht:!1}function vy(){var l=r.H;return r.H=Pa,l===null?Pa:l}function dy(){var l=r.A;return r.A=kd,l}function rn(){Sl=4,iu||(K&4194048)!==K&&tt.current!==null||(Sa=!0),(su&134217727)===0&&(Qu&134217727)===0||vl===null||du(vl,K,et,!1)}function Hc(l,t,u){var a=tl;tl|=2;var e=vy(),n=dy();(vl!==l||K!==t)&&(gn=null,ra(l,t)),t=!1;var f=Sl;l:do try{if(el!==0&&x!==null){var c=x,i=at;switch(el){case 8:Nc(),f=6;break l;case 3:case 2:case 9:case 6:tt.current===null&&(t=!0);var m=el;if(el=0,at=null,za(l,c,i,m),u&&Sa){f=0;break l}break;default:m=el,el=0,at=null,za(l,c,i,m)}}lm(),f=Sl;break}catch(b){sy(l,b)}while(!0);return t&&l.shellSuspendCounter++,Bt=Hu=null,tl=a,r.H=e,r.A=n,x===null&&(vl=null,K=0,Ge()),f}function lm(){for(;x!==null;)my(x)}function tm(l,t){var u=tl;tl|=2;var a=vy(),e=dy();vl!==l||K!==t?(gn=null,Sn=Fl()+500,ra(l,t)):Sa=Ua(l,t);l:do try{if(el!==0&&x!==null){t=x;var n=at;t:switch(el){case 1:el=0,at=null,za(l,t,n,1);break;case 2:case 9:if(A0(n)){el=0,at=null,hy(t);break}t=function(){el!==2&&el!==9||vl!==l||(el=7),Dt(l)},n.then(t,t);break l;case 3:el=7;break l;case 4:el=5;break l;case 7:A0(n)?(el=0,at=null,hy(t)):(el=0,at=null,za(l,t,n,7));break;case 5:var f=null;switch(x.tag){case 26:f=x.memoizedState;case 5:case 27:var c=x;if(f?Py(f):c.stateNode.complete){el=0,at=null;var i=c.sibling;if(i!==null)x=i;else{var m=c.return;m!==null?(x=m,zn(m)):x=null}break t}}el=0,at=null,za(l,t,n,5);break;case 6:el=0,at=null,za(l,t,n,6);break;case 8:Nc(),Sl=6;break l;default:throw Error(S(462))}}um();break}catch(b){sy(l,b)}while(!0);return Bt=Hu=null,r.H=a,r.A=e,tl=u,x!==null?0:(vl=null,K=0,Ge(),Sl)}function um(){for(;x!==null&&!Ov();)my(x)}function my(l){var t=js(l.alternate,l,Kt);l.memoizedProps=l.pendingProps,t===null?zn(l):x=t}function hy(l){var t=l,u=t.alternate;switch(t.tag){case 15:case 0:t=Hs(u,t,t.pendingProps,t.type,void 0,K);break;case 11:t=Hs(u,t,t.pendingProps,t.type.render,t.ref,K);break;case 5:Jf(t);default:Xs(u,t),t=x=d0(t,Kt),t=js(u,t,Kt)}l.memoizedProps=l.pendingProps,t===null?zn(l):x=t}function za(l,t,u,a){Bt=Hu=null,Jf(t),sa=null,Ka=0;var e=t.return;try{if(Ld(l,e,t,u,K)){Sl=1,fn(l,yt(u,l.current)),x=null;return}}catch(n){if(e!==null)throw x=e,n;Sl=1,fn(l,yt(u,l.current)),x=null;return}t.flags&32768?(W||a===1?l=!0:Sa||(K&536870912)!==0?l=!1:(iu=l=!0,(a===2||a===9||a===3||a===6)&&(a=tt.current,a!==null&&a.tag===13&&(a.flags|=16384))),oy(t,l)):zn(t)}function zn(l){var t=l;do{if((t.flags&32768)!==0){oy(t,iu);return}l=t.return;var u=wd(t.alternate,t,Kt);if(u!==null){x=u;return}if(t=t.sibling,t!==null){x=t;return}x=t=l}while(t!==null);Sl===0&&(Sl=5)}function oy(l,t){do{var u=Wd(l.alternate,l);if(u!==null){u.flags&=32767,x=u;return}if(u=l.return,u!==null&&(u.flags|=32768,u.subtreeFlags=0,u.deletions=null),!t&&(l=l.sibling,l!==null)){x=l;return}x=l=u}while(l!==null);Sl=6,x=null}function Sy(l,t,u,a,e,n,f,c,i){l.cancelPendingCommit=null;do En();while(Ml!==0);if((tl&6)!==0)throw Error(S(327));if(t!==null){if(t===l.current)throw Error(S(177));if(n=t.lanes|t.childLanes,n|=rf,Bv(l,u,n,f,c,i),l===vl&&(x=vl=null,K=0),ba=t,vu=l,Jt=u,Dc=n,Uc=e,ny=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,fm(Te,function(){return Ey(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=r.T,r.T=null,e=A.p,A.p=2,f=tl,tl|=4;try{$d(l,t,u)}finally{tl=f,A.p=e,r.T=a}}Ml=1,gy(),by(),ry()}}function gy(){if(Ml===1){Ml=0;var l=vu,t=ba,u=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||u){u=r.T,r.T=null;var a=A.p;A.p=2;var e=tl;tl|=4;try{ks(t,l);var n=Vc,f=a0(l.containerInfo),c=n.focusedElem,i=n.selectionRange;if(f!==c&&c&&c.ownerDocument&&u0(c.ownerDocument.documentElement,c)){if(i!==null&&hf(c)){var m=i.start,b=i.end;if(b===void 0&&(b=m),"selectionStart"in c)c.selectionStart=m,c.selectionEnd=Math.min(b,c.value.length);else{var E=c.ownerDocument||document,h=E&&E.defaultView||window;if(h.getSelection){var g=h.getSelection(),D=c.textContent.length,C=Math.min(i.start,D),sl=i.end===void 0?C:Math.min(i.end,D);!g.extend&&C>sl&&(f=sl,sl=C,C=f);var v=t0(c,C),s=t0(c,sl);if(v&&s&&(g.rangeCount!==1||g.anchorNode!==v.node||g.anchorOffset!==v.offset||g.focusNode!==s.node||g.focusOffset!==s.offset)){var d=E.createRange();d.setStart(v.node,v.offset),g.removeAllRanges(),C>sl?(g.addRange(d),g.extend(s.node,s.offset)):(d.setEnd(s.node,s.offset),g.addRange(d))}}}}for(E=[],g=c;g=g.parentNode;)g.nodeType===1&&E.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<E.length;c++){var z=E[c];z.element.scrollLeft=z.left,z.element.scrollTop=z.top}}Cn=!!xc,Vc=xc=null}finally{tl=e,A.p=a,r.T=u}}l.current=t,Ml=2}}function by(){if(Ml===2){Ml=0;var l=vu,t=ba,u=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||u){u=r.T,r.T=null;var a=A.p;A.p=2;var e=tl;tl|=4;try{Js(l,t.alternate,t)}finally{tl=e,A.p=a,r.T=u}}Ml=3}}function ry(){if(Ml===4||Ml===3){Ml=0,Mv();var l=vu,t=ba,u=Jt,a=ny;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Ml=5:(Ml=0,ba=vu=null,zy(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(yu=null),Wn(u),t=t.stateNode,kl&&typeof kl.onCommitFiberRoot=="function")try{kl.onCommitFiberRoot(Da,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=r.T,e=A.p,A.p=2,r.T=null;try{for(var n=l.onRecoverableError,f=0;f<a.length;f++){var c=a[f];n(c.value,{componentStack:c.stack})}}finally{r.T=t,A.p=e}}(Jt&3)!==0&&En(),Dt(l),e=l.pendingLanes,(u&261930)!==0&&(e&42)!==0?l===pc?ie++:(ie=0,pc=l):ie=0,se(0)}}function zy(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Va(t)))}function En(){return gy(),by(),ry(),Ey()}function Ey(){if(Ml!==5)return!1;var l=vu,t=Dc;Dc=0;var u=Wn(Jt),a=r.T,e=A.p;try{A.p=32>u?32:u,r.T=null,u=Uc,Uc=null;var n=vu,f=Jt;if(Ml=0,ba=vu=null,Jt=0,(tl&6)!==0)throw Error(S(331));var c=tl;if(tl|=4,uy(n.current),Ps(n,n.current,f,u),tl=c,se(0,!1),kl&&typeof kl.onPostCommitFiberRoot=="function")try{kl.onPostCommitFiberRoot(Da,n)}catch{}return!0}finally{A.p=e,r.T=a,zy(l,t)}}function Ty(l,t,u){t=yt(u,t),t=cc(l.stateNode,t,2),l=eu(l,t,2),l!==null&&(pa(l,2),Dt(l))}function nl(l,t,u){if(l.tag===3)Ty(l,l,u);else for(;t!==null;){if(t.tag===3){Ty(t,l,u);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(yu===null||!yu.has(a))){l=yt(u,l),u=As(2),a=eu(t,u,2),a!==null&&(_s(u,a,t,l),pa(a,2),Dt(a));break}}t=t.return}}function Rc(l,t,u){var a=l.pingCache;if(a===null){a=l.pingCache=new Id;var e=new Set;a.set(t,e)}else e=a.get(t),e===void 0&&(e=new Set,a.set(t,e));e.has(u)||(_c=!0,e.add(u),l=am.bind(null,l,t,u),t.then(l,l))}function am(l,t,u){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&u,l.warmLanes&=~u,vl===l&&(K&u)===u&&(Sl===4||Sl===3&&(K&62914560)===K&&300>Fl()-on?(tl&2)===0&&ra(l,0):Oc|=u,ga===K&&(ga=0)),Dt(l)}function Ay(l,t){t===0&&(t=gi()),l=Uu(l,t),l!==null&&(pa(l,t),Dt(l))}function em(l){var t=l.memoizedState,u=0;t!==null&&(u=t.retryLane),Ay(l,u)}function nm(l,t){var u=0;switch(l.tag){case 31:case 13:var a=l.stateNode,e=l.memoizedState;e!==null&&(u=e.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(S(314))}a!==null&&a.delete(t),Ay(l,u)}function fm(l,t){return Ln(l,t)}var Tn=null,Ea=null,Cc=!1,An=!1,qc=!1,mu=0;function Dt(l){l!==Ea&&l.next===null&&(Ea===null?Tn=Ea=l:Ea=Ea.next=l),An=!0,Cc||(Cc=!0,im())}function se(l,t){if(!qc&&An){qc=!0;do for(var u=!1,a=Tn;a!==null;){if(l!==0){var e=a.pendingLanes;if(e===0)var n=0;else{var f=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-Il(42|l)+1)-1,n&=e&~(f&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(u=!0,Dy(a,n))}else n=K,n=Me(a,a===vl?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||Ua(a,n)||(u=!0,Dy(a,n));a=a.next}while(u);qc=!1}}function cm(){_y()}function _y(){An=Cc=!1;var l=0;mu!==0&&bm()&&(l=mu);for(var t=Fl(),u=null,a=Tn;a!==null;){var e=a.next,n=Oy(a,t);n===0?(a.next=null,u===null?Tn=e:u.next=e,e===null&&(Ea=u)):(u=a,(l!==0||(n&3)!==0)&&(An=!0)),a=e}Ml!==0&&Ml!==5||se(l),mu!==0&&(mu=0)}function Oy(l,t){for(var u=l.suspendedLanes,a=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var f=31-Il(n),c=1<<f,i=e[f];i===-1?((c&u)===0||(c&a)!==0)&&(e[f]=qv(c,t)):i<=t&&(l.expiredLanes|=c),n&=~c}if(t=vl,u=K,u=Me(l,l===t?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,u===0||l===t&&(el===2||el===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Kn(a),l.callbackNode=null,l.callbackPriority=0;if((u&3)===0||Ua(l,u)){if(t=u&-u,t===l.callbackPriority)return t;switch(a!==null&&Kn(a),Wn(u)){case 2:case 8:u=oi;break;case 32:u=Te;break;case 268435456:u=Si;break;default:u=Te}return a=My.bind(null,l),u=Ln(u,a),l.callbackPriority=t,l.callbackNode=u,t}return a!==null&&a!==null&&Kn(a),l.callbackPriority=2,l.callbackNode=null,2}function My(l,t){if(Ml!==0&&Ml!==5)return l.callbackNode=null,l.callbackPriority=0,null;var u=l.callbackNode;if(En()&&l.callbackNode!==u)return null;var a=K;return a=Me(l,l===vl?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(cy(l,a,t),Oy(l,Fl()),l.callbackNode!=null&&l.callbackNode===u?My.bind(null,l):null)}function Dy(l,t){if(En())return null;cy(l,t,!0)}function im(){zm(function(){(tl&6)!==0?Ln(hi,cm):_y()})}function Bc(){if(mu===0){var l=fa;l===0&&(l=Ae,Ae<<=1,(Ae&261888)===0&&(Ae=256)),mu=l}return mu}function Uy(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:Ne(""+l)}function py(l,t){var u=t.ownerDocument.createElement("input");return u.name=t.name,u.value=t.value,l.id&&u.setAttribute("form",l.id),t.parentNode.insertBefore(u,t),l=new FormData(l),u.parentNode.removeChild(u),l}function sm(l,t,u,a,e){if(t==="submit"&&u&&u.stateNode===e){var n=Uy((e[xl]||null).action),f=a.submitter;f&&(t=(t=f[xl]||null)?Uy(t.formAction):f.getAttribute("formAction"),t!==null&&(n=t,f=null));var c=new qe("action","action",null,a,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(mu!==0){var i=f?py(e,f):new FormData(e);tc(u,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(c.preventDefault(),i=f?py(e,f):new FormData(e),tc(u,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(var Yc=0;Yc<bf.length;Yc++){var jc=bf[Yc],ym=jc.toLowerCase(),vm=jc[0].toUpperCase()+jc.slice(1);bt(ym,"on"+vm)}bt(f0,"onAnimationEnd"),bt(c0,"onAnimationIteration"),bt(i0,"onAnimationStart"),bt("dblclick","onDoubleClick"),bt("focusin","onFocus"),bt("focusout","onBlur"),bt(Dd,"onTransitionRun"),bt(Ud,"onTransitionStart"),bt(pd,"onTransitionCancel"),bt(s0,"onTransitionEnd"),Ju("onMouseEnter",["mouseout","mouseover"]),Ju("onMouseLeave",["mouseout","mouseover"]),Ju("onPointerEnter",["pointerout","pointerover"]),Ju("onPointerLeave",["pointerout","pointerover"]),_u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),_u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),_u("onBeforeInput",["compositionend","keypress","textInput","paste"]),_u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var ye="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),dm=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(ye));function Ny(l,t){t=(t&4)!==0;for(var u=0;u<l.length;u++){var a=l[u],e=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var f=a.length-1;0<=f;f--){var c=a[f],i=c.instance,m=c.currentTarget;if(c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(b){je(b)}e.currentTarget=null,n=i}else for(f=0;f<a.length;f++){if(c=a[f],i=c.instance,m=c.currentTarget,c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(b){je(b)}e.currentTarget=null,n=i}}}}function V(l,t){var u=t[$n];u===void 0&&(u=t[$n]=new Set);var a=l+"__bubble";u.has(a)||(Hy(t,l,2,!1),u.add(a))}function Gc(l,t,u){var a=0;t&&(a|=4),Hy(u,l,a,t)}var _n="_reactListening"+Math.random().toString(36).slice(2);function Xc(l){if(!l[_n]){l[_n]=!0,_i.forEach(function(u){u!=="selectionchange"&&(dm.has(u)||Gc(u,!1,l),Gc(u,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[_n]||(t[_n]=!0,Gc("selectionchange",!1,t))}}function Hy(l,t,u,a){switch(fv(t)){case 2:var e=Qm;break;case 8:e=Zm;break;default:e=li}u=e.bind(null,t,u,l),e=void 0,!ef||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),a?e!==void 0?l.addEventListener(t,u,{capture:!0,passive:e}):l.addEventListener(t,u,!0):e!==void 0?l.addEventListener(t,u,{passive:e}):l.addEventListener(t,u,!1)}function Qc(l,t,u,a,e){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var f=a.tag;if(f===3||f===4){var c=a.stateNode.containerInfo;if(c===e)break;if(f===4)for(f=a.return;f!==null;){var i=f.tag;if((i===3||i===4)&&f.stateNode.containerInfo===e)return;f=f.return}for(;c!==null;){if(f=Vu(c),f===null)return;if(i=f.tag,i===5||i===6||i===26||i===27){a=n=f;continue l}c=c.parentNode}}a=a.return}Yi(function(){var m=n,b=uf(u),E=[];l:{var h=y0.get(l);if(h!==void 0){var g=qe,D=l;switch(l){case"keypress":if(Re(u)===0)break l;case"keydown":case"keyup":g=nd;break;case"focusin":D="focus",g=sf;break;case"focusout":D="blur",g=sf;break;case"beforeblur":case"afterblur":g=sf;break;case"click":if(u.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Xi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=wv;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=id;break;case f0:case c0:case i0:g=Fv;break;case s0:g=yd;break;case"scroll":case"scrollend":g=Kv;break;case"wheel":g=dd;break;case"copy":case"cut":case"paste":g=Iv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Zi;break;case"toggle":case"beforetoggle":g=hd}var C=(t&4)!==0,sl=!C&&(l==="scroll"||l==="scrollend"),v=C?h!==null?h+"Capture":null:h;C=[];for(var s=m,d;s!==null;){var z=s;if(d=z.stateNode,z=z.tag,z!==5&&z!==26&&z!==27||d===null||v===null||(z=Ra(s,v),z!=null&&C.push(ve(s,z,d))),sl)break;s=s.return}0<C.length&&(h=new g(h,D,null,u,b),E.push({event:h,listeners:C}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&u!==tf&&(D=u.relatedTarget||u.fromElement)&&(Vu(D)||D[xu]))break l;if((g||h)&&(h=b.window===b?b:(h=b.ownerDocument)?h.defaultView||h.parentWindow:window,g?(D=u.relatedTarget||u.toElement,g=m,D=D?Vu(D):null,D!==null&&(sl=L(D),C=D.tag,D!==sl||C!==5&&C!==27&&C!==6)&&(D=null)):(g=null,D=m),g!==D)){if(C=Xi,z="onMouseLeave",v="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(C=Zi,z="onPointerLeave",v="onPointerEnter",s="pointer"),sl=g==null?h:Ha(g),d=D==null?h:Ha(D),h=new C(z,s+"leave",g,u,b),h.target=sl,h.relatedTarget=d,z=null,Vu(b)===m&&(C=new C(v,s+"enter",D,u,b),C.target=d,C.relatedTarget=sl,z=C),sl=z,g&&D)t:{for(C=mm,v=g,s=D,d=0,z=v;z;z=C(z))d++;z=0;for(var R=s;R;R=C(R))z++;for(;0<d-z;)v=C(v),d--;for(;0<z-d;)s=C(s),z--;for(;d--;){if(v===s||s!==null&&v===s.alternate){C=v;break t}v=C(v),s=C(s)}C=null}else C=null;g!==null&&Ry(E,h,g,C,!1),D!==null&&sl!==null&&Ry(E,sl,D,C,!0)}}l:{if(h=m?Ha(m):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var F=$i;else if(wi(h))if(Fi)F=_d;else{F=Td;var N=Ed}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?m&&lf(m.elementType)&&(F=$i):F=Ad;if(F&&(F=F(l,m))){Wi(E,F,u,b);break l}N&&N(l,h,m),l==="focusout"&&m&&h.type==="number"&&m.memoizedProps.value!=null&&Pn(h,"number",h.value)}switch(N=m?Ha(m):window,l){case"focusin":(wi(N)||N.contentEditable==="true")&&(Iu=N,of=m,Qa=null);break;case"focusout":Qa=of=Iu=null;break;case"mousedown":Sf=!0;break;case"contextmenu":case"mouseup":case"dragend":Sf=!1,e0(E,u,b);break;case"selectionchange":if(Md)break;case"keydown":case"keyup":e0(E,u,b)}var X;if(vf)l:{switch(l){case"compositionstart":var J="onCompositionStart";break l;case"compositionend":J="onCompositionEnd";break l;case"compositionupdate":J="onCompositionUpdate";break l}J=void 0}else ku?Ki(l,u)&&(J="onCompositionEnd"):l==="keydown"&&u.keyCode===229&&(J="onCompositionStart");J&&(xi&&u.locale!=="ko"&&(ku||J!=="onCompositionStart"?J==="onCompositionEnd"&&ku&&(X=ji()):(kt=b,nf="value"in kt?kt.value:kt.textContent,ku=!0)),N=On(m,J),0<N.length&&(J=new Qi(J,l,null,u,b),E.push({event:J,listeners:N}),X?J.data=X:(X=Ji(u),X!==null&&(J.data=X)))),(X=Sd?gd(l,u):bd(l,u))&&(J=On(m,"onBeforeInput"),0<J.length&&(N=new Qi("onBeforeInput","beforeinput",null,u,b),E.push({event:N,listeners:J}),N.data=X)),sm(E,l,m,u,b)}Ny(E,t)})}function ve(l,t,u){return{instance:l,listener:t,currentTarget:u}}function On(l,t){for(var u=t+"Capture",a=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Ra(l,u),e!=null&&a.unshift(ve(l,e,n)),e=Ra(l,t),e!=null&&a.push(ve(l,e,n))),l.tag===3)return a;l=l.return}return[]}function mm(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Ry(l,t,u,a,e){for(var n=t._reactName,f=[];u!==null&&u!==a;){var c=u,i=c.alternate,m=c.stateNode;if(c=c.tag,i!==null&&i===a)break;c!==5&&c!==26&&c!==27||m===null||(i=m,e?(m=Ra(u,n),m!=null&&f.unshift(ve(u,m,i))):e||(m=Ra(u,n),m!=null&&f.push(ve(u,m,i)))),u=u.return}f.length!==0&&l.push({event:t,listeners:f})}var hm=/\r\n?/g,om=/\u0000|\uFFFD/g;function Cy(l){return(typeof l=="string"?l:""+l).replace(hm,`
-`).replace(om,"")}function qy(l,t){return t=Cy(t),Cy(l)===t}function il(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":Ue(l,"class",a);break;case"tabIndex":Ue(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ue(l,u,a);break;case"style":qi(l,a,n);break;case"data":if(t!=="object"){Ue(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&il(l,t,"name",e.name,e,null),il(l,t,"formEncType",e.formEncType,e,null),il(l,t,"formMethod",e.formMethod,e,null),il(l,t,"formTarget",e.formTarget,e,null)):(il(l,t,"encType",e.encType,e,null),il(l,t,"method",e.method,e,null),il(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"onScroll":a!=null&&V("scroll",l);break;case"onScrollEnd":a!=null&&V("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(S(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(S(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=Ne(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":V("beforetoggle",l),V("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Nt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Nt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Nt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Nt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Nt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Nt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=Vv.get(u)||u,De(l,u,a))}}function Zc(l,t,u,a,e,n){switch(u){case"style":qi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(S(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(S(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&V("scroll",l);break;case"onScrollEnd":a!=null&&V("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Oi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[xl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Cl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":V("error",l),V("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(S(137,t));default:il(l,t,n,f,u,null)}}e&&il(l,t,"srcSet",u.srcSet,u,null),a&&il(l,t,"src",u.src,u,null);return;case"input":V("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var b=u[a];if(b!=null)switch(a){case"name":e=b;break;case"type":f=b;break;case"checked":i=b;break;case"defaultChecked":m=b;break;case"value":n=b;break;case"defaultValue":c=b;break;case"children":case"dangerouslySetInnerHTML":if(b!=null)throw Error(S(137,t));break;default:il(l,t,a,b,u,null)}}Ni(l,n,c,i,m,f,e,!1);return;case"select":V("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:il(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":V("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(S(91));break;default:il(l,t,f,c,u,null)}Ri(l,a,e,n);return;case"option":for(i in u)u.hasOwnProperty(i)&&(a=u[i],a!=null)&&(i==="selected"?l.selected=a&&typeof a!="function"&&typeof a!="symbol":il(l,t,i,a,u,null));return;case"dialog":V("beforetoggle",l),V("toggle",l),V("cancel",l),V("close",l);break;case"iframe":case"object":V("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)V(ye[a],l);break;case"image":V("error",l),V("load",l);break;case"details":V("toggle",l);break;case"embed":case"source":case"link":V("error",l),V("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(S(137,t));default:il(l,t,m,a,u,null)}return;default:if(lf(t)){for(b in u)u.hasOwnProperty(b)&&(a=u[b],a!==void 0&&Zc(l,t,b,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&il(l,t,c,a,u,null))}function Sm(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,b=null;for(g in u){var E=u[g];if(u.hasOwnProperty(g)&&E!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=E;default:a.hasOwnProperty(g)||il(l,t,g,null,a,E)}}for(var h in a){var g=a[h];if(E=u[h],a.hasOwnProperty(h)&&(g!=null||E!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":b=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(S(137,t));break;default:g!==E&&il(l,t,h,g,a,E)}}In(l,f,c,i,m,b,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||il(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&il(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:il(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(S(91));break;default:e!==n&&il(l,t,f,e,a,n)}Hi(l,h,g);return;case"option":for(var D in u)h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D)&&(D==="selected"?l.selected=!1:il(l,t,D,null,a,h));for(i in a)h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null)&&(i==="selected"?l.selected=h&&typeof h!="function"&&typeof h!="symbol":il(l,t,i,h,a,g));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var C in u)h=u[C],u.hasOwnProperty(C)&&h!=null&&!a.hasOwnProperty(C)&&il(l,t,C,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(S(137,t));break;default:il(l,t,m,h,a,g)}return;default:if(lf(t)){for(var sl in u)h=u[sl],u.hasOwnProperty(sl)&&h!==void 0&&!a.hasOwnProperty(sl)&&Zc(l,t,sl,void 0,a,h);for(b in a)h=a[b],g=u[b],!a.hasOwnProperty(b)||h===g||h===void 0&&g===void 0||Zc(l,t,b,h,a,g);return}}for(var v in u)h=u[v],u.hasOwnProperty(v)&&h!=null&&!a.hasOwnProperty(v)&&il(l,t,v,null,a,h);for(E in a)h=a[E],g=u[E],!a.hasOwnProperty(E)||h===g||h==null&&g==null||il(l,t,E,h,a,g)}function By(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function gm(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&By(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var b=i.transferSize,E=i.initiatorType;b&&By(E)&&(i=i.responseEnd,f+=b*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var xc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function Yy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function jy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function bm(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Gy=typeof setTimeout=="function"?setTimeout:void 0,rm=typeof clearTimeout=="function"?clearTimeout:void 0,Xy=typeof Promise=="function"?Promise:void 0,zm=typeof queueMicrotask=="function"?queueMicrotask:typeof Xy<"u"?function(l){return Xy.resolve(null).then(l).catch(Em)}:Gy;function Em(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function Qy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")de(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,de(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Na]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&de(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Tm(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Na])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=ot(l.nextSibling),l===null)break}return null}function Am(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=ot(l.nextSibling),l===null))return null;return l}function xy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=ot(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function _m(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function ot(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Vy(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return ot(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ly(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Ky(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(S(452));return l;case"head":if(l=t.head,!l)throw Error(S(453));return l;case"body":if(l=t.body,!l)throw Error(S(454));return l;default:throw Error(S(451))}}function de(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var St=new Map,Jy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var wt=A.d;A.d={f:Om,r:Mm,D:Dm,C:Um,L:pm,m:Nm,X:Rm,S:Hm,M:Cm};function Om(){var l=wt.f(),t=bn();return l||t}function Mm(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?ss(t):wt.r(l)}var Ta=typeof document>"u"?null:document;function wy(l,t,u){var a=Ta;if(a&&typeof t=="string"&&t){var e=it(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),Jy.has(e)||(Jy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Cl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Dm(l){wt.D(l),wy("dns-prefetch",l,null)}function Um(l,t){wt.C(l,t),wy("preconnect",l,t)}function pm(l,t,u){wt.L(l,t,u);var a=Ta;if(a&&l&&t){var e='link[rel="preload"][as="'+it(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+it(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+it(u.imageSizes)+'"]')):e+='[href="'+it(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}St.has(n)||(l=M({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),St.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(me(n))||t==="script"&&a.querySelector(he(n))||(t=a.createElement("link"),Cl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Nm(l,t){wt.m(l,t);var u=Ta;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+it(a)+'"][href="'+it(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!St.has(n)&&(l=M({rel:"modulepreload",href:l},t),St.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(he(n)))return}a=u.createElement("link"),Cl(a,"link",l),Dl(a),u.head.appendChild(a)}}}function Hm(l,t,u){wt.S(l,t,u);var a=Ta;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(me(n)))c.loading=5;else{l=M({rel:"stylesheet",href:l,"data-precedence":t},u),(u=St.get(n))&&Fc(l,u);var i=f=a.createElement("link");Dl(i),Cl(i,"link",l),i._p=new Promise(function(m,b){i.onload=m,i.onerror=b}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Un(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Rm(l,t){wt.X(l,t);var u=Ta;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(he(e)),n||(l=M({src:l,async:!0},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Dl(n),Cl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function Cm(l,t){wt.M(l,t);var u=Ta;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(he(e)),n||(l=M({src:l,async:!0,type:"module"},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Dl(n),Cl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function Wy(l,t,u,a){var e=(e=Z.current)?Dn(e):null;if(!e)throw Error(S(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(me(l)))&&!n._p&&(f.instance=n,f.state.loading=5),St.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},St.set(l,u),n||qm(e,l,u,f.state))),t&&a===null)throw Error(S(528,""));return f}if(t&&a!==null)throw Error(S(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(S(444,l))}}function Aa(l){return'href="'+it(l)+'"'}function me(l){return'link[rel="stylesheet"]['+l+"]"}function $y(l){return M({},l,{"data-precedence":l.precedence,precedence:null})}function qm(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Cl(t,"link",u),Dl(t),l.head.appendChild(t))}function _a(l){return'[src="'+it(l)+'"]'}function he(l){return"script[async]"+l}function Fy(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+it(u.href)+'"]');if(a)return t.instance=a,Dl(a),a;var e=M({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Dl(a),Cl(a,"style",e),Un(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(me(e));if(n)return t.state.loading|=4,t.instance=n,Dl(n),n;a=$y(u),(e=St.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),Dl(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Cl(n,"link",a),t.state.loading|=4,Un(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(he(n)))?(t.instance=e,Dl(e),e):(a=u,(e=St.get(n))&&(a=M({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Dl(e),Cl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(S(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Un(a,u.precedence,l));return t.instance}function Un(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var pn=null;function ky(l,t,u){if(pn===null){var a=new Map,e=pn=new Map;e.set(u,a)}else e=pn,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Na]||n[pl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Iy(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Bm(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(l=t.disabled,typeof t.precedence=="string"&&l==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function Py(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Ym(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(me(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Nn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Dl(n);return}n=t.ownerDocument||t,a=$y(a),(e=St.get(e))&&Fc(a,e),n=n.createElement("link"),Dl(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Cl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Nn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function jm(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*gm());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Nn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Hn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Hn=new Map,t.forEach(Gm,l),Hn=null,Nn.call(l))}function Gm(l,t){if(!(t.state.loading&4)){var u=Hn.get(l);if(u)var a=u.get(null);else{u=new Map,Hn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Nn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var oe={$$typeof:ql,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Xm(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function lv(l,t,u,a,e,n,f,c,i,m,b,E){return l=new Xm(l,t,u,f,i,m,b,E,c),t=1,n===!0&&(t|=24),n=lt(3,null,null,t),l.current=n,n.stateNode=l,t=Hf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function tv(l){return l?(l=ta,l):ta}function uv(l,t,u,a,e,n){e=tv(e),a.context===null?a.context=e:a.pendingContext=e,a=au(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=eu(l,a,t),u!==null&&(Wl(u,l,t),wa(u,l,t))}function av(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){av(l,t),(l=l.alternate)&&av(l,t)}function ev(l){if(l.tag===13||l.tag===31){var t=Uu(l,67108864);t!==null&&Wl(t,l,67108864),Pc(l,67108864)}}function nv(l){if(l.tag===13||l.tag===31){var t=nt();t=wn(t);var u=Uu(l,t);u!==null&&Wl(u,l,t),Pc(l,t)}}var Cn=!0;function Qm(l,t,u,a){var e=r.T;r.T=null;var n=A.p;try{A.p=2,li(l,t,u,a)}finally{A.p=n,r.T=e}}function Zm(l,t,u,a){var e=r.T;r.T=null;var n=A.p;try{A.p=8,li(l,t,u,a)}finally{A.p=n,r.T=e}}function li(l,t,u,a){if(Cn){var e=ti(a);if(e===null)Qc(l,t,a,qn,u),cv(l,a);else if(Vm(e,l,t,u,a))a.stopPropagation();else if(cv(l,a),t&4&&-1<xm.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Il(f);c.entanglements[1]|=i,f&=~i}Dt(n),(tl&6)===0&&(Sn=Fl()+500,se(0))}}break;case 31:case 13:c=Uu(n,2),c!==null&&Wl(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,qn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var qn=null;function ui(l){if(qn=null,l=Vu(l),l!==null){var t=L(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=al(t),l!==null)return l;l=null}else if(u===31){if(l=zl(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return qn=l,null}function fv(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Dv()){case hi:return 2;case oi:return 8;case Te:case Uv:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,ou=null,Su=null,gu=null,Se=new Map,ge=new Map,bu=[],xm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function cv(l,t){switch(l){case"focusin":case"focusout":ou=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":gu=null;break;case"pointerover":case"pointerout":Se.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ge.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&ev(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function Vm(l,t,u,a,e){switch(t){case"focusin":return ou=be(ou,l,t,u,a,e),!0;case"dragenter":return Su=be(Su,l,t,u,a,e),!0;case"mouseover":return gu=be(gu,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0}return!1}function iv(l){var t=Vu(l.target);if(t!==null){var u=L(t);if(u!==null){if(t=u.tag,t===13){if(t=al(u),t!==null){l.blockedOn=t,Ti(l.priority,function(){nv(u)});return}}else if(t===31){if(t=zl(u),t!==null){l.blockedOn=t,Ti(l.priority,function(){nv(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&ev(t),l.blockedOn=u,!1;t.shift()}return!0}function sv(l,t,u){Bn(l)&&u.delete(t)}function Lm(){ai=!1,ou!==null&&Bn(ou)&&(ou=null),Su!==null&&Bn(Su)&&(Su=null),gu!==null&&Bn(gu)&&(gu=null),Se.forEach(sv),ge.forEach(sv)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,O.unstable_scheduleCallback(O.unstable_NormalPriority,Lm)))}var jn=null;function yv(l){jn!==l&&(jn=l,O.unstable_scheduleCallback(O.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Yn(i,l)}ou!==null&&Yn(ou,l),Su!==null&&Yn(Su,l),gu!==null&&Yn(gu,l),Se.forEach(t),ge.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)iv(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[xl]||null;if(typeof n=="function")f||yv(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[xl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),yv(u)}}}function vv(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(S(409));var u=t.current,a=nt();uv(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;uv(l.current,2,null,l,null,null),bn(),t[xu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&iv(l)}};var dv=I.version;if(dv!=="19.2.4")throw Error(S(527,dv,"19.2.4"));A.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(S(188)):(l=Object.keys(l).join(","),Error(S(268,l)));return l=o(t),l=l!==null?U(l):null,l=l===null?null:l.stateNode,l};var Km={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:r,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject(Km),kl=Xn}catch{}}return ze.createRoot=function(l,t){if(!Y(l))throw Error(S(299));var u=!1,a="",e=rs,n=zs,f=Es;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=lv(l,1,!1,null,null,u,a,null,e,n,f,vv),l[xu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!Y(l))throw Error(S(299));var a=!1,e="",n=rs,f=zs,c=Es,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=lv(l,1,!0,t,u??null,a,e,i,n,f,c,vv),t.context=tv(null),u=t.current,a=nt(),a=wn(a),e=au(a),e.callback=null,eu(u,e,a),u=a,t.current.lanes=u,pa(t,u),Dt(t),l[xu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Tv;function u1(){if(Tv)return ci.exports;Tv=1;function O(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(O)}catch(I){console.error(I)}}return O(),ci.exports=t1(),ci.exports}var a1=u1();const e1=Av(a1);function n1({onSuccess:O}){const[I,$]=zu.useState(""),[S,Y]=zu.useState(""),[L,al]=zu.useState(!1);async function zl(){al(!1),(await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({login:I,password:S})})).ok?O():al(!0)}function H(o){o.key==="Enter"&&zl()}return Q.jsx("div",{className:"center",children:Q.jsxs("div",{className:"login-card",children:[Q.jsx("div",{className:"login-title",children:"Умные ценники PVZ"}),Q.jsx("div",{className:"login-subtitle",children:"Панель управления"}),Q.jsx("input",{placeholder:"Логин",value:I,onChange:o=>$(o.target.value),onKeyDown:H}),Q.jsx("input",{type:"password",placeholder:"Пароль",value:S,onChange:o=>Y(o.target.value),onKeyDown:H}),Q.jsx("button",{onClick:zl,children:"Войти"}),L&&Q.jsx("div",{className:"error",children:"Неверный логин или пароль"})]})})}const f1=3,c1=f1*60*1e3;function i1(){const[O,I]=zu.useState([]),[$,S]=zu.useState([]),Y=o=>{const U=O[o],M=$[o];return M?U.base_price!==M.base_price||U.discount!==M.discount||U.installed_at!==M.installed_at||U.product!==M.product:!1},L=async()=>{const U=await(await fetch("/api/boards")).json();I(U),S(U)};zu.useEffect(()=>{L();const o=setInterval(L,c1);return()=>clearInterval(o)},[]);const al=(o,U,M)=>{I(P=>{const ll=[...P];return U==="base_price"||U==="discount"?ll[o]={...ll[o],[U]:M===""?"":+M}:ll[o]={...ll[o],[U]:M},ll[o]._errors?.[U]&&(ll[o]._errors={...ll[o]._errors},delete ll[o]._errors[U]),ll})},zl=o=>{const U={};return(!o.product||o.product.trim()==="")&&(U.product=!0),(o.base_price===""||o.base_price<=0)&&(U.base_price=!0),(o.discount===""||o.discount<0||o.discount>=100)&&(U.discount=!0),U},H=async o=>{const U=O[o],M=zl(U);if(Object.keys(M).length>0){I(P=>{const ll=[...P];return ll[o]={...ll[o],_errors:M},ll});return}try{if(!(await fetch("/api/update_board",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(U)})).ok)throw new Error("Ошибка сервера");S(ll=>{const El=[...ll];return El[o]={...U},El}),I(ll=>{const El=[...ll];return El[o]={...U,synced:!1,_errors:{}},El})}catch(P){console.error(P)}};return Q.jsxs("div",{className:"page",children:[Q.jsx("h1",{className:"page-title",children:"Умные ценники"}),Q.jsx("div",{className:"table-card",children:Q.jsxs("table",{children:[Q.jsx("thead",{children:Q.jsxs("tr",{children:[Q.jsx("th",{children:"№"}),Q.jsx("th",{children:"Товар"}),Q.jsx("th",{children:"Цена"}),Q.jsx("th",{children:"Скидка %"}),Q.jsx("th",{children:"Дата установки"}),Q.jsx("th",{children:"Статус"}),Q.jsx("th",{})]})}),Q.jsx("tbody",{children:O.map((o,U)=>Q.jsxs("tr",{children:[Q.jsx("td",{className:"id-cell",children:o.id}),Q.jsx("td",{children:Q.jsx("textarea",{className:`cell-input ${o._errors?.product?"invalid":""}`,value:o.product,onChange:M=>al(U,"product",M.target.value),spellCheck:!1})}),Q.jsx("td",{children:Q.jsx("input",{type:"number",className:`cell-input ${o._errors?.base_price?"invalid":""}`,value:o.base_price===""?"":o.base_price,onChange:M=>al(U,"base_price",M.target.value)})}),Q.jsx("td",{children:Q.jsx("input",{type:"number",className:`cell-input ${o._errors?.discount?"invalid":""}`,value:o.discount===""?"":o.discount,onChange:M=>al(U,"discount",M.target.value)})}),Q.jsx("td",{children:Q.jsx("input",{type:"date",className:"cell-input",value:o.installed_at,onChange:M=>al(U,"installed_at",M.target.value)})}),Q.jsx("td",{className:`status-cell ${o.synced?"sync-ok":"sync-wait"}`,children:o.synced?"Обновлено":"Обновление"}),Q.jsx("td",{children:Q.jsx("button",{className:`apply-btn ${Y(U)?"active":"disabled"}`,disabled:!Y(U),onClick:()=>H(U),children:"Применить"})})]},o.id))})]})})]})}function s1(){const[O,I]=zu.useState(!1);return O?Q.jsx(i1,{}):Q.jsx(n1,{onSuccess:()=>I(!0)})}e1.createRoot(document.getElementById("root")).render(Q.jsx(Fm.StrictMode,{children:Q.jsx(s1,{})}));
+`).replace(om,"")}function qy(l,t){return t=Cy(t),Cy(l)===t}function il(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":Ue(l,"class",a);break;case"tabIndex":Ue(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Ue(l,u,a);break;case"style":qi(l,a,n);break;case"data":if(t!=="object"){Ue(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&il(l,t,"name",e.name,e,null),il(l,t,"formEncType",e.formEncType,e,null),il(l,t,"formMethod",e.formMethod,e,null),il(l,t,"formTarget",e.formTarget,e,null)):(il(l,t,"encType",e.encType,e,null),il(l,t,"method",e.method,e,null),il(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"onScroll":a!=null&&V("scroll",l);break;case"onScrollEnd":a!=null&&V("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(S(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(S(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=Ne(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":V("beforetoggle",l),V("toggle",l),De(l,"popover",a);break;case"xlinkActuate":Nt(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Nt(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Nt(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Nt(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Nt(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Nt(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Nt(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":De(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=Vv.get(u)||u,De(l,u,a))}}function Zc(l,t,u,a,e,n){switch(u){case"style":qi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(S(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(S(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&V("scroll",l);break;case"onScrollEnd":a!=null&&V("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Oi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[xl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):De(l,u,a)}}}function Cl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":V("error",l),V("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(S(137,t));default:il(l,t,n,f,u,null)}}e&&il(l,t,"srcSet",u.srcSet,u,null),a&&il(l,t,"src",u.src,u,null);return;case"input":V("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var b=u[a];if(b!=null)switch(a){case"name":e=b;break;case"type":f=b;break;case"checked":i=b;break;case"defaultChecked":m=b;break;case"value":n=b;break;case"defaultValue":c=b;break;case"children":case"dangerouslySetInnerHTML":if(b!=null)throw Error(S(137,t));break;default:il(l,t,a,b,u,null)}}Ni(l,n,c,i,m,f,e,!1);return;case"select":V("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:il(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":V("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(S(91));break;default:il(l,t,f,c,u,null)}Ri(l,a,e,n);return;case"option":for(i in u)u.hasOwnProperty(i)&&(a=u[i],a!=null)&&(i==="selected"?l.selected=a&&typeof a!="function"&&typeof a!="symbol":il(l,t,i,a,u,null));return;case"dialog":V("beforetoggle",l),V("toggle",l),V("cancel",l),V("close",l);break;case"iframe":case"object":V("load",l);break;case"video":case"audio":for(a=0;a<ye.length;a++)V(ye[a],l);break;case"image":V("error",l),V("load",l);break;case"details":V("toggle",l);break;case"embed":case"source":case"link":V("error",l),V("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(S(137,t));default:il(l,t,m,a,u,null)}return;default:if(lf(t)){for(b in u)u.hasOwnProperty(b)&&(a=u[b],a!==void 0&&Zc(l,t,b,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&il(l,t,c,a,u,null))}function Sm(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,b=null;for(g in u){var E=u[g];if(u.hasOwnProperty(g)&&E!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=E;default:a.hasOwnProperty(g)||il(l,t,g,null,a,E)}}for(var h in a){var g=a[h];if(E=u[h],a.hasOwnProperty(h)&&(g!=null||E!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":b=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(S(137,t));break;default:g!==E&&il(l,t,h,g,a,E)}}In(l,f,c,i,m,b,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||il(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&il(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:il(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(S(91));break;default:e!==n&&il(l,t,f,e,a,n)}Hi(l,h,g);return;case"option":for(var D in u)h=u[D],u.hasOwnProperty(D)&&h!=null&&!a.hasOwnProperty(D)&&(D==="selected"?l.selected=!1:il(l,t,D,null,a,h));for(i in a)h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null)&&(i==="selected"?l.selected=h&&typeof h!="function"&&typeof h!="symbol":il(l,t,i,h,a,g));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var C in u)h=u[C],u.hasOwnProperty(C)&&h!=null&&!a.hasOwnProperty(C)&&il(l,t,C,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(S(137,t));break;default:il(l,t,m,h,a,g)}return;default:if(lf(t)){for(var sl in u)h=u[sl],u.hasOwnProperty(sl)&&h!==void 0&&!a.hasOwnProperty(sl)&&Zc(l,t,sl,void 0,a,h);for(b in a)h=a[b],g=u[b],!a.hasOwnProperty(b)||h===g||h===void 0&&g===void 0||Zc(l,t,b,h,a,g);return}}for(var v in u)h=u[v],u.hasOwnProperty(v)&&h!=null&&!a.hasOwnProperty(v)&&il(l,t,v,null,a,h);for(E in a)h=a[E],g=u[E],!a.hasOwnProperty(E)||h===g||h==null&&g==null||il(l,t,E,h,a,g)}function By(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function gm(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&By(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var b=i.transferSize,E=i.initiatorType;b&&By(E)&&(i=i.responseEnd,f+=b*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var xc=null,Vc=null;function Mn(l){return l.nodeType===9?l:l.ownerDocument}function Yy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function jy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function bm(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Gy=typeof setTimeout=="function"?setTimeout:void 0,rm=typeof clearTimeout=="function"?clearTimeout:void 0,Xy=typeof Promise=="function"?Promise:void 0,zm=typeof queueMicrotask=="function"?queueMicrotask:typeof Xy<"u"?function(l){return Xy.resolve(null).then(l).catch(Em)}:Gy;function Em(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function Qy(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")de(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,de(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Na]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&de(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zy(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),Fn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Tm(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Na])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=ot(l.nextSibling),l===null)break}return null}function Am(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=ot(l.nextSibling),l===null))return null;return l}function xy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=ot(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function _m(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function ot(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Vy(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return ot(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Ly(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Ky(l,t,u){switch(t=Mn(u),l){case"html":if(l=t.documentElement,!l)throw Error(S(452));return l;case"head":if(l=t.head,!l)throw Error(S(453));return l;case"body":if(l=t.body,!l)throw Error(S(454));return l;default:throw Error(S(451))}}function de(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var St=new Map,Jy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var wt=A.d;A.d={f:Om,r:Mm,D:Dm,C:Um,L:pm,m:Nm,X:Rm,S:Hm,M:Cm};function Om(){var l=wt.f(),t=bn();return l||t}function Mm(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?ss(t):wt.r(l)}var Ta=typeof document>"u"?null:document;function wy(l,t,u){var a=Ta;if(a&&typeof t=="string"&&t){var e=it(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),Jy.has(e)||(Jy.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),Cl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Dm(l){wt.D(l),wy("dns-prefetch",l,null)}function Um(l,t){wt.C(l,t),wy("preconnect",l,t)}function pm(l,t,u){wt.L(l,t,u);var a=Ta;if(a&&l&&t){var e='link[rel="preload"][as="'+it(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+it(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+it(u.imageSizes)+'"]')):e+='[href="'+it(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}St.has(n)||(l=M({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),St.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(me(n))||t==="script"&&a.querySelector(he(n))||(t=a.createElement("link"),Cl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Nm(l,t){wt.m(l,t);var u=Ta;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+it(a)+'"][href="'+it(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!St.has(n)&&(l=M({rel:"modulepreload",href:l},t),St.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(he(n)))return}a=u.createElement("link"),Cl(a,"link",l),Dl(a),u.head.appendChild(a)}}}function Hm(l,t,u){wt.S(l,t,u);var a=Ta;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(me(n)))c.loading=5;else{l=M({rel:"stylesheet",href:l,"data-precedence":t},u),(u=St.get(n))&&Fc(l,u);var i=f=a.createElement("link");Dl(i),Cl(i,"link",l),i._p=new Promise(function(m,b){i.onload=m,i.onerror=b}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Un(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Rm(l,t){wt.X(l,t);var u=Ta;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(he(e)),n||(l=M({src:l,async:!0},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Dl(n),Cl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function Cm(l,t){wt.M(l,t);var u=Ta;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(he(e)),n||(l=M({src:l,async:!0,type:"module"},t),(t=St.get(e))&&kc(l,t),n=u.createElement("script"),Dl(n),Cl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function Wy(l,t,u,a){var e=(e=Z.current)?Dn(e):null;if(!e)throw Error(S(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(me(l)))&&!n._p&&(f.instance=n,f.state.loading=5),St.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},St.set(l,u),n||qm(e,l,u,f.state))),t&&a===null)throw Error(S(528,""));return f}if(t&&a!==null)throw Error(S(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(S(444,l))}}function Aa(l){return'href="'+it(l)+'"'}function me(l){return'link[rel="stylesheet"]['+l+"]"}function $y(l){return M({},l,{"data-precedence":l.precedence,precedence:null})}function qm(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),Cl(t,"link",u),Dl(t),l.head.appendChild(t))}function _a(l){return'[src="'+it(l)+'"]'}function he(l){return"script[async]"+l}function Fy(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+it(u.href)+'"]');if(a)return t.instance=a,Dl(a),a;var e=M({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Dl(a),Cl(a,"style",e),Un(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(me(e));if(n)return t.state.loading|=4,t.instance=n,Dl(n),n;a=$y(u),(e=St.get(e))&&Fc(a,e),n=(l.ownerDocument||l).createElement("link"),Dl(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Cl(n,"link",a),t.state.loading|=4,Un(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(he(n)))?(t.instance=e,Dl(e),e):(a=u,(e=St.get(n))&&(a=M({},u),kc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Dl(e),Cl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(S(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Un(a,u.precedence,l));return t.instance}function Un(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var pn=null;function ky(l,t,u){if(pn===null){var a=new Map,e=pn=new Map;e.set(u,a)}else e=pn,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Na]||n[pl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Iy(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Bm(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(l=t.disabled,typeof t.precedence=="string"&&l==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function Py(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Ym(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(me(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Nn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Dl(n);return}n=t.ownerDocument||t,a=$y(a),(e=St.get(e))&&Fc(a,e),n=n.createElement("link"),Dl(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),Cl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Nn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function jm(l,t){return l.stylesheets&&l.count===0&&Rn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*gm());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Rn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Nn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Rn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Hn=null;function Rn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Hn=new Map,t.forEach(Gm,l),Hn=null,Nn.call(l))}function Gm(l,t){if(!(t.state.loading&4)){var u=Hn.get(l);if(u)var a=u.get(null);else{u=new Map,Hn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Nn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var oe={$$typeof:ql,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Xm(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function lv(l,t,u,a,e,n,f,c,i,m,b,E){return l=new Xm(l,t,u,f,i,m,b,E,c),t=1,n===!0&&(t|=24),n=lt(3,null,null,t),l.current=n,n.stateNode=l,t=Hf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},Bf(n),l}function tv(l){return l?(l=ta,l):ta}function uv(l,t,u,a,e,n){e=tv(e),a.context===null?a.context=e:a.pendingContext=e,a=au(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=eu(l,a,t),u!==null&&(Wl(u,l,t),wa(u,l,t))}function av(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){av(l,t),(l=l.alternate)&&av(l,t)}function ev(l){if(l.tag===13||l.tag===31){var t=Uu(l,67108864);t!==null&&Wl(t,l,67108864),Pc(l,67108864)}}function nv(l){if(l.tag===13||l.tag===31){var t=nt();t=wn(t);var u=Uu(l,t);u!==null&&Wl(u,l,t),Pc(l,t)}}var Cn=!0;function Qm(l,t,u,a){var e=r.T;r.T=null;var n=A.p;try{A.p=2,li(l,t,u,a)}finally{A.p=n,r.T=e}}function Zm(l,t,u,a){var e=r.T;r.T=null;var n=A.p;try{A.p=8,li(l,t,u,a)}finally{A.p=n,r.T=e}}function li(l,t,u,a){if(Cn){var e=ti(a);if(e===null)Qc(l,t,a,qn,u),cv(l,a);else if(Vm(e,l,t,u,a))a.stopPropagation();else if(cv(l,a),t&4&&-1<xm.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Il(f);c.entanglements[1]|=i,f&=~i}Dt(n),(tl&6)===0&&(Sn=Fl()+500,se(0))}}break;case 31:case 13:c=Uu(n,2),c!==null&&Wl(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Qc(l,t,a,qn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Qc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var qn=null;function ui(l){if(qn=null,l=Vu(l),l!==null){var t=L(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=al(t),l!==null)return l;l=null}else if(u===31){if(l=zl(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return qn=l,null}function fv(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Dv()){case hi:return 2;case oi:return 8;case Te:case Uv:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,ou=null,Su=null,gu=null,Se=new Map,ge=new Map,bu=[],xm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function cv(l,t){switch(l){case"focusin":case"focusout":ou=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":gu=null;break;case"pointerover":case"pointerout":Se.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ge.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&ev(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function Vm(l,t,u,a,e){switch(t){case"focusin":return ou=be(ou,l,t,u,a,e),!0;case"dragenter":return Su=be(Su,l,t,u,a,e),!0;case"mouseover":return gu=be(gu,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0}return!1}function iv(l){var t=Vu(l.target);if(t!==null){var u=L(t);if(u!==null){if(t=u.tag,t===13){if(t=al(u),t!==null){l.blockedOn=t,Ti(l.priority,function(){nv(u)});return}}else if(t===31){if(t=zl(u),t!==null){l.blockedOn=t,Ti(l.priority,function(){nv(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&ev(t),l.blockedOn=u,!1;t.shift()}return!0}function sv(l,t,u){Bn(l)&&u.delete(t)}function Lm(){ai=!1,ou!==null&&Bn(ou)&&(ou=null),Su!==null&&Bn(Su)&&(Su=null),gu!==null&&Bn(gu)&&(gu=null),Se.forEach(sv),ge.forEach(sv)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,O.unstable_scheduleCallback(O.unstable_NormalPriority,Lm)))}var jn=null;function yv(l){jn!==l&&(jn=l,O.unstable_scheduleCallback(O.unstable_NormalPriority,function(){jn===l&&(jn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Yn(i,l)}ou!==null&&Yn(ou,l),Su!==null&&Yn(Su,l),gu!==null&&Yn(gu,l),Se.forEach(t),ge.forEach(t);for(var u=0;u<bu.length;u++){var a=bu[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<bu.length&&(u=bu[0],u.blockedOn===null);)iv(u),u.blockedOn===null&&bu.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[xl]||null;if(typeof n=="function")f||yv(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[xl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),yv(u)}}}function vv(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}Gn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(S(409));var u=t.current,a=nt();uv(u,a,l,t,null,null)},Gn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;uv(l.current,2,null,l,null,null),bn(),t[xu]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<bu.length&&t!==0&&t<bu[u].priority;u++);bu.splice(u,0,l),u===0&&iv(l)}};var dv=I.version;if(dv!=="19.2.4")throw Error(S(527,dv,"19.2.4"));A.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(S(188)):(l=Object.keys(l).join(","),Error(S(268,l)));return l=o(t),l=l!==null?U(l):null,l=l===null?null:l.stateNode,l};var Km={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:r,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Da=Xn.inject(Km),kl=Xn}catch{}}return ze.createRoot=function(l,t){if(!Y(l))throw Error(S(299));var u=!1,a="",e=rs,n=zs,f=Es;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=lv(l,1,!1,null,null,u,a,null,e,n,f,vv),l[xu]=t.current,Xc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!Y(l))throw Error(S(299));var a=!1,e="",n=rs,f=zs,c=Es,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=lv(l,1,!0,t,u??null,a,e,i,n,f,c,vv),t.context=tv(null),u=t.current,a=nt(),a=wn(a),e=au(a),e.callback=null,eu(u,e,a),u=a,t.current.lanes=u,pa(t,u),Dt(t),l[xu]=t.current,Xc(l),new Gn(t)},ze.version="19.2.4",ze}var Tv;function u1(){if(Tv)return ci.exports;Tv=1;function O(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(O)}catch(I){console.error(I)}}return O(),ci.exports=t1(),ci.exports}var a1=u1();const e1=Av(a1);const Ak0="session_token";function Ak1(){return sessionStorage.getItem(Ak0)}function Ak2(O){O?sessionStorage.setItem(Ak0,O):sessionStorage.removeItem(Ak0)}async function Ak3(O,I={}){const $=new Headers(I.headers),S=Ak1();S&&$.set("Authorization",`Bearer ${S}`);const Y=await fetch(O,{...I,headers:$});return Y.status===401&&(Ak2(null),window.location.reload()),Y}function n1({onSuccess:O}){const[I,$]=zu.useState(""),[S,Y]=zu.useState(""),[L,al]=zu.useState(!1);async function zl(){al(!1);const o=await fetch("/api/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({login:I,password:S})});if(o.ok){const U=await o.json();Ak2(U.token),O()}else al(!0)}function H(o){o.key==="Enter"&&zl()}return Q.jsx("div",{className:"center",children:Q.jsxs("div",{className:"login-card",children:[Q.jsx("div",{className:"login-title",children:"Умные ценники PVZ"}),Q.jsx("div",{className:"login-subtitle",children:"Панель управления"}),Q.jsx("input",{placeholder:"Логин",value:I,onChange:o=>$(o.target.value),onKeyDown:H}),Q.jsx("input",{type:"password",placeholder:"Пароль",value:S,onChange:o=>Y(o.target.value),onKeyDown:H}),Q.jsx("button",{onClick:zl,children:"Войти"}),L&&Q.jsx("div",{className:"error",children:"Неверный логин или пароль"})]})})}const f1=3,c1=f1*60*1e3;function i1(){const[O,I]=zu.useState([]),[$,S]=zu.useState([]),Y=o=>{const U=O[o],M=$[o];return M?U.base_price!==M.base_price||U.discount!==M.discount||U.installed_at!==M.installed_at||U.product!==M.product:!1},L=async()=>{const U=await(await Ak3("/api/boards")).json();I(U),S(U)};zu.useEffect(()=>{L();const o=setInterval(L,c1);return()=>clearInterval(o)},[]);const al=(o,U,M)=>{I(P=>{const ll=[...P];return U==="base_price"||U==="discount"?ll[o]={...ll[o],[U]:M===""?"":+M}:ll[o]={...ll[o],[U]:M},ll[o]._errors?.[U]&&(ll[o]._errors={...ll[o]._errors},delete ll[o]._errors[U]),ll})},zl=o=>{const U={};return(!o.product||o.product.trim()==="")&&(U.product=!0),(o.base_price===""||o.base_price<=0)&&(U.base_price=!0),(o.discount===""||o.discount<0||o.discount>=100)&&(U.discount=!0),U},H=async o=>{const U=O[o],M=zl(U);if(Object.keys(M).length>0){I(P=>{const ll=[...P];return ll[o]={...ll[o],_errors:M},ll});return}try{if(!(await Ak3("/api/update_board",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(U)})).ok)throw new Error("Ошибка сервера");S(ll=>{const El=[...ll];return El[o]={...U},El}),I(ll=>{const El=[...ll];return El[o]={...U,synced:!1,_errors:{}},El})}catch(P){console.error(P)}};return Q.jsxs("div",{className:"page",children:[Q.jsx("h1",{className:"page-title",children:"Умные ценники"}),Q.jsx("div",{className:"table-card",children:Q.jsxs("table",{children:[Q.jsx("thead",{children:Q.jsxs("tr",{children:[Q.jsx("th",{children:"№"}),Q.jsx("th",{children:"Товар"}),Q.jsx("th",{children:"Цена"}),Q.jsx("th",{children:"Скидка %"}),Q.jsx("th",{children:"Дата установки"}),Q.jsx("th",{children:"Статус"}),Q.jsx("th",{})]})}),Q.jsx("tbody",{children:O.map((o,U)=>Q.jsxs("tr",{children:[Q.jsx("td",{className:"id-cell",children:o.id}),Q.jsx("td",{children:Q.jsx("textarea",{className:`cell-input ${o._errors?.product?"invalid":""}`,value:o.product,onChange:M=>al(U,"product",M.target.value),spellCheck:!1})}),Q.jsx("td",{children:Q.jsx("input",{type:"number",className:`cell-input ${o._errors?.base_price?"invalid":""}`,value:o.base_price===""?"":o.base_price,onChange:M=>al(U,"base_price",M.target.value)})}),Q.jsx("td",{children:Q.jsx("input",{type:"number",className:`cell-input ${o._errors?.discount?"invalid":""}`,value:o.discount===""?"":o.discount,onChange:M=>al(U,"discount",M.target.value)})}),Q.jsx("td",{children:Q.jsx("input",{type:"date",className:"cell-input",value:o.installed_at,onChange:M=>al(U,"installed_at",M.target.value)})}),Q.jsx("td",{className:`status-cell ${o.synced?"sync-ok":"sync-wait"}`,children:o.synced?"Обновлено":"Обновление"}),Q.jsx("td",{children:Q.jsx("button",{className:`apply-btn ${Y(U)?"active":"disabled"}`,disabled:!Y(U),onClick:()=>H(U),children:"Применить"})})]},o.id))})]})})]})}function s1(){const[O,I]=zu.useState(()=>Ak1()!==null);return O?Q.jsx(i1,{}):Q.jsx(n1,{onSuccess:()=>I(!0)})}e1.createRoot(document.getElementById("root")).render(Q.jsx(Fm.StrictMode,{children:Q.jsx(s1,{})}));
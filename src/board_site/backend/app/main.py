@@ -1,31 +1,80 @@
+import asyncio
+import contextlib
+import os
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
-from core import init_users
-from database import db
+from core import config, init_users, metrics, presence
+from core.static import PrecompressedStaticFiles
+from database import db, telemetry
+
+FRONT_DIR = Path(__file__).parent / "front"
+
+
+def startup() -> bool:
+    """
+    Схема и админ. Если отпечаток схемы (с логином админа) совпадает с меткой
+    в базе, create_all, миграции и bcrypt пропускаются. False — ничего не делали.
+    STARTUP_FORCE_INIT=1 заставляет пройти инициализацию целиком
+    """
+    fingerprint = db.schema_fingerprint(extra=os.getenv("ADMIN_USER") or "")
+    if not os.getenv("STARTUP_FORCE_INIT") and db.schema_marker() == fingerprint:
+        db.load_db_state()
+        return False
 
-app = FastAPI()
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-load_dotenv()
+    db.init_db()
+    init_users.init_admin_user()
+    db.set_schema_marker(fingerprint)
+    return True
 
-db.init_db()
-init_users.init_admin_user()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start = time.perf_counter()
+    initialized = startup()
+    metrics.startup["seconds"] = app.state.startup_seconds = time.perf_counter() - start
+    print(f"Startup took {app.state.startup_seconds * 1000:.1f} ms"
+          f" ({'schema initialized' if initialized else 'schema up to date'})")
+    if config.FRONT_LEGACY_AUTH:
+        print("Admin API accepts requests without a session token (FRONT_LEGACY_AUTH)")
+    tasks = [
+        asyncio.create_task(presence.run_flusher()),
+        asyncio.create_task(telemetry.run_maintainer()),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await db.async_engine.dispose()
+    db.engine.dispose()
 
-def init_routers():
+
+def create_app() -> FastAPI:
     from routers.api import router as api_router
     from routers.board_host import router as brd_router
+    from routers.metrics import router as metrics_router
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(metrics.MetricsMiddleware)
 
     app.include_router(api_router, prefix="/api")
     app.include_router(brd_router, prefix="/board_host")
+    app.include_router(metrics_router)
+
+    app.mount("/", PrecompressedStaticFiles(directory=FRONT_DIR, html=True), name="frontend")
+    return app
+
 
-    app.mount("/", StaticFiles(directory="front", html=True), name="frontend")
-    
-init_routers()
+app = create_app()
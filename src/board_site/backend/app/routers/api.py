@@ -1,15 +1,46 @@
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, Query, Header
+from pydantic import BaseModel, ValidationError
+from typing import Optional, List, Literal
+from sqlalchemy import select, text, func, tuple_, and_, or_, literal_column, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+import base64
+import codecs
+import csv
+import hashlib
+import json
 
-from database.db import get_db
-from database.models import BoardORM, UserORM
-from database.utils import hash_password, verify_password
+from core.notify import board_changes
+from core import config
+from core.payload_cache import invalidate_board
+from core.presence import presence_status
+from core.sessions import sessions, require_user, require_front_user, bearer_token
+from database import outbox, telemetry
+from database.db import get_async_db, AsyncSessionLocal, fts_enabled
+from database.models import (
+    BoardORM, UserORM, BoardPresenceORM, TelemetryRollupORM, TelemetryNodeORM, TELEMETRY_COUNTERS, next_sync_version,
+)
+from database.utils import verify_password_async
 
 router = APIRouter()
 
+IMPORT_BATCH_SIZE = 5000
+MAX_IMPORT_ERRORS = 1000
+
+UPSERT_BOARD_SQL = text("""
+    INSERT INTO boards (id, product, base_price, discount, installed_at, zone, synced, sync_version)
+    VALUES (:id, :product, :base_price, :discount, :installed_at, :zone, 0,
+            (SELECT COALESCE(MAX(sync_version), 0) + 1 FROM boards))
+    ON CONFLICT(id) DO UPDATE SET
+        product = excluded.product,
+        base_price = excluded.base_price,
+        discount = excluded.discount,
+        installed_at = excluded.installed_at,
+        zone = COALESCE(excluded.zone, boards.zone),
+        synced = 0,
+        sync_version = excluded.sync_version
+""")
+
 
 class LoginRequest(BaseModel):
     login: str
@@ -22,52 +53,432 @@ class Board(BaseModel):
     base_price: float
     discount: float
     installed_at: str
+    zone: Optional[str] = None
     synced: Optional[bool] = True
+    sync_version: Optional[int] = None
 
     class Config:
         orm_mode = True
 
 
+class BoardListItem(Board):
+    # Ценник, установленный, но ещё не заполненный в админке
+    product: Optional[str] = None
+    base_price: Optional[float] = None
+    discount: Optional[float] = None
+
+
 @router.post("/login")
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(UserORM).filter(UserORM.login == data.login).first()
-    if not user or not verify_password(data.password, user.hashed_password):
+async def login(data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    user = await db.scalar(select(UserORM).where(UserORM.login == data.login))
+    if not user or not await verify_password_async(data.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    return {"ok": True, "username": user.login}
 
+    token = sessions.issue(user.login)
+    return {
+        "ok": True,
+        "username": user.login,
+        "token": token,
+        "expires_in": sessions.ttl_seconds,
+    }
+
+
+@router.post("/logout")
+async def logout(authorization: Optional[str] = Header(None)):
+    token = bearer_token(authorization)
+    if token:
+        sessions.revoke(token)
+    return {"ok": True}
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+SORT_COLUMNS = {
+    "id": BoardORM.id,
+    "product": BoardORM.product,
+    "price": BoardORM.base_price,
+    "synced": BoardORM.synced,
+}
+MAX_PAGE_SIZE = 1000
+MIN_FTS_QUERY = 3  # триграммный индекс ищет подстроки от 3 символов
+
+
+def encode_cursor(value, board_id: str) -> str:
+    raw = json.dumps([value, board_id], ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        value, board_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value, board_id
 
-@router.get("/boards", response_model=List[Board])
-def get_boards(db: Session = Depends(get_db)):
-    boards = db.query(BoardORM).all()
+
+def product_search(q: str):
+    if fts_enabled() and len(q) >= MIN_FTS_QUERY:
+        phrase = '"' + q.replace('"', '""') + '"'
+        return literal_column("boards.rowid").in_(
+            text("SELECT rowid FROM boards_fts WHERE boards_fts MATCH :phrase")
+            .bindparams(phrase=phrase)
+            .columns(rowid=Integer)
+        )
+    # Без FTS и для коротких запросов — подстрока без учёта регистра, как в FTS
+    return func.unicode_lower(BoardORM.product).contains(q.lower(), autoescape=True)
+
+
+def after_cursor(column, value, board_id: str, order: str):
+    """
+    Строки после курсора (value, board_id). NULL в колонке SQLite ставит первым
+    при asc и последним при desc; сравнение кортежей с NULL ложно, поэтому явно
+    """
+    if value is None:
+        if order == "asc":
+            return or_(and_(column.is_(None), BoardORM.id > board_id), column.is_not(None))
+        return and_(column.is_(None), BoardORM.id < board_id)
+    key = tuple_(column, BoardORM.id)
+    if order == "asc":
+        return key > tuple_(value, board_id)
+    return or_(key < tuple_(value, board_id), column.is_(None))
+
+
+@router.get("/boards", response_model=List[BoardListItem], dependencies=[Depends(require_front_user)])
+async def get_boards(
+        request: Request,
+        response: Response,
+        since: Optional[int] = Query(None, ge=0),
+        q: Optional[str] = Query(None, max_length=100),
+        sort: Literal["id", "product", "price", "synced"] = "id",
+        order: Literal["asc", "desc"] = "asc",
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        after: Optional[str] = None,
+        db: AsyncSession = Depends(get_async_db)):
+    # Любая запись в boards поднимает sync_version, поэтому MAX по индексу
+    # однозначно описывает состояние таблицы
+    version = await db.scalar(select(func.coalesce(func.max(BoardORM.sync_version), 0)))
+    etag = f"boards-{version}"
+    if request.url.query:
+        etag += "-" + hashlib.sha1(request.url.query.encode()).hexdigest()[:16]
+    etag = f'"{etag}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "X-Sync-Version": str(version),
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    query = select(BoardORM)
+    if since is not None:
+        query = query.where(BoardORM.sync_version > since)
+    if q and q.strip():
+        query = query.where(product_search(q.strip()))
+
+    # Keyset-пагинация по (колонка сортировки, id): страница не зависит от OFFSET
+    column = SORT_COLUMNS[sort]
+    if after:
+        value, board_id = decode_cursor(after)
+        query = query.where(after_cursor(column, value, board_id, order))
+    if order == "asc":
+        query = query.order_by(column, BoardORM.id)
+    else:
+        query = query.order_by(column.desc(), BoardORM.id.desc())
+    if limit:
+        query = query.limit(limit)
+
+    boards = (await db.scalars(query)).all()
+    if limit and len(boards) == limit:
+        last = boards[-1]
+        headers["X-Next-Cursor"] = encode_cursor(
+            getattr(last, column.key), last.id
+        )
+    response.headers.update(headers)
     return boards
 
 
-@router.post("/update_board", response_model=Board)
-def update_board(board: Board, db: Session = Depends(get_db)):
+class ImportRowError(BaseModel):
+    line: int
+    id: Optional[str] = None
+    errors: dict
+
+
+class ImportReport(BaseModel):
+    received: int = 0
+    upserted: int = 0
+    error_count: int = 0
+    errors: List[ImportRowError] = []
+
+
+def validate_board(board: Board) -> dict:
     errors = {}
+    # В mesh-записи для хаба длина id — один байт
+    if len(board.id.encode()) > 255:
+        errors["id"] = "Board id must be at most 255 bytes"
     if not board.product.strip():
         errors["product"] = "Product name cannot be empty"
     if board.base_price <= 0:
         errors["base_price"] = "Base price must be greater than 0"
     if board.discount < 0 or board.discount >= 100:
         errors["discount"] = "Discount must be between 0 and 100"
+    return errors
+
 
+async def iter_lines(request: Request):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    async for chunk in request.stream():
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.rstrip("\r")
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail.rstrip("\r")
+
+
+async def iter_csv_records(request: Request):
+    """
+    (номер первой строки, значения) CSV-записей. Запись может занимать несколько
+    строк: пока кавычка не закрыта, перевод строки принадлежит полю
+    """
+    record = []
+    quotes = 0
+    start = line_no = 0
+    async for line in iter_lines(request):
+        line_no += 1
+        if not record:
+            start = line_no
+        record.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        if line.strip() or len(record) > 1:
+            yield start, next(csv.reader(record))
+        record, quotes = [], 0
+    if record:
+        # Незакрытая кавычка в конце файла: csv.reader отдаст поле до конца данных
+        yield start, next(csv.reader(record))
+
+
+async def iter_import_rows(request: Request):
+    """(номер строки, dict) из JSON lines или CSV с заголовком, без буферизации тела"""
+    if "csv" in request.headers.get("content-type", ""):
+        columns = None
+        async for line_no, values in iter_csv_records(request):
+            if columns is None:
+                columns = [name.strip() for name in values]
+                continue
+            yield line_no, dict(zip(columns, values))
+        return
+
+    line_no = 0
+    async for line in iter_lines(request):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError:
+            yield line_no, None
+
+
+async def upsert_boards(rows: list):
+    async with AsyncSessionLocal() as db:
+        await db.execute(UPSERT_BOARD_SQL, rows)
+        await db.execute(outbox.ENQUEUE_SQL, [
+            outbox.enqueue_params(row["id"], outbox.PRIORITY_BULK) for row in rows
+        ])
+        await db.commit()
+
+
+@router.post("/boards/import", response_model=ImportReport,
+             dependencies=[Depends(require_front_user)])
+async def import_boards(request: Request):
+    report = ImportReport()
+    batch = []
+
+    def add_error(line_no, board_id, errors):
+        report.error_count += 1
+        if len(report.errors) < MAX_IMPORT_ERRORS:
+            report.errors.append(ImportRowError(line=line_no, id=board_id, errors=errors))
+
+    async for line_no, row in iter_import_rows(request):
+        report.received += 1
+        if not isinstance(row, dict):
+            add_error(line_no, None, {"row": "Invalid row format"})
+            continue
+
+        try:
+            board = Board.model_validate(row)
+        except ValidationError as e:
+            add_error(line_no, row.get("id"), {
+                ".".join(str(part) for part in err["loc"]): err["msg"]
+                for err in e.errors()
+            })
+            continue
+
+        errors = validate_board(board)
+        if not board.id:
+            errors["id"] = "No board id"
+        if errors:
+            add_error(line_no, board.id, errors)
+            continue
+
+        batch.append({
+            "id": board.id,
+            "product": board.product,
+            "base_price": board.base_price,
+            "discount": board.discount,
+            "installed_at": board.installed_at,
+            "zone": board.zone,
+        })
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await upsert_boards(batch)
+            report.upserted += len(batch)
+            batch = []
+
+    if batch:
+        await upsert_boards(batch)
+        report.upserted += len(batch)
+
+    if report.upserted:
+        board_changes.notify()
+    return report
+
+
+@router.post("/update_board", response_model=Board, dependencies=[Depends(require_front_user)])
+async def update_board(board: Board, db: AsyncSession = Depends(get_async_db)):
+    errors = validate_board(board)
     if errors:
         raise HTTPException(status_code=400, detail=errors)
 
     if board.id:
-        db_board = db.query(BoardORM).filter(BoardORM.id == board.id).first()
+        db_board = await db.get(BoardORM, board.id)
         if not db_board:
             raise HTTPException(status_code=404, detail="Board not found")
+        priority = outbox.change_priority(db_board, board)
         db_board.product = board.product
         db_board.base_price = board.base_price
         db_board.discount = board.discount
         db_board.installed_at = board.installed_at
+        # Старые клиенты зону не присылают — не затираем
+        if "zone" in board.model_fields_set:
+            db_board.zone = board.zone
         db_board.synced = False
+        db_board.sync_version = next_sync_version()
     else:
         raise HTTPException(status_code=404, detail="No board id")
 
-
-    db.commit()
-    db.refresh(db_board)
+    await db.flush()
+    await db.execute(outbox.ENQUEUE_SQL, outbox.enqueue_params(board.id, priority))
+    await db.commit()
+    invalidate_board(board.id)
+    board_changes.notify()
+    await db.refresh(db_board)
     return db_board
+
+
+@router.get("/telemetry/rollups", dependencies=[Depends(require_user)])
+async def get_telemetry_rollups(
+        resolution: Literal["minute", "hour"] = "minute",
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        gateway: Optional[str] = None,
+        node: Optional[int] = None,
+        db: AsyncSession = Depends(get_async_db)):
+    # Ряд по корзинам, суммарно по выбранным шлюзам и узлам.
+    # Текущая минута появляется после следующего пересчёта агрегатов
+    step = telemetry.RESOLUTIONS[resolution]
+    if since is None:
+        since = (until or datetime.now().timestamp()) - 24 * 60 * 60
+    rollup = TelemetryRollupORM
+    query = (
+        select(
+            rollup.bucket,
+            *(func.sum(getattr(rollup, name)).label(name) for name in TELEMETRY_COUNTERS),
+            func.sum(rollup.latency_count).label("latency_count"),
+            func.sum(rollup.latency_sum).label("latency_sum"),
+            func.min(rollup.latency_min).label("latency_min"),
+            func.max(rollup.latency_max).label("latency_max"),
+        )
+        .where(rollup.resolution == step, rollup.bucket >= since)
+        .group_by(rollup.bucket)
+        .order_by(rollup.bucket)
+    )
+    if until is not None:
+        query = query.where(rollup.bucket < until)
+    if gateway is not None:
+        query = query.where(rollup.gateway == gateway)
+    if node is not None:
+        query = query.where(rollup.node == node)
+
+    points = []
+    for row in (await db.execute(query)).mappings():
+        attempts = row["acks"] + row["timeouts"]
+        points.append({
+            **row,
+            "delivery_rate": round(row["acks"] / attempts, 4) if attempts else None,
+            "latency_avg_ms": (round(row["latency_sum"] / row["latency_count"], 1)
+                               if row["latency_count"] else None),
+        })
+    return {"resolution": resolution, "points": points}
+
+
+@router.get("/telemetry/nodes", dependencies=[Depends(require_user)])
+async def get_telemetry_nodes(gateway: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    query = select(TelemetryNodeORM).order_by(TelemetryNodeORM.gateway, TelemetryNodeORM.node)
+    if gateway is not None:
+        query = query.where(TelemetryNodeORM.gateway == gateway)
+    return [
+        {
+            "gateway": node.gateway,
+            "node": node.node,
+            "last_seen": node.last_seen,
+            **{name: getattr(node, name) for name in TELEMETRY_COUNTERS},
+        }
+        for node in (await db.scalars(query)).all()
+    ]
+
+
+@router.get("/presence", dependencies=[Depends(require_user)])
+async def get_presence(
+        status: Optional[Literal["online", "stale", "offline", "missing"]] = None,
+        limit: int = Query(1000, ge=1, le=10000),
+        db: AsyncSession = Depends(get_async_db)):
+    # missing = stale + offline. Данные отстают от шлюза на PRESENCE_FLUSH_SECONDS
+    now = datetime.now().timestamp()
+    stale_before = now - config.PRESENCE_STALE_SECONDS
+    offline_before = now - config.PRESENCE_OFFLINE_SECONDS
+    query = select(BoardPresenceORM)
+    if status == "online":
+        query = query.where(BoardPresenceORM.last_seen > stale_before)
+    elif status == "stale":
+        query = query.where(BoardPresenceORM.last_seen <= stale_before,
+                            BoardPresenceORM.last_seen > offline_before)
+    elif status == "offline":
+        query = query.where(BoardPresenceORM.last_seen <= offline_before)
+    elif status == "missing":
+        query = query.where(BoardPresenceORM.last_seen <= stale_before)
+
+    rows = (await db.scalars(query.order_by(BoardPresenceORM.last_seen).limit(limit))).all()
+    return [
+        {
+            "node_id": row.node_id,
+            "gateway": row.gateway,
+            "status": presence_status(row.last_seen, now),
+            "last_seen": row.last_seen,
+            "age_s": round(now - row.last_seen, 1),
+            "first_seen": row.first_seen,
+            "heartbeats": row.heartbeats,
+            "hops": row.hops,
+            "rssi": row.rssi,
+        }
+        for row in rows
+    ]
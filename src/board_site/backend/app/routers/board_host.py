@@ -1,17 +1,51 @@
-from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi import APIRouter, HTTPException, Header, Depends, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Optional, List
+from sqlalchemy import select, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+import json
 import os
+import struct
+import time
 
-from database.db import get_db
-from database.models import BoardORM
+from core import config, metrics
+from core.presence import presence
+from core.notify import board_changes
+from core.payload_cache import board_payloads, board_mesh_payloads, invalidate_board
+from core.price_codec import encode_price
+from database import outbox, telemetry
+from database.db import get_async_db, AsyncSessionLocal
+from database.models import BoardORM, SyncOutboxORM, stamp_sync_versions
 
 router = APIRouter()
 
 GATEWAY_TOKEN = os.getenv("GATEWAY_TOKEN")
 
 
+def load_gateway_tokens() -> dict:
+    """Токен -> имя шлюза; имя — владелец аренды ценников"""
+    tokens = {}
+    if GATEWAY_TOKEN:
+        tokens[GATEWAY_TOKEN] = "default"
+    for item in config.GATEWAY_TOKENS.split(","):
+        name, _, token = item.strip().partition("=")
+        if name and token:
+            tokens[token] = name
+    return tokens
+
+
+GATEWAYS = load_gateway_tokens()
+
+MAX_BATCH_SIZE = 500
+MAX_TELEMETRY_BATCH = 5000
+MAX_PRESENCE_BATCH = 5000
+MAX_WAIT_SECONDS = 60
+MAX_RETRY_AFTER = 24 * 60 * 60
+MAX_MESH_ID_BYTES = 255
+SSE_KEEPALIVE_SECONDS = 15
+
+
 class PriceValue(BaseModel):
     rubs: int
     kopecks: int = 99
@@ -33,26 +67,74 @@ class BoardData(BaseModel):
     product: ProductInfo
 
 
+class BoardBatch(BaseModel):
+    boards: List[BoardData]
+    cursor: Optional[str] = None
+
+
+class BoardChanges(BaseModel):
+    boards: List[BoardData]
+    version: int
+
+
 class ConfirmBoardRequest(BaseModel):
     board_id: str
 
 
-@router.get("/unsync_board", response_model=Optional[BoardData])
-def get_first_unsynced_board(
-        authorization: str = Header(...),
-        db: Session = Depends(get_db)):
-    board = (
-        db.query(BoardORM)
-        .filter(BoardORM.synced == False)
-        .order_by(BoardORM.id)
-        .first()
-    )
-    if authorization != f"Bearer {GATEWAY_TOKEN}":
+class ConfirmBoardsRequest(BaseModel):
+    board_ids: List[str]
+
+
+class OutboxAck(BaseModel):
+    board_id: str
+    sync_version: int
+
+
+class OutboxAckRequest(BaseModel):
+    items: List[OutboxAck]
+
+
+class NodeStats(BaseModel):
+    node: int
+    tx: int = 0
+    rx: int = 0
+    relayed: int = 0
+    acks: int = 0
+    dropped_duplicate: int = 0
+    dropped_ttl: int = 0
+    timeouts: int = 0
+
+
+class AckLatency(BaseModel):
+    node: int
+    latency_ms: float
+
+
+class TelemetryBatch(BaseModel):
+    snapshots: List[NodeStats] = []
+    latencies: List[AckLatency] = []
+
+
+class Heartbeat(BaseModel):
+    node_id: int
+    seen_at: Optional[float] = None
+    hops: Optional[int] = None
+    rssi: Optional[int] = None
+
+
+class HeartbeatBatch(BaseModel):
+    heartbeats: List[Heartbeat]
+
+
+async def check_gateway_token(authorization: str = Header(...)) -> str:
+    scheme, _, token = authorization.partition(" ")
+    gateway = GATEWAYS.get(token) if scheme == "Bearer" else None
+    if gateway is None:
         raise HTTPException(status_code=401, detail="Unauthorized")
+    return gateway
 
-    if not board or board.base_price is None or board.product is None:
-        return None
 
+def to_board_data(board: BoardORM) -> BoardData:
     res_price = board.base_price
     discount_block = None
     if board.discount is not None:
@@ -61,7 +143,7 @@ def get_first_unsynced_board(
             base_price=PriceValue(rubs=int(board.base_price)),
             discount=board.discount
         )
-        
+
     return BoardData(
         board_id=board.id,
         product=ProductInfo(
@@ -72,20 +154,386 @@ def get_first_unsynced_board(
     )
 
 
-@router.post("/confirm_board")
-def confirm_board(
-    data: ConfirmBoardRequest,
-    authorization: str = Header(...),
-    db: Session = Depends(get_db)
-):
-    if authorization != f"Bearer {GATEWAY_TOKEN}":
-        raise HTTPException(status_code=401, detail="Unauthorized")
+def board_payload(board: BoardORM) -> bytes:
+    payload = board_payloads.get(board.id, board.sync_version)
+    if payload is None:
+        payload = to_board_data(board).model_dump_json().encode()
+        board_payloads.put(board.id, board.sync_version, payload)
+    return payload
+
+
+def boards_payloads(boards) -> List[bytes]:
+    return [
+        board_payload(board) for board in boards
+        if board.base_price is not None and board.product is not None
+    ]
+
+
+def list_payload(payloads: List[bytes], **fields) -> bytes:
+    # Склеиваем готовые байты без повторной сериализации ценников
+    tail = b"".join(
+        b"," + json.dumps(key).encode() + b":" + json.dumps(value).encode()
+        for key, value in fields.items()
+    )
+    return b'{"boards":[' + b",".join(payloads) + b"]" + tail + b"}"
+
+
+def board_mesh_record(board: BoardORM) -> Optional[bytes]:
+    """
+    Запись для хаба: длина id (1 байт), id, sync_version (4 байта), длина цены
+    (2 байта) и сама цена SET_PRICE_BIN без добивки — на фрагменты её режет
+    MeshNode.send, так что в эфир не уходят лишние байты.
+    None — id длиннее 255 байт и в запись не помещается
+    """
+    record = board_mesh_payloads.get(board.id, board.sync_version)
+    if record is None:
+        board_id = board.id.encode()
+        if len(board_id) > MAX_MESH_ID_BYTES:
+            return None
+        product = to_board_data(board).product
+        discount = product.discount
+        has_discount = discount is not None and discount.base_price is not None
+        price = encode_price(
+            product.name,
+            product.res_price.rubs,
+            product.res_price.kopecks,
+            base_rubs=discount.base_price.rubs if has_discount else None,
+            base_kopecks=discount.base_price.kopecks if has_discount else None,
+            discount=discount.discount if has_discount else None,
+        )
+        record = b"".join([
+            struct.pack(">B", len(board_id)), board_id,
+            struct.pack(">IH", board.sync_version, len(price)), price,
+        ])
+        board_mesh_payloads.put(board.id, board.sync_version, record)
+    return record
+
+
+def json_response(payload: bytes) -> Response:
+    return Response(content=payload, media_type="application/json")
+
+
+@router.get("/unsync_boards", response_model=BoardBatch)
+async def get_unsynced_boards(
+        limit: int = Query(100, ge=1, le=MAX_BATCH_SIZE),
+        cursor: Optional[str] = None,
+        zone: Optional[str] = None,
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Через аренду, как /claim: два шлюза не отправят один ценник дважды.
+    # Листать не нужно — следующий запрос и так захватит ещё не выданные ценники,
+    # поэтому cursor в запросе не учитывается, о чём старым клиентам говорят заголовки;
+    # cursor в ответе — лишь признак полной пачки (стоит сразу запросить ещё)
+    rows = await claim_boards(db, gateway, zone, limit, config.GATEWAY_LEASE_SECONDS)
+    boards = [board for _, board in rows]
+    next_cursor = boards[-1].id if len(boards) == limit else None
+    response = json_response(list_payload(boards_payloads(boards), cursor=next_cursor))
+    if cursor is not None:
+        response.headers["Deprecation"] = "true"
+        response.headers["Warning"] = '299 - "cursor is ignored: boards are leased, request again for more"'
+    return response
+
+
+@router.get("/unsync_boards/mesh")
+async def get_unsynced_boards_mesh(
+        limit: int = Query(20, ge=1, le=MAX_BATCH_SIZE),
+        zone: Optional[str] = None,
+        lease_seconds: float = Query(config.GATEWAY_LEASE_SECONDS, gt=0, le=3600),
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Пачка в аренду, как /claim; доставленное шлюз подтверждает в /outbox/ack
+    # по sync_version из записи
+    rows = await claim_boards(db, gateway, zone, limit, lease_seconds)
+    records, skipped = [], []
+    for _, board in rows:
+        if board.base_price is None or board.product is None:
+            continue
+        record = board_mesh_record(board)
+        if record is None:
+            skipped.append(board.id)
+        else:
+            records.append(record)
+    headers = {"X-Record-Count": str(len(records))}
+    if skipped:
+        # Такой id не адресовать в эфире — ценник надо переименовать
+        headers["X-Skipped-Count"] = str(len(skipped))
+    return Response(content=b"".join(records), media_type="application/octet-stream",
+                    headers=headers)
 
-    board = db.query(BoardORM).filter(BoardORM.id == data.board_id).first()
-    if not board:
+
+@router.get("/changes", response_model=BoardChanges,
+            dependencies=[Depends(check_gateway_token)])
+async def get_changed_boards(
+        since: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=MAX_BATCH_SIZE),
+        db: AsyncSession = Depends(get_async_db)):
+    # Диапазон по индексу sync_version: стоимость пропорциональна числу изменений
+    boards = (await db.scalars(
+        select(BoardORM)
+        .where(BoardORM.sync_version > since, BoardORM.synced == False)
+        .order_by(BoardORM.sync_version)
+        .limit(limit)
+    )).all()
+    version = boards[-1].sync_version if boards else since
+    return json_response(list_payload(boards_payloads(boards), version=version))
+
+
+async def claim_batch(gateway: str, zone: Optional[str], limit: int) -> List[bytes]:
+    # Своя сессия: долгое ожидание не держит соединение из пула
+    async with AsyncSessionLocal() as db:
+        rows = await claim_boards(db, gateway, zone, limit, config.GATEWAY_LEASE_SECONDS)
+    return boards_payloads([board for _, board in rows])
+
+
+@router.get("/unsync_boards/wait", response_model=BoardBatch)
+async def wait_unsynced_boards(
+        limit: int = Query(100, ge=1, le=MAX_BATCH_SIZE),
+        timeout: float = Query(25, ge=0, le=MAX_WAIT_SECONDS),
+        zone: Optional[str] = None,
+        gateway: str = Depends(check_gateway_token)):
+    # Выдаём через аренду: уже полученные шлюзом, но не подтверждённые ценники
+    # до конца аренды не вернутся, и без новой работы запрос ждёт, а не отвечает сразу.
+    # Версию берём до запроса, чтобы не потерять изменение между запросом и ожиданием
+    since = board_changes.version
+    payloads = await claim_batch(gateway, zone, limit)
+    if not payloads and await board_changes.wait(since, timeout):
+        payloads = await claim_batch(gateway, zone, limit)
+    return json_response(list_payload(payloads, cursor=None))
+
+
+@router.get("/unsync_stream")
+async def stream_unsynced_boards(
+        limit: int = Query(100, ge=1, le=MAX_BATCH_SIZE),
+        zone: Optional[str] = None,
+        gateway: str = Depends(check_gateway_token)):
+    async def events():
+        while True:
+            # Пачки через аренду; просроченные аренды подберёт очередной проход
+            # не позже чем через SSE_KEEPALIVE_SECONDS
+            since = board_changes.version
+            payloads = await claim_batch(gateway, zone, limit)
+            if payloads:
+                yield b"event: boards\ndata: " + list_payload(payloads, cursor=None) + b"\n\n"
+            if len(payloads) == limit:
+                continue
+            if not await board_changes.wait(since, SSE_KEEPALIVE_SECONDS):
+                yield b": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/unsync_board", response_model=Optional[BoardData])
+async def get_first_unsynced_board(
+        zone: Optional[str] = None,
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Через аренду: два шлюза, опрашивающие одновременно, получат разные ценники
+    rows = await claim_boards(db, gateway, zone, 1, config.GATEWAY_LEASE_SECONDS)
+    payloads = boards_payloads([board for _, board in rows])
+    return json_response(payloads[0] if payloads else b"null")
+
+
+@router.get("/cache_stats", dependencies=[Depends(check_gateway_token)])
+async def get_cache_stats():
+    return {"json": board_payloads.stats(), "mesh": board_mesh_payloads.stats()}
+
+
+def outbox_query():
+    # Порядок отправки: класс приоритета, затем очередь постановки
+    return (
+        select(SyncOutboxORM, BoardORM)
+        .join(BoardORM, BoardORM.id == SyncOutboxORM.board_id)
+        .order_by(SyncOutboxORM.priority, SyncOutboxORM.id)
+    )
+
+
+def outbox_payload(rows) -> bytes:
+    entries = [
+        json.dumps({
+            "sync_version": entry.sync_version,
+            "priority": outbox.PRIORITY_NAMES.get(entry.priority, entry.priority),
+            "superseded": entry.superseded,
+            "lease_owner": entry.lease_owner,
+            "lease_expires_at": entry.lease_expires_at,
+        }).encode()[:-1] + b',"board":' + board_payload(board) + b"}"
+        for entry, board in rows
+        if board.base_price is not None and board.product is not None
+    ]
+    return b'{"entries":[' + b",".join(entries) + b"]}"
+
+
+async def claim_boards(db: AsyncSession, gateway: str, zone: Optional[str], limit: int,
+                       lease_seconds: float):
+    claimed = (await db.execute(
+        outbox.CLAIM_SQL, outbox.claim_params(gateway, zone, limit, lease_seconds)
+    )).scalars().all()
+    rows = []
+    if claimed:
+        rows = (await db.execute(
+            outbox_query().where(SyncOutboxORM.board_id.in_(claimed))
+        )).all()
+    await db.commit()
+    return rows
+
+
+@router.get("/outbox", dependencies=[Depends(check_gateway_token)])
+async def get_outbox(
+        limit: int = Query(100, ge=1, le=MAX_BATCH_SIZE),
+        db: AsyncSession = Depends(get_async_db)):
+    rows = (await db.execute(outbox_query().limit(limit))).all()
+    return json_response(outbox_payload(rows))
+
+
+@router.post("/claim")
+async def claim_outbox(
+        limit: int = Query(20, ge=1, le=MAX_BATCH_SIZE),
+        zone: Optional[str] = None,
+        lease_seconds: float = Query(config.GATEWAY_LEASE_SECONDS, gt=0, le=3600),
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Пачка закрепляется за шлюзом; незакрытая ack аренда истекает сама
+    rows = await claim_boards(db, gateway, zone, limit, lease_seconds)
+    return json_response(outbox_payload(rows))
+
+
+@router.get("/outbox/stats", dependencies=[Depends(check_gateway_token)])
+async def get_outbox_stats(db: AsyncSession = Depends(get_async_db)):
+    rows = (await db.execute(
+        select(
+            SyncOutboxORM.priority,
+            func.count(),
+            func.min(SyncOutboxORM.created_at),
+            func.sum(SyncOutboxORM.superseded),
+        ).group_by(SyncOutboxORM.priority)
+    )).all()
+    now = time.time()
+    return {
+        "total": sum(row[1] for row in rows),
+        "superseded": sum(row[3] or 0 for row in rows),
+        "classes": {
+            outbox.PRIORITY_NAMES.get(priority, str(priority)): {
+                "count": count,
+                "oldest_age_s": round(now - oldest, 1),
+                "superseded": superseded or 0,
+            }
+            for priority, count, oldest, superseded in rows
+        },
+    }
+
+
+@router.post("/outbox/ack")
+async def ack_outbox(
+        data: OutboxAckRequest,
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Подтверждение устаревшей версии или чужой аренды не снимает запись из
+    # очереди. Свою аренду на устаревшую версию отпускаем: новую версию сразу
+    # сможет забрать любой шлюз
+    acked, stale = [], []
+    for item in data.items:
+        params = {"board_id": item.board_id, "sync_version": item.sync_version, "gateway": gateway}
+        result = await db.execute(outbox.ACK_BOARD_SQL, params)
+        if result.rowcount:
+            await db.execute(outbox.ACK_OUTBOX_SQL, params)
+            acked.append(item.board_id)
+        else:
+            await db.execute(outbox.RELEASE_LEASE_SQL, params)
+            stale.append(item.board_id)
+    await db.commit()
+    metrics.record_confirms("ack", len(acked))
+    for board_id in acked:
+        invalidate_board(board_id)
+    return {"ok": True, "acked": acked, "stale": stale}
+
+
+@router.post("/outbox/release")
+async def release_outbox(
+        data: OutboxAckRequest,
+        retry_after: float = Query(0, ge=0, le=MAX_RETRY_AFTER),
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    # Шлюз отказывается от ценников без подтверждения: запись остаётся в очереди
+    # и через retry_after секунд её сможет забрать любой шлюз. Чужую аренду
+    # и аренду на другую версию не трогаем
+    params = {"gateway": gateway, "retry_at": time.time() + retry_after}
+    released = []
+    for item in data.items:
+        result = await db.execute(outbox.RELEASE_LATER_SQL, {
+            **params, "board_id": item.board_id, "sync_version": item.sync_version,
+        })
+        if result.rowcount:
+            released.append(item.board_id)
+    await db.commit()
+    return {"ok": True, "released": released}
+
+
+@router.post("/confirm_boards", dependencies=[Depends(check_gateway_token)])
+async def confirm_boards(data: ConfirmBoardsRequest, db: AsyncSession = Depends(get_async_db)):
+    board_ids = list(dict.fromkeys(data.board_ids))
+    if not board_ids:
+        return {"ok": True, "board_ids": [], "not_found": []}
+
+    # Одна транзакция на всю пачку, IN-списки режем под лимит параметров SQLite
+    found = []
+    for start in range(0, len(board_ids), MAX_BATCH_SIZE):
+        chunk = board_ids[start:start + MAX_BATCH_SIZE]
+        found += (await db.scalars(
+            select(BoardORM.id).where(BoardORM.id.in_(chunk))
+        )).all()
+        await db.execute(stamp_sync_versions(chunk, synced=True))
+        await db.execute(delete(SyncOutboxORM).where(SyncOutboxORM.board_id.in_(chunk)))
+    await db.commit()
+    metrics.record_confirms("confirm", len(found))
+    for board_id in found:
+        invalidate_board(board_id)
+
+    found_set = set(found)
+    return {
+        "ok": True,
+        "board_ids": [board_id for board_id in board_ids if board_id in found_set],
+        "not_found": [board_id for board_id in board_ids if board_id not in found_set],
+    }
+
+
+@router.post("/confirm_board", dependencies=[Depends(check_gateway_token)])
+async def confirm_board(data: ConfirmBoardRequest, db: AsyncSession = Depends(get_async_db)):
+    result = await confirm_boards(ConfirmBoardsRequest(board_ids=[data.board_id]), db=db)
+    if not result["board_ids"]:
         raise HTTPException(status_code=404, detail="Board not found")
 
-    board.synced = True
-    db.commit()
+    return {"ok": True, "board_id": data.board_id}
+
+
+@router.post("/telemetry")
+async def ingest_telemetry(
+        data: TelemetryBatch,
+        gateway: str = Depends(check_gateway_token),
+        db: AsyncSession = Depends(get_async_db)):
+    if len(data.snapshots) + len(data.latencies) > MAX_TELEMETRY_BATCH:
+        raise HTTPException(status_code=413, detail="Telemetry batch is too large")
+
+    recorded = await telemetry.record(
+        db, gateway,
+        [snapshot.model_dump() for snapshot in data.snapshots],
+        [(item.node, item.latency_ms) for item in data.latencies],
+    )
+    # Агрегаты и чистка — в фоновой задаче telemetry.run_maintainer
+    await db.commit()
+    return {"ok": True, "recorded": recorded}
+
+
+@router.post("/presence")
+async def ingest_presence(data: HeartbeatBatch, gateway: str = Depends(check_gateway_token)):
+    if len(data.heartbeats) > MAX_PRESENCE_BATCH:
+        raise HTTPException(status_code=413, detail="Presence batch is too large")
 
-    return {"ok": True, "board_id": board.id}
+    # Только в буфер: в базу уходит фоновым сбросом, одной транзакцией на всех
+    now = time.time()
+    for item in data.heartbeats:
+        seen_at = min(item.seen_at, now) if item.seen_at else now
+        presence.add(gateway, item.node_id, seen_at, item.hops, item.rssi)
+    return {"ok": True, "buffered": len(presence)}
@@ -0,0 +1,33 @@
+import time
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import config, metrics
+from database.db import get_async_db
+from database.models import SyncOutboxORM
+from routers.board_host import check_gateway_token
+
+router = APIRouter()
+
+
+async def check_metrics_token(authorization: str = Header(...)):
+    if not config.METRICS_TOKEN:
+        return await check_gateway_token(authorization)
+    scheme, _, token = authorization.partition(" ")
+    if scheme != "Bearer" or token != config.METRICS_TOKEN:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+# Проверка до сессии: без токена выдача не трогает базу
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(check_metrics_token)])
+async def get_metrics(db: AsyncSession = Depends(get_async_db)):
+    # Единственный запрос к базе — на выдачу, а не на каждый запрос к API
+    unsynced, oldest = (await db.execute(
+        select(func.count(), func.min(SyncOutboxORM.created_at))
+    )).one()
+    metrics.sync_queue["unsynced"] = unsynced
+    metrics.sync_queue["oldest_age"] = round(time.time() - oldest, 3) if oldest else 0.0
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
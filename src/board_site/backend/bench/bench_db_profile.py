@@ -0,0 +1,128 @@
+"""
+Сравнение профилей SQLite-движка (database/db.py) на смешанной нагрузке.
+
+Каждый профиль запускается в отдельном процессе на свежей временной базе;
+запросы идут через FastAPI-приложение в процессе, конкурентно, так что
+sync-обработчики реально делят threadpool и соединения пула.
+
+    python bench/bench_db_profile.py --boards 20000 --concurrency 32 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import common
+
+MIX = (
+    ("unsync_boards", 40),
+    ("boards_delta", 30),
+    ("update_board", 20),
+    ("confirm_boards", 10),
+)
+
+
+async def client_loop(app, stats, board_ids, deadline, rnd):
+    admin_headers = common.admin_headers()
+    names = [name for name, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    version = len(board_ids)
+    while time.perf_counter() < deadline:
+        name = rnd.choices(names, weights)[0]
+        if name == "unsync_boards":
+            await common.timed_call(stats, name, app, "GET", "/board_host/unsync_boards?limit=50",
+                                    headers=common.GATEWAY_HEADERS)
+        elif name == "boards_delta":
+            # Дельта за последние ~200 изменений, как у открытой вкладки админки
+            response = await common.timed_call(stats, name, app, "GET",
+                                               f"/api/boards?since={max(0, version - 200)}",
+                                               headers=admin_headers)
+            version = int(response.headers.get("x-sync-version", version))
+        elif name == "update_board":
+            board_id = rnd.choice(board_ids)
+            board = {
+                "id": board_id,
+                "product": f"Товар {board_id}",
+                "base_price": rnd.randint(50, 5000),
+                "discount": rnd.randint(0, 60),
+                "installed_at": "2026-01-01",
+            }
+            await common.timed_call(stats, name, app, "POST", "/api/update_board",
+                                    headers=admin_headers, json_body=board)
+        else:
+            await common.timed_call(stats, name, app, "POST", "/board_host/confirm_boards",
+                                    headers=common.GATEWAY_HEADERS,
+                                    json_body={"board_ids": rnd.sample(board_ids, 20)})
+
+
+async def run_mix(app, board_ids, concurrency, duration, seed):
+    stats = common.LatencyStats()
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client_loop(app, stats, board_ids, deadline, random.Random(seed + i))
+        for i in range(concurrency)
+    ))
+    return stats.summary(time.perf_counter() - start), time.perf_counter() - start
+
+
+def run_profile(args):
+    with tempfile.TemporaryDirectory() as data_dir:
+        app = common.load_app(data_dir, profile=args.profile)
+        board_ids = common.seed_boards(args.boards)
+        endpoints, elapsed = asyncio.run(
+            run_mix(app, board_ids, args.concurrency, args.duration, args.seed)
+        )
+
+    total = sum(item["requests"] for item in endpoints.values())
+    print(json.dumps({
+        "profile": args.profile,
+        "total_rps": round(total / elapsed, 1),
+        "max_p99_ms": max(item["p99_ms"] for item in endpoints.values()),
+        "errors": sum(item["errors"] for item in endpoints.values()),
+        "endpoints": endpoints,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", default="default,tuned")
+    parser.add_argument("--profile", help=argparse.SUPPRESS)
+    parser.add_argument("--boards", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+
+    results = []
+    for profile in args.profiles.split(","):
+        cmd = [
+            sys.executable, __file__, "--profile", profile,
+            "--boards", str(args.boards),
+            "--concurrency", str(args.concurrency),
+            "--duration", str(args.duration),
+            "--seed", str(args.seed),
+        ]
+        output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'profile':<10} {'rps':>10} {'max p99 ms':>12} {'errors':>8}")
+    for result in results:
+        print(f"{result['profile']:<10} {result['total_rps']:>10} "
+              f"{result['max_p99_ms']:>12} {result['errors']:>8}")
+        for name, item in result["endpoints"].items():
+            print(f"  {name:<16} {item['rps']:>8} rps  p50 {item['p50_ms']:>8} ms  "
+                  f"p99 {item['p99_ms']:>8} ms  err {item['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Нагрузочный бенчмарк backend в процессе, без сети.
+
+Наполняет временную базу (или --data-dir; непустую — только с --reset)
+заданным числом ценников, гоняет через ASGI-приложение сценарии нагрузки
+и пишет отчёт в JSON:
+пропускная способность и p50/p95/p99 по каждой ручке.
+
+    python bench/bench_load.py --boards 100000 --out report.json
+    python bench/bench_load.py --boards 100000 --compare report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import common
+
+ADMIN_LOGIN = "bench"
+ADMIN_PASSWORD = "bench-password"
+
+# Веса операций в каждом сценарии
+SCENARIOS = {
+    # Открытые вкладки админки: ревалидация, листание, поиск, правки
+    "admin": {
+        "boards_revalidate": 40,
+        "boards_page": 25,
+        "boards_search": 15,
+        "update_board": 19,
+        "login": 1,
+    },
+    # Шлюз выгребает очередь по одному ценнику
+    "gateway": {
+        "unsync_board": 50,
+        "confirm_board": 50,
+    },
+    # Магазин целиком: шлюз и админы одновременно
+    "mixed": {
+        "unsync_board": 30,
+        "confirm_board": 25,
+        "boards_revalidate": 20,
+        "boards_page": 10,
+        "update_board": 10,
+        "boards_search": 4,
+        "login": 1,
+    },
+}
+
+
+class Client:
+    def __init__(self, app, board_ids, rnd):
+        self.app = app
+        self.board_ids = board_ids
+        self.rnd = rnd
+        self.admin_headers = common.admin_headers(ADMIN_LOGIN)
+        self.etag = None
+        self.pending = []
+
+    async def boards_revalidate(self, stats):
+        headers = dict(self.admin_headers)
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        response = await common.timed_call(stats, "GET /api/boards (revalidate)", self.app, "GET",
+                                           "/api/boards?limit=100", ok_statuses=(200, 304),
+                                           headers=headers)
+        self.etag = response.headers.get("etag", self.etag)
+
+    async def boards_page(self, stats):
+        sort = self.rnd.choice(["id", "product", "price", "synced"])
+        await common.timed_call(stats, "GET /api/boards (page)", self.app, "GET",
+                                f"/api/boards?limit=100&sort={sort}", headers=self.admin_headers)
+
+    async def boards_search(self, stats):
+        needle = str(self.rnd.randint(100, 999))
+        await common.timed_call(stats, "GET /api/boards (search)", self.app, "GET",
+                                f"/api/boards?limit=100&q={needle}", headers=self.admin_headers)
+
+    async def update_board(self, stats):
+        board_id = self.rnd.choice(self.board_ids)
+        board = {
+            "id": board_id,
+            "product": f"Товар {board_id}",
+            "base_price": self.rnd.randint(50, 5000),
+            "discount": self.rnd.randint(0, 60),
+            "installed_at": "2026-01-01",
+        }
+        await common.timed_call(stats, "POST /api/update_board", self.app, "POST",
+                                "/api/update_board", headers=self.admin_headers, json_body=board)
+
+    async def login(self, stats):
+        await common.timed_call(stats, "POST /api/login", self.app, "POST", "/api/login",
+                                json_body={"login": ADMIN_LOGIN, "password": ADMIN_PASSWORD})
+
+    async def unsync_board(self, stats):
+        response = await common.timed_call(stats, "GET /board_host/unsync_board", self.app, "GET",
+                                           "/board_host/unsync_board",
+                                           headers=common.GATEWAY_HEADERS)
+        board = response.json() if response.status == 200 else None
+        if board:
+            self.pending.append(board["board_id"])
+
+    async def confirm_board(self, stats):
+        board_id = self.pending.pop() if self.pending else self.rnd.choice(self.board_ids)
+        await common.timed_call(stats, "POST /board_host/confirm_board", self.app, "POST",
+                                "/board_host/confirm_board", headers=common.GATEWAY_HEADERS,
+                                json_body={"board_id": board_id})
+
+
+async def client_loop(client, mix, stats, deadline):
+    names = list(mix)
+    weights = list(mix.values())
+    while time.perf_counter() < deadline:
+        name = client.rnd.choices(names, weights)[0]
+        await getattr(client, name)(stats)
+
+
+async def run_scenario(app, board_ids, mix, concurrency, duration, seed):
+    stats = common.LatencyStats()
+    clients = [Client(app, board_ids, random.Random(seed + i)) for i in range(concurrency)]
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client_loop(client, mix, stats, deadline) for client in clients))
+    elapsed = time.perf_counter() - start
+
+    endpoints = stats.summary(elapsed)
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "total_rps": round(sum(item["requests"] for item in endpoints.values()) / elapsed, 1),
+        "endpoints": endpoints,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=common.APP_DIR).stdout.strip() or None
+    except OSError:
+        return None
+
+
+async def run_scenarios(app, board_ids, args):
+    # Один event loop на все сценарии: соединения aiosqlite в пуле привязаны к нему
+    return {
+        name: await run_scenario(app, board_ids, SCENARIOS[name],
+                                 args.concurrency, args.duration, args.seed)
+        for name in args.scenarios.split(",")
+    }
+
+
+def run(args, data_dir):
+    app = common.load_app(
+        data_dir, profile=args.profile,
+        ADMIN_USER=ADMIN_LOGIN, ADMIN_PASSWORD=ADMIN_PASSWORD,
+    )
+    seed_start = time.perf_counter()
+    board_ids = common.seed_boards(args.boards, reset=args.reset)
+    seed_s = time.perf_counter() - seed_start
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "db_profile": args.profile,
+            "boards": args.boards,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "seed_s": round(seed_s, 2),
+        },
+        "scenarios": asyncio.run(run_scenarios(app, board_ids, args)),
+    }
+    return report
+
+
+def print_report(report, baseline=None):
+    meta = report["meta"]
+    print(f"boards={meta['boards']} concurrency={meta['concurrency']} "
+          f"profile={meta['db_profile']} git={meta['git']}")
+    for name, scenario in report["scenarios"].items():
+        base_scenario = (baseline or {}).get("scenarios", {}).get(name, {})
+        print(f"\n[{name}] {scenario['total_rps']} rps"
+              + delta(scenario["total_rps"], base_scenario.get("total_rps")))
+        print(f"  {'endpoint':<34} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'err':>5}")
+        for endpoint, item in scenario["endpoints"].items():
+            base = base_scenario.get("endpoints", {}).get(endpoint, {})
+            print(f"  {endpoint:<34} {item['rps']:>8} {item['p50_ms']:>9} {item['p95_ms']:>9} "
+                  f"{item['p99_ms']:>9} {item['errors']:>5}"
+                  + delta(item["p99_ms"], base.get("p99_ms"), label="p99"))
+
+
+def delta(value, base, label="rps"):
+    if not base:
+        return ""
+    return f"  ({label} {(value - base) / base * 100:+.1f}% vs baseline)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boards", type=int, default=10000, help="1k–500k ценников")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="секунд на сценарий")
+    parser.add_argument("--profile", default="tuned", help="DB_PROFILE движка")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--data-dir", help="каталог базы; по умолчанию временный")
+    parser.add_argument("--reset", action="store_true",
+                        help="стереть ценники и очередь в непустой --data-dir перед наполнением")
+    parser.add_argument("--out", help="куда сохранить JSON-отчёт")
+    parser.add_argument("--compare", help="JSON-отчёт прошлого прогона для сравнения")
+    args = parser.parse_args()
+
+    for name in args.scenarios.split(","):
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario: {name}")
+    # load_app меняет рабочий каталог, поэтому пути фиксируем заранее
+    for name in ("data_dir", "out", "compare"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    if args.data_dir:
+        report = run(args, args.data_dir)
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            report = run(args, data_dir)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
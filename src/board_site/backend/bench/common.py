@@ -0,0 +1,198 @@
+"""
+Общие части бенчмарков: запуск приложения на временной базе,
+наполнение таблиц и вызов ASGI-приложения в процессе, без сети.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+GATEWAY_TOKEN = "bench-gateway-token"
+GATEWAY_HEADERS = {"Authorization": f"Bearer {GATEWAY_TOKEN}"}
+
+
+def load_app(data_dir, profile=None, **env):
+    """
+    Импортирует main.py на базе в data_dir и выполняет его startup.
+    Настройки читаются при импорте, поэтому один профиль — один процесс.
+    """
+    os.environ["DATA_DIR"] = str(data_dir)
+    os.environ["GATEWAY_TOKEN"] = GATEWAY_TOKEN
+    if profile is not None:
+        os.environ["DB_PROFILE"] = profile
+    for key, value in env.items():
+        os.environ[key] = str(value)
+
+    sys.path.insert(0, str(APP_DIR))
+    os.chdir(APP_DIR)
+    import main
+    main.startup()
+    return main.app
+
+
+def admin_headers(login="bench"):
+    """Сессия админки в обход /api/login, чтобы bcrypt не попадал в замеры"""
+    from core.sessions import sessions
+    return {"Authorization": f"Bearer {sessions.issue(login)}"}
+
+
+def seed_boards(count, unsynced_every=10, reset=False):
+    """
+    Заполняет boards: каждый unsynced_every-й ценник ждёт синхронизации.
+    Непустую базу перезаписывает только с reset=True, чтобы бенчмарк,
+    направленный на рабочий каталог, не стёр настоящие ценники
+    """
+    from database import outbox
+    from database.db import engine
+
+    rows = [
+        (
+            f"pricer_{i:06d}",
+            f"Товар {i}",
+            float(100 + i % 900),
+            float(i % 50),
+            "2026-01-01",
+            0 if i % unsynced_every == 0 else 1,
+            i + 1,
+        )
+        for i in range(count)
+    ]
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        existing = cursor.execute("SELECT COUNT(*) FROM boards").fetchone()[0]
+        if existing and not reset:
+            raise SystemExit(f"database already has {existing} boards; pass --reset to overwrite it")
+        cursor.execute("DELETE FROM boards")
+        cursor.executemany(
+            "INSERT INTO boards (id, product, base_price, discount, installed_at, synced, sync_version) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        # Очередь шлюзов — как после миграции старой базы
+        cursor.execute("DELETE FROM sync_outbox")
+        cursor.execute(
+            "INSERT INTO sync_outbox (board_id, sync_version, priority, created_at, updated_at, superseded) "
+            "SELECT id, sync_version, ?, ?, ?, 0 FROM boards WHERE synced = 0",
+            (outbox.PRIORITY_BULK, time.time(), time.time()),
+        )
+        raw.commit()
+    finally:
+        raw.close()
+    return [row[0] for row in rows]
+
+
+class Response:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+
+async def call(app, method, url, headers=None, json_body=None, body=b""):
+    """Один HTTP-запрос к ASGI-приложению"""
+    parts = urlsplit(url)
+    raw_headers = [(b"host", b"bench")]
+    if json_body is not None:
+        body = json.dumps(json_body).encode()
+        raw_headers.append((b"content-type", b"application/json"))
+    raw_headers.append((b"content-length", str(len(body)).encode()))
+    for key, value in (headers or {}).items():
+        raw_headers.append((key.lower().encode(), value.encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    done = asyncio.Event()
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    status = None
+    response_headers = {}
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(
+                (key.decode().lower(), value.decode())
+                for key, value in message.get("headers", [])
+            )
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                done.set()
+
+    await app(scope, receive, send)
+    done.set()
+    return Response(status, response_headers, b"".join(chunks))
+
+
+class LatencyStats:
+    """Задержки по именованным операциям"""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+
+    def add(self, name, seconds, ok=True):
+        self.samples.setdefault(name, []).append(seconds)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    @staticmethod
+    def percentile(sorted_values, q):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def summary(self, elapsed):
+        result = {}
+        for name, values in sorted(self.samples.items()):
+            values = sorted(values)
+            result[name] = {
+                "requests": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+                "p50_ms": round(self.percentile(values, 0.50) * 1000, 3),
+                "p95_ms": round(self.percentile(values, 0.95) * 1000, 3),
+                "p99_ms": round(self.percentile(values, 0.99) * 1000, 3),
+            }
+        return result
+
+
+async def timed_call(stats, name, app, method, url, ok_statuses=(200,), **kwargs):
+    start = time.perf_counter()
+    response = await call(app, method, url, **kwargs)
+    stats.add(name, time.perf_counter() - start, response.status in ok_statuses)
+    return response
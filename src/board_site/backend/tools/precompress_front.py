@@ -0,0 +1,90 @@
+"""
+Сжимает собранный фронтенд для core/static.py: рядом с каждым текстовым
+файлом кладёт .gz (и .br, если установлен пакет brotli).
+
+Запускать после сборки и копирования бандла в app/front:
+
+    cd src/board_site/frontend && npm run build
+    python ../backend/tools/precompress_front.py dist
+    python ../backend/tools/precompress_front.py          # app/front по умолчанию
+"""
+
+import argparse
+import gzip
+import os
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FRONT_DIR = Path(__file__).resolve().parent.parent / "app" / "front"
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".txt", ".map", ".ico", ".webmanifest"}
+SUFFIXES = (".gz", ".br")
+# Копия, выигрывающая меньше 5%, не стоит лишнего файла
+MIN_SAVING = 0.05
+
+
+def compress_gzip(data: bytes) -> bytes:
+    # mtime=0 — одинаковый бандл даёт одинаковый .gz
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+def write_variant(path: Path, suffix: str, data: bytes, compressed: bytes) -> bool:
+    variant = path.with_name(path.name + suffix)
+    if len(compressed) > len(data) * (1 - MIN_SAVING):
+        variant.unlink(missing_ok=True)
+        return False
+    variant.write_bytes(compressed)
+    # Та же mtime, что у оригинала: Last-Modified не скачет между копиями
+    stat = path.stat()
+    os.utime(variant, (stat.st_atime, stat.st_mtime))
+    return True
+
+
+def precompress(root: Path):
+    compressors = [(".gz", compress_gzip)]
+    if brotli is not None:
+        compressors.append((".br", compress_brotli))
+    else:
+        print("brotli is not installed, writing only .gz")
+
+    total = written = 0
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix in SUFFIXES:
+            # Копия от удалённого или пересобранного файла
+            if not path.with_suffix("").exists():
+                path.unlink()
+            continue
+        if path.suffix not in COMPRESSIBLE:
+            continue
+
+        data = path.read_bytes()
+        sizes = []
+        for suffix, compress in compressors:
+            compressed = compress(data)
+            if write_variant(path, suffix, data, compressed):
+                sizes.append(f"{suffix} {len(compressed)}")
+                total += len(compressed)
+                written += 1
+        print(f"{path.relative_to(root)}: {len(data)} -> {', '.join(sizes) or 'kept as is'}")
+    print(f"{written} compressed files, {total} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", nargs="?", default=str(FRONT_DIR), help="каталог собранного фронтенда")
+    args = parser.parse_args()
+    precompress(Path(args.root))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 import { useState } from "react"
 import Login from "./pages/Login"
 import Home from "./pages/Home"
+import { getToken } from "./api/client"
 
 export default function App() {
-    const [auth, setAuth] = useState(false)
+    const [auth, setAuth] = useState(() => getToken() !== null)
 
     if (!auth) {
         return <Login onSuccess={() => setAuth(true)} />
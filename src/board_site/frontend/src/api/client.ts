@@ -0,0 +1,24 @@
+const TOKEN_KEY = "session_token"
+
+export function getToken(): string | null {
+    return sessionStorage.getItem(TOKEN_KEY)
+}
+
+export function setToken(token: string | null) {
+    if (token) sessionStorage.setItem(TOKEN_KEY, token)
+    else sessionStorage.removeItem(TOKEN_KEY)
+}
+
+export async function apiFetch(url: string, init: RequestInit = {}) {
+    const headers = new Headers(init.headers)
+    const token = getToken()
+    if (token) headers.set("Authorization", `Bearer ${token}`)
+
+    const res = await fetch(url, { ...init, headers })
+    if (res.status === 401) {
+        // Сессия истекла или сервер перезапущен — возвращаемся на логин
+        setToken(null)
+        window.location.reload()
+    }
+    return res
+}
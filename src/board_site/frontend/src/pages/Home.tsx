@@ -1,4 +1,5 @@
 import { useEffect, useState } from "react"
+import { apiFetch } from "../api/client"
 
 type Board = {
     id: number
@@ -30,7 +31,7 @@ export default function Home() {
     }
 
     const fetchBoards = async () => {
-        const res = await fetch("/api/boards")
+        const res = await apiFetch("/api/boards")
         const data: Board[] = await res.json()
         setBoards(data)
         setOriginalBoards(data)
@@ -81,7 +82,7 @@ export default function Home() {
         }
 
         try {
-            const res = await fetch("/api/update_board", {
+            const res = await apiFetch("/api/update_board", {
                 method: "POST",
                 headers: { "Content-Type": "application/json" },
                 body: JSON.stringify(board),
@@ -1,4 +1,5 @@
 import { useState } from "react"
+import { setToken } from "../api/client"
 
 export default function Login({ onSuccess }: { onSuccess: () => void }) {
     const [login, setLogin] = useState("")
@@ -13,7 +14,11 @@ export default function Login({ onSuccess }: { onSuccess: () => void }) {
             body: JSON.stringify({ login, password })
         })
 
-        if (res.ok) onSuccess()
+        if (res.ok) {
+            const data = await res.json()
+            setToken(data.token)
+            onSuccess()
+        }
         else setError(true)
     }
 